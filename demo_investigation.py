@@ -6,10 +6,22 @@ This shows the dynamic tool selection and limit enforcement in real action.
 
 import asyncio
 import os
+from dataclasses import dataclass
+from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
+from anthropic.types import TextBlock, ToolUseBlock
+
 from src.seam_agent.assistant.simple_investigator import SimpleInvestigator
 from src.seam_agent.assistant.investigation_config import InvestigationConfig
+from src.seam_agent.assistant.query_parser import ParsedQuery
+
+
+@dataclass(slots=True)
+class FakeResponse:
+    """Stand-in for an Anthropic Message; the investigator only reads content."""
+
+    content: list[Any]
 
 
 async def demo_investigation_with_mocks():
@@ -27,7 +39,7 @@ async def demo_investigation_with_mocks():
         #     "src.seam_agent.assistant.simple_investigator.SeamAPIClient"
         # ) as mock_seam_class,
         patch(
-            "src.seam_agent.assistant.simple_investigator.AsyncAnthropic"
+            "src.seam_agent.assistant.simple_investigator.get_anthropic_client"
         ) as mock_anthropic_class,
         patch(
             "src.seam_agent.assistant.simple_investigator.SupportQueryParser"
@@ -52,9 +64,13 @@ async def demo_investigation_with_mocks():
             {"name": "get_admin_links", "description": "Get admin links"},
         ]
 
-        # Create investigator with test config
+        # Create investigator with test config. Early exit is disabled so the
+        # demo still shows the audit-log follow-up round for this ticket.
         config = InvestigationConfig(
-            MAX_TOOL_ROUNDS=3, MAX_TOOLS_PER_ROUND=2, MAX_TOTAL_TOOLS=5
+            MAX_TOOL_ROUNDS=3,
+            MAX_TOOLS_PER_ROUND=2,
+            MAX_TOTAL_TOOLS=5,
+            EARLY_EXIT_CONFIDENCE_THRESHOLD=1.1,
         )
 
         investigator = SimpleInvestigator(
@@ -86,20 +102,16 @@ async def demo_investigation_with_mocks():
         print(test_query.strip())
         print()
 
-        # Mock parsed query (what our query parser would extract)
-        mock_parsed_query = Mock()
-        mock_parsed_query.question_type = "access_code"
-        mock_parsed_query.device_ids = ["14923119-8686-4010-870f-0621cdef220a"]
-        mock_parsed_query.access_codes = ["aeae87ee-5f52-498f-8208-e2daf28bcfa0"]
-        mock_parsed_query.confidence = 0.95
-        mock_parsed_query.__dict__ = {
-            "question_type": "access_code",
-            "device_ids": ["14923119-8686-4010-870f-0621cdef220a"],
-            "access_codes": ["aeae87ee-5f52-498f-8208-e2daf28bcfa0"],
-            "confidence": 0.95,
-        }
-
-        mock_parser.parse.return_value = mock_parsed_query
+        # Parsed query (what our query parser would extract)
+        mock_parsed_query = ParsedQuery(
+            question_type="access_code",
+            device_ids=["14923119-8686-4010-870f-0621cdef220a"],
+            access_codes=["aeae87ee-5f52-498f-8208-e2daf28bcfa0"],
+            confidence=0.95,
+            summary="Unmanaged access code that may have been created by the customer",
+        )
+
+        mock_parser.parse = AsyncMock(return_value=mock_parsed_query)
 
         print("🧠 QUERY ANALYSIS:")
         print("-" * 40)
@@ -127,28 +139,28 @@ async def demo_investigation_with_mocks():
 
         # Round 1: Initial tool call
         print("Round 1: Initial Investigation")
-        mock_tool_response = Mock()
-        mock_tool_response.content = [
-            Mock(
-                type="tool_use",
-                id="tool_1",
-                name="get_device_info",
-                input={"device_id": "14923119-8686-4010-870f-0621cdef220a"},
-            ),
-            Mock(
-                type="tool_use",
-                id="tool_2",
-                name="get_access_codes",
-                input={
-                    "device_id": "14923119-8686-4010-870f-0621cdef220a",
-                    "workspace_id": "test",
-                },
-            ),
-        ]
+        mock_tool_response = FakeResponse(
+            content=[
+                ToolUseBlock(
+                    type="tool_use",
+                    id="tool_1",
+                    name="get_device_info",
+                    input={"device_id": "14923119-8686-4010-870f-0621cdef220a"},
+                ),
+                ToolUseBlock(
+                    type="tool_use",
+                    id="tool_2",
+                    name="get_access_codes",
+                    input={
+                        "device_id": "14923119-8686-4010-870f-0621cdef220a",
+                        "workspace_id": "test",
+                    },
+                ),
+            ]
+        )
 
-        # Mock tool execution results
-        investigator.tool_orchestrator.execute_tool = AsyncMock()
-        investigator.tool_orchestrator.execute_tool.side_effect = [
+        # Tool execution results, in the order the tools are called
+        tool_results = [
             # Device info result
             {
                 "device_type": "nuki_lock",
@@ -171,25 +183,25 @@ async def demo_investigation_with_mocks():
             },
         ]
 
-        investigator.tool_orchestrator.summarize_tool_result = Mock()
-        investigator.tool_orchestrator.summarize_tool_result.side_effect = [
+        tool_summaries = [
             "Device Info: nuki_lock in workspace customer-workspace (online)",
             "Access Codes (2 total): Brian Kem5f2: 7995, Main Code: 1234 - 1 unmanaged code found",
         ]
 
         # Round 2: Follow-up based on findings
-        mock_followup_response = Mock()
-        mock_followup_response.content = [
-            Mock(
-                type="tool_use",
-                id="tool_3",
-                name="get_audit_logs",
-                input={"device_id": "14923119-8686-4010-870f-0621cdef220a"},
-            )
-        ]
+        mock_followup_response = FakeResponse(
+            content=[
+                ToolUseBlock(
+                    type="tool_use",
+                    id="tool_3",
+                    name="get_audit_logs",
+                    input={"device_id": "14923119-8686-4010-870f-0621cdef220a"},
+                )
+            ]
+        )
 
-        # Mock audit logs result
-        investigator.tool_orchestrator.execute_tool.side_effect.append(
+        # Audit logs result
+        tool_results.append(
             {
                 "audit_logs": [
                     {
@@ -210,16 +222,23 @@ async def demo_investigation_with_mocks():
             }
         )
 
-        investigator.tool_orchestrator.summarize_tool_result.side_effect.append(
+        tool_summaries.append(
             "Audit Logs: 2 entries found (access code changes, creations, deletions)"
         )
 
+        investigator.tool_orchestrator.execute_tool = AsyncMock(
+            side_effect=tool_results
+        )
+        investigator.tool_orchestrator.summarize_tool_result = Mock(
+            side_effect=tool_summaries
+        )
+
         # Final analysis
-        mock_final_response = Mock()
-        mock_final_response.content = [
-            Mock(
-                type="text",
-                text="""Based on my investigation, I found clear evidence that explains this unmanaged code issue:
+        mock_final_response = FakeResponse(
+            content=[
+                TextBlock(
+                    type="text",
+                    text="""Based on my investigation, I found clear evidence that explains this unmanaged code issue:
 
 **Device Analysis:**
 - Device: Nuki Pòsit 1 (Cabin Basement) - Status: Online
@@ -242,14 +261,17 @@ This confirms Jake's suspicion! The code WAS created successfully by your system
 1. This appears to be a race condition in the Nuki integration
 2. The code is valid and functional - it just needs to be re-marked as managed
 3. Consider implementing a delay or retry mechanism for Nuki API status checks""",
-            )
-        ]
+                )
+            ]
+        )
 
         # Set up the Anthropic call sequence
         mock_anthropic.messages.create.side_effect = [
             mock_tool_response,  # Initial call with tools
             mock_followup_response,  # Follow-up with more tools
+            mock_final_response,  # Response after the follow-up tools
             mock_final_response,  # Final analysis
+            mock_final_response,  # Investigation note formatting
         ]
 
         print("📊 Running investigation...")
@@ -0,0 +1,62 @@
+"""
+Shared OpenAI and Anthropic SDK clients.
+"""
+
+import asyncio
+
+import httpx
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient as AnthropicHttpxClient
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient as OpenAIHttpxClient
+
+from seam_agent.connectors.http import forget_closed_loops, running_loop
+
+# Each SDK client owns an httpx pool; sharing one client per API key lets
+# parsers and model clients created per investigation reuse warm connections.
+# Those connections belong to the loop that opened them, so clients are also
+# keyed by the running loop and never shared across asyncio.run() calls.
+_POOL_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=50)
+
+_ClientKey = tuple[asyncio.AbstractEventLoop, str | None]
+_openai_clients: dict[_ClientKey, AsyncOpenAI] = {}
+_anthropic_clients: dict[_ClientKey, AsyncAnthropic] = {}
+
+
+def get_openai_client(api_key: str | None = None) -> AsyncOpenAI:
+    """Return the shared OpenAI client for api_key, creating it on first use."""
+    loop = running_loop()
+    client = _openai_clients.get((loop, api_key)) if loop else None
+    if client is None or client.is_closed():
+        client = AsyncOpenAI(
+            api_key=api_key, http_client=OpenAIHttpxClient(limits=_POOL_LIMITS)
+        )
+        # Outside a loop there is nothing to tie the client to, so don't share it
+        if loop is not None:
+            forget_closed_loops(_openai_clients)
+            _openai_clients[(loop, api_key)] = client
+    return client
+
+
+def get_anthropic_client(api_key: str | None = None) -> AsyncAnthropic:
+    """Return the shared Anthropic client for api_key, creating it on first use."""
+    loop = running_loop()
+    client = _anthropic_clients.get((loop, api_key)) if loop else None
+    if client is None or client.is_closed():
+        client = AsyncAnthropic(
+            api_key=api_key, http_client=AnthropicHttpxClient(limits=_POOL_LIMITS)
+        )
+        # Outside a loop there is nothing to tie the client to, so don't share it
+        if loop is not None:
+            forget_closed_loops(_anthropic_clients)
+            _anthropic_clients[(loop, api_key)] = client
+    return client
+
+
+async def aclose_api_clients() -> None:
+    """Close the running loop's shared SDK clients, e.g. on shutdown."""
+    loop = asyncio.get_running_loop()
+    clients: list[AsyncOpenAI | AsyncAnthropic] = []
+    for cache in (_openai_clients, _anthropic_clients):
+        for key in [key for key in cache if key[0] is loop]:
+            clients.append(cache.pop(key))
+    for client in clients:
+        await client.close()
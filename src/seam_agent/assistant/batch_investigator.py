@@ -0,0 +1,117 @@
+"""
+Batch investigator for non-interactive investigation runs.
+
+Submits the initial investigation round of many queries through Anthropic's
+Message Batches API, which is billed at a discount, and finishes each
+investigation with its own SimpleInvestigator once the batch has ended.
+Intended for backfills and replays of queued tickets where latency does not matter.
+"""
+
+import asyncio
+import os
+from typing import Any
+from anthropic import AsyncAnthropic
+from anthropic.types import Message
+
+from seam_agent.assistant.api_clients import get_anthropic_client
+from seam_agent.assistant.simple_investigator import SimpleInvestigator
+from seam_agent.assistant.investigation_config import InvestigationConfig
+
+
+class BatchInvestigator:
+    """Runs investigations with their initial round submitted as one message batch."""
+
+    anthropic: AsyncAnthropic
+    config: InvestigationConfig | None
+    poll_interval: float
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        debug_mode: bool = False,
+        log_format: str = "silent",
+        config: InvestigationConfig | None = None,
+        poll_interval: float = 20.0,
+    ):
+        self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+        self.anthropic = get_anthropic_client(self.api_key)
+        self.debug_mode = debug_mode
+        self.log_format = log_format
+        self.config = config
+        self.poll_interval = poll_interval
+
+    async def investigate_many(
+        self, customer_queries: list[str]
+    ) -> list[dict[str, Any]]:
+        """
+        Investigate several customer support queries as one batch.
+
+        Args:
+            customer_queries: Natural language customer support queries
+
+        Returns:
+            Investigation results in the same order as the queries
+        """
+        if not customer_queries:
+            return []
+
+        # Each query gets its own investigator so tool selection state and
+        # investigation limits are tracked independently per ticket
+        investigators = [self._create_investigator() for _ in customer_queries]
+        parsed_queries = await asyncio.gather(
+            *(
+                investigator.query_parser.parse(query)
+                for investigator, query in zip(investigators, customer_queries)
+            )
+        )
+        custom_ids = [f"query-{index}" for index in range(len(customer_queries))]
+
+        batch = await self.anthropic.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": custom_id,
+                    "params": investigator.build_initial_request(query, parsed_query),
+                }
+                for custom_id, investigator, query, parsed_query in zip(
+                    custom_ids, investigators, customer_queries, parsed_queries
+                )
+            ]
+        )
+        initial_responses = await self._collect_batch_results(batch.id)
+
+        return list(
+            await asyncio.gather(
+                *(
+                    investigator.continue_from_batch_result(
+                        query, parsed_query, initial_responses.get(custom_id)
+                    )
+                    for custom_id, investigator, query, parsed_query in zip(
+                        custom_ids, investigators, customer_queries, parsed_queries
+                    )
+                )
+            )
+        )
+
+    def _create_investigator(self) -> SimpleInvestigator:
+        """Create an investigator for a single query of the batch."""
+        return SimpleInvestigator(
+            api_key=self.api_key,
+            debug_mode=self.debug_mode,
+            log_format=self.log_format,
+            config=self.config,
+        )
+
+    async def _collect_batch_results(self, batch_id: str) -> dict[str, Message]:
+        """Wait for a batch to end and return its successful messages by custom_id."""
+        while True:
+            batch = await self.anthropic.messages.batches.retrieve(batch_id)
+            if batch.processing_status == "ended":
+                break
+            await asyncio.sleep(self.poll_interval)
+
+        responses: dict[str, Message] = {}
+        async for entry in await self.anthropic.messages.batches.results(batch_id):
+            # Errored, canceled and expired items are retried interactively
+            if entry.result.type == "succeeded":
+                responses[entry.custom_id] = entry.result.message
+        return responses
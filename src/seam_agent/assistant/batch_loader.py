@@ -0,0 +1,84 @@
+"""
+Coalesce concurrent single-key lookups into batched upstream calls.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    DataLoader-style batcher: keys requested within a short window are
+    fetched together with one call to batch_fn.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[K]], Awaitable[dict[K, V]]],
+        max_batch_size: int = 64,
+        delay: float = 0.005,
+    ):
+        """
+        Args:
+            batch_fn: Fetches several keys at once, returning results by key
+            max_batch_size: Dispatch immediately once this many keys are waiting
+            delay: Seconds to wait for more keys before dispatching a batch
+        """
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.delay = delay
+        self._pending: dict[K, asyncio.Future[V]] = {}
+        self._dispatch_handle: asyncio.TimerHandle | None = None
+        self._batches: set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> V:
+        """
+        Return the value for key, fetched in a batch with other pending keys.
+
+        Raises:
+            LookupError: If batch_fn returned no result for key
+        """
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif self._dispatch_handle is None:
+                self._dispatch_handle = loop.call_later(self.delay, self._dispatch)
+
+        # Shielded so one cancelled caller doesn't fail others waiting on key
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        """Start fetching every pending key as one batch."""
+        if self._dispatch_handle is not None:
+            self._dispatch_handle.cancel()
+            self._dispatch_handle = None
+
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, batch: dict[K, asyncio.Future[V]]) -> None:
+        try:
+            results = await self.batch_fn(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in batch.items():
+            if future.done():
+                continue
+            if key in results:
+                future.set_result(results[key])
+            else:
+                future.set_exception(LookupError(f"No result for {key!r}"))
@@ -0,0 +1,71 @@
+"""
+Small in-memory caches shared by investigation components.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Bounded mapping that evicts the least recently used entry when full."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[K, V] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value for key, or None if it is not cached."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Cache a value, evicting the least recently used entry if needed."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TTLCache(LRUCache[K, V]):
+    """LRU cache whose entries also expire ttl seconds after they are set."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        super().__init__(maxsize)
+        self.ttl = ttl
+        self._expires_at: dict[K, float] = {}
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value for key, or None if missing or expired."""
+        expires_at = self._expires_at.get(key)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            del self._expires_at[key]
+            return None
+        return super().get(key)
+
+    def set(self, key: K, value: V) -> None:
+        """Cache a value for ttl seconds, evicting the LRU entry if needed."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._expires_at[key] = time.monotonic() + self.ttl
+        if len(self._entries) > self.maxsize:
+            evicted, _ = self._entries.popitem(last=False)
+            del self._expires_at[evicted]
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        super().clear()
+        self._expires_at.clear()
@@ -1,41 +1,26 @@
 import asyncio
 from fastmcp import Client
 from fastmcp.client.transports import StdioTransport
-import os
 
-SEAM_API_KEY = os.getenv("SEAM_API_KEY")
-QUICKWIT_URL = os.getenv("QUICKWIT_URL")
-QUICKWIT_API_KEY = os.getenv("QUICKWIT_API_KEY")
-DATABASE_URL = os.getenv("DATABASE_URL")
+from seam_agent.assistant.env import ClientEnv
+from seam_agent.assistant.event_loop import install_uvloop
 
-if not SEAM_API_KEY:
-    raise ValueError("SEAM_API_KEY is not set")
 
-if not QUICKWIT_URL:
-    raise ValueError("QUICKWIT_URL is not set")
-
-if not QUICKWIT_API_KEY:
-    raise ValueError("QUICKWIT_API_KEY is not set")
-
-if not DATABASE_URL:
-    raise ValueError("DATABASE_URL is not set")
-
-client = Client(
-    StdioTransport(
-        command="python",
-        args=["server.py"],
-        env={
-            "SEAM_API_KEY": SEAM_API_KEY,
-            "QUICKWIT_URL": QUICKWIT_URL,
-            "QUICKWIT_API_KEY": QUICKWIT_API_KEY,
-            "DATABASE_URL": DATABASE_URL,
-        },
-        cwd="src/seam_agent/assistant",
-    ),
-)
+def create_client(env: ClientEnv) -> Client:
+    """Build an MCP client that launches the server over stdio with env."""
+    return Client(
+        StdioTransport(
+            command="python",
+            args=["server.py"],
+            env=env.to_process_env(),
+            cwd="src/seam_agent/assistant",
+        ),
+    )
 
 
 async def main():
+    # Built here rather than at import so importing this module has no side effects
+    client = create_client(ClientEnv.from_env())
     async with client:
         # List available resources
         resources = await client.list_resources()
@@ -76,6 +61,7 @@ async def main():
 
         # Test using the search_logs tool
         print("Testing search_logs tool...")
+        next_search_after = None
         try:
             log_search_result = await client.call_tool(
                 "search_logs",
@@ -87,27 +73,29 @@ async def main():
             )
             print("✅ Successfully called search_logs tool")
             print(f"   Result: {log_search_result}")
+            next_search_after = (log_search_result.data or {}).get("next_search_after")
         except Exception as e:
             print(f"❌ Error calling search_logs: {e}")
 
         print("\n" + "=" * 30 + "\n")
 
-        # Test using the search_logs tool with offset
-        print("Testing search_logs tool with offset...")
+        # Test using the search_logs tool with a pagination cursor
+        print("Testing search_logs tool with search_after...")
         try:
             await client.call_tool(
                 "search_logs",
                 {
                     "query": "level:ERROR",
                     "limit": 2,
-                    "offset": 5,
+                    "search_after": next_search_after,
                     "index": "application_logs_v4",
                 },
             )
-            print("✅ Successfully called search_logs tool with offset")
+            print("✅ Successfully called search_logs tool with search_after")
         except Exception as e:
-            print(f"❌ Error calling search_logs with offset: {e}")
+            print(f"❌ Error calling search_logs with search_after: {e}")
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -2,10 +2,12 @@
 Dynamic tool selection based on investigation state and previous results.
 """
 
-from typing import Dict, List, Any
+import re
+from itertools import islice
+from typing import Callable, Dict, Final, Iterator, List, Any
 from dataclasses import dataclass
-from enum import Enum
 
+from seam_agent.assistant.cache import LRUCache
 from seam_agent.assistant.query_parser import ParsedQuery
 from seam_agent.assistant.investigation_config import (
     InvestigationState,
@@ -13,17 +15,102 @@ from seam_agent.assistant.investigation_config import (
 )
 
 
-class InvestigationPhase(Enum):
+def _keyword_pattern(*keywords: str) -> re.Pattern[str]:
+    """Compile keywords into one pattern that matches any of them as a substring."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Keywords matched against the lowercased customer query, each category in a
+# single regex scan instead of one substring search per keyword
+ACCESS_CODE_PHRASES = _keyword_pattern("access_code", "unmanaged code")
+ACCESS_CODE_CONTEXT_WORDS = _keyword_pattern("created", "marked", "working", "failed")
+CONNECTIVITY_WORDS = _keyword_pattern(
+    "offline",
+    "online",
+    "connection",
+    "connectivity",
+    "network",
+    "disconnected",
+)
+ACTION_WORDS = _keyword_pattern(
+    "unlock", "lock", "failed", "error", "attempt", "operation"
+)
+
+# Tools whose failure leaves the investigation without its foundation
+CRITICAL_TOOLS = frozenset({"get_device_info", "get_access_codes"})
+
+# Tools to run after get_device_info for each query category
+INITIAL_TOOLS_BY_CATEGORY = {
+    "access_code": ("get_access_codes", "get_audit_logs"),
+    "connectivity": ("get_device_events",),
+    "action": ("get_action_attempts",),
+    # For unclear issues, start broad
+    "unknown": ("get_action_attempts", "get_device_events"),
+}
+
+
+def _device_info_findings(result: Dict[str, Any]) -> List[str]:
+    """Report the device type and whether the device is offline."""
+    findings = []
+    if "device_type" in result:
+        findings.append(f"Device type: {result['device_type']}")
+    if result.get("properties", {}).get("online") is False:
+        findings.append("Device is offline")
+    return findings
+
+
+def _action_attempt_findings(result: Dict[str, Any]) -> List[str]:
+    """Report how many action attempts did not succeed."""
+    failed_count = sum(
+        1
+        for attempt in result.get("action_attempts", [])
+        if attempt.get("status") != "success"
+    )
+    if failed_count > 0:
+        return [f"{failed_count} failed action attempts found"]
+    return []
+
+
+def _access_code_findings(result: Dict[str, Any]) -> List[str]:
+    """Report how many access codes are unmanaged."""
+    unmanaged_count = sum(
+        code.get("is_managed") is False for code in result.get("access_codes", [])
+    )
+    if unmanaged_count:
+        return [f"{unmanaged_count} unmanaged access codes found"]
+    return []
+
+
+# Whether a successful result holds data worth analyzing, by tool name
+MEANINGFUL_DATA_CHECKS: Dict[str, Callable[[Dict[str, Any]], bool]] = {
+    "get_device_info": lambda r: (
+        "device_type" in r and r.get("device_type") != "unknown"
+    ),
+    "get_access_codes": lambda r: len(r.get("access_codes", [])) > 0,
+    "get_action_attempts": lambda r: len(r.get("action_attempts", [])) > 0,
+    "get_device_events": lambda r: len(r.get("device_events", [])) > 0,
+    "get_audit_logs": lambda r: len(r.get("audit_logs", [])) > 0,
+}
+
+# Key finding extractors, by tool name
+FINDINGS_EXTRACTORS: Dict[str, Callable[[Dict[str, Any]], List[str]]] = {
+    "get_device_info": _device_info_findings,
+    "get_action_attempts": _action_attempt_findings,
+    "get_access_codes": _access_code_findings,
+}
+
+
+class InvestigationPhase:
     """Current phase of the investigation."""
 
-    INITIAL = "initial"
-    GATHERING = "gathering"
-    ANALYZING = "analyzing"
-    DEEP_DIVE = "deep_dive"
-    FINALIZING = "finalizing"
+    INITIAL: Final = "initial"
+    GATHERING: Final = "gathering"
+    ANALYZING: Final = "analyzing"
+    DEEP_DIVE: Final = "deep_dive"
+    FINALIZING: Final = "finalizing"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolResult:
     """Structured representation of a tool result for decision making."""
 
@@ -32,7 +119,6 @@ class ToolResult:
     data_found: bool
     needs_followup: bool
     key_findings: List[str]
-    raw_result: Dict[str, Any]
 
     @classmethod
     def from_raw_result(
@@ -40,8 +126,8 @@ class ToolResult:
     ) -> "ToolResult":
         """Create a ToolResult from raw tool output."""
         success = "error" not in raw_result
-        data_found = cls._has_meaningful_data(tool_name, raw_result)
-        needs_followup = cls._needs_followup(tool_name, raw_result)
+        data_found = success and cls._has_meaningful_data(tool_name, raw_result)
+        needs_followup = success and cls._needs_followup(tool_name, raw_result)
         key_findings = cls._extract_key_findings(tool_name, raw_result)
 
         return cls(
@@ -50,107 +136,122 @@ class ToolResult:
             data_found=data_found,
             needs_followup=needs_followup,
             key_findings=key_findings,
-            raw_result=raw_result,
         )
 
     @staticmethod
     def _has_meaningful_data(tool_name: str, result: Dict[str, Any]) -> bool:
-        """Check if the tool result contains meaningful data."""
-        if "error" in result:
-            return False
-
-        if tool_name == "get_device_info":
-            return "device_type" in result and result.get("device_type") != "unknown"
-        elif tool_name == "get_access_codes":
-            codes = result.get("access_codes", [])
-            return len(codes) > 0
-        elif tool_name == "get_action_attempts":
-            attempts = result.get("action_attempts", [])
-            return len(attempts) > 0
-        elif tool_name == "get_device_events":
-            events = result.get("device_events", [])
-            return len(events) > 0
-        elif tool_name == "get_audit_logs":
-            logs = result.get("audit_logs", [])
-            return len(logs) > 0
-
-        return True
+        """Check if a successful tool result contains meaningful data."""
+        check = MEANINGFUL_DATA_CHECKS.get(tool_name)
+        return check is None or check(result)
 
     @staticmethod
     def _needs_followup(tool_name: str, result: Dict[str, Any]) -> bool:
-        """Check if this tool result suggests more data is needed."""
-        if "error" in result:
-            return False
-
-        # Check pagination
-        pagination = result.get("pagination", {})
-        if pagination.get("has_more", False):
-            return True
-
-        # Device info failure might need third-party lookup
-        if tool_name == "get_device_info" and "error" in result:
-            return True
-
-        return False
+        """Check if a successful tool result suggests more data is needed."""
+        return bool(result.get("pagination", {}).get("has_more", False))
 
     @staticmethod
     def _extract_key_findings(tool_name: str, result: Dict[str, Any]) -> List[str]:
         """Extract key findings from tool result."""
-        findings = []
-
-        if tool_name == "get_device_info":
-            if "device_type" in result:
-                findings.append(f"Device type: {result['device_type']}")
-            if result.get("properties", {}).get("online") is False:
-                findings.append("Device is offline")
-
-        elif tool_name == "get_action_attempts":
-            attempts = result.get("action_attempts", [])
-            if attempts:
-                success_count = sum(1 for a in attempts if a.get("status") == "success")
-                failed_count = len(attempts) - success_count
-                if failed_count > 0:
-                    findings.append(f"{failed_count} failed action attempts found")
-
-        elif tool_name == "get_access_codes":
-            codes = result.get("access_codes", [])
-            unmanaged_codes = [c for c in codes if c.get("is_managed") is False]
-            if unmanaged_codes:
-                findings.append(f"{len(unmanaged_codes)} unmanaged access codes found")
-
-        return findings
+        extractor = FINDINGS_EXTRACTORS.get(tool_name)
+        return extractor(result) if extractor else []
 
 
 class DynamicToolSelector:
     """Intelligent tool selection based on investigation state and findings."""
 
+    # Selections only depend on their cache keys, so they are shared across instances
+    _initial_tools_cache: LRUCache[tuple[str, bool, str], tuple[str, ...]] = LRUCache(
+        maxsize=1024
+    )
+    _followup_tools_cache: LRUCache[tuple, tuple[str, ...]] = LRUCache(maxsize=1024)
+
     def __init__(self):
         self.investigation_phase = InvestigationPhase.INITIAL
-        self.tool_results: Dict[str, ToolResult] = {}
+        self.tool_results = {}
         self.investigation_context: Dict[str, Any] = {}
 
+    @property
+    def tool_results(self) -> Dict[str, ToolResult]:
+        """Results gathered so far, keyed by tool name."""
+        return self._tool_results
+
+    @tool_results.setter
+    def tool_results(self, results: Dict[str, ToolResult]) -> None:
+        # Aggregates are maintained as results arrive, so rebuild them here
+        self._tool_results: Dict[str, ToolResult] = {}
+        self._success_count = 0
+        self._data_found_count = 0
+        self._critical_failures: set[str] = set()
+        self._all_findings: List[str] = []
+        self._needs_followup_names: List[str] = []
+        for tool_name, result in results.items():
+            self._ingest_result(tool_name, result)
+
+    def _ingest_result(self, tool_name: str, result: ToolResult) -> None:
+        """Record a tool result and update the running aggregates."""
+        previous = self._tool_results.get(tool_name)
+        if previous is not None:
+            self._success_count -= previous.success
+            self._data_found_count -= previous.data_found
+
+        self._tool_results[tool_name] = result
+        self._success_count += result.success
+        self._data_found_count += result.data_found
+
+        if not result.success and result.tool_name in CRITICAL_TOOLS:
+            self._critical_failures.add(tool_name)
+        else:
+            self._critical_failures.discard(tool_name)
+
+        if previous is None:
+            self._all_findings.extend(result.key_findings)
+            if result.needs_followup:
+                self._needs_followup_names.append(tool_name)
+        else:
+            # Re-run tools (e.g. pagination) replace their earlier findings
+            self._all_findings = [
+                finding
+                for tool_result in self._tool_results.values()
+                for finding in tool_result.key_findings
+            ]
+            self._needs_followup_names = [
+                name
+                for name, tool_result in self._tool_results.items()
+                if tool_result.needs_followup
+            ]
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached initial and follow-up tool selections."""
+        cls._initial_tools_cache.clear()
+        cls._followup_tools_cache.clear()
+
     def select_initial_tools(
         self, parsed_query: ParsedQuery, original_query: str
     ) -> List[str]:
         """Select the initial set of tools based on the query."""
         self.investigation_phase = InvestigationPhase.INITIAL
-        tools = []
 
-        # Always start with device info as foundation
-        tools.append("get_device_info")
-
-        # Select specific tools based on query analysis
-        if self._is_access_code_issue(parsed_query, original_query):
-            tools.extend(["get_access_codes", "get_audit_logs"])
-        elif self._is_connectivity_issue(parsed_query, original_query):
-            tools.extend(["get_device_events"])
-        elif self._is_action_issue(parsed_query, original_query):
-            tools.extend(["get_action_attempts"])
-        else:
-            # For unclear issues, start broad
-            tools.extend(["get_action_attempts", "get_device_events"])
+        cache_key = (
+            parsed_query.question_type,
+            len(parsed_query.access_codes) > 0,
+            original_query,
+        )
+        tools = self._initial_tools_cache.get(cache_key)
+        if tools is None:
+            tools = tuple(self._compute_initial_tools(parsed_query, original_query))
+            self._initial_tools_cache.set(cache_key, tools)
+
+        return list(tools)
 
-        return tools
+    def _compute_initial_tools(
+        self, parsed_query: ParsedQuery, original_query: str
+    ) -> List[str]:
+        """Run the keyword rules that pick the initial tools for a query."""
+        category = self._classify_query(parsed_query, original_query.lower())
+
+        # Always start with device info as foundation
+        return ["get_device_info", *INITIAL_TOOLS_BY_CATEGORY[category]]
 
     def select_followup_tools(
         self,
@@ -163,38 +264,55 @@ class DynamicToolSelector:
 
         # Update our understanding with new results
         for tool_name, raw_result in previous_results.items():
-            self.tool_results[tool_name] = ToolResult.from_raw_result(
-                tool_name, raw_result
+            self._ingest_result(
+                tool_name, ToolResult.from_raw_result(tool_name, raw_result)
             )
 
         # Update investigation phase
         self._update_investigation_phase(investigation_state)
 
         # Check if we have budget for more tools
-        if not investigation_state.can_continue_round(config):
+        budget = investigation_state.remaining_tools(config)
+        if budget <= 0:
             return []
 
-        followup_tools = []
+        # Many rounds reach the same findings, so reuse the earlier decision
+        state_key = (parsed_query.question_type, self._tool_results_fingerprint())
+        followup_tools = self._followup_tools_cache.get(state_key)
+        if followup_tools is None:
+            followup_tools = tuple(self._iter_followup_tools(parsed_query))
+            self._followup_tools_cache.set(state_key, followup_tools)
+
+        return list(islice(followup_tools, budget))
 
+    def _iter_followup_tools(self, parsed_query: ParsedQuery) -> Iterator[str]:
+        """Yield follow-up tools in priority order from the accumulated results."""
         # Handle pagination needs first (high priority)
         for tool_name, result in self.tool_results.items():
-            if result.needs_followup and investigation_state.can_continue_round(config):
-                followup_tools.append(self._get_pagination_tool_call(tool_name, result))
+            if result.needs_followup:
+                yield self._get_pagination_tool_call(tool_name)
 
-        # Add tools based on findings if we have budget
-        if investigation_state.can_continue_round(config):
-            followup_tools.extend(self._select_analytical_tools(parsed_query))
+        # Add tools based on findings
+        yield from self._iter_analytical_tools(parsed_query)
 
         # Always include admin links last if we haven't used it yet
-        if (
-            "get_admin_links" not in self.tool_results
-            and investigation_state.can_continue_round(config)
-        ):
-            followup_tools.append("get_admin_links")
+        if "get_admin_links" not in self.tool_results:
+            yield "get_admin_links"
 
-        return followup_tools[
-            : config.MAX_TOOLS_PER_ROUND - investigation_state.tools_used_this_round
-        ]
+    def _tool_results_fingerprint(
+        self,
+    ) -> tuple[tuple[str, bool, bool, bool, bool], ...]:
+        """Reduce accumulated results to the fields the follow-up rules read."""
+        return tuple(
+            (
+                tool_name,
+                result.success,
+                result.data_found,
+                result.needs_followup,
+                any("failed" in finding for finding in result.key_findings),
+            )
+            for tool_name, result in self.tool_results.items()
+        )
 
     def should_continue_investigation(
         self, investigation_state: InvestigationState, config: InvestigationConfig
@@ -219,61 +337,55 @@ class DynamicToolSelector:
     def get_investigation_summary(self) -> Dict[str, Any]:
         """Get a summary of the current investigation state."""
         return {
-            "phase": self.investigation_phase.value,
+            "phase": self.investigation_phase,
             "tools_used": list(self.tool_results.keys()),
-            "key_findings": [
-                finding
-                for result in self.tool_results.values()
-                for finding in result.key_findings
-            ],
-            "needs_followup": [
-                name
-                for name, result in self.tool_results.items()
-                if result.needs_followup
-            ],
+            "key_findings": list(self._all_findings),
+            "needs_followup": list(self._needs_followup_names),
             "data_quality": self._assess_data_quality(),
         }
 
+    def _classify_query(self, parsed_query: ParsedQuery, query_lower: str) -> str:
+        """
+        Classify the query into the category that drives initial tool selection.
+
+        Args:
+            parsed_query: The parsed customer query
+            query_lower: The original customer query, lowercased once by the caller
+
+        Returns:
+            One of "access_code", "connectivity", "action" or "unknown"
+        """
+        if self._is_access_code_issue(parsed_query, query_lower):
+            return "access_code"
+        if self._is_connectivity_issue(parsed_query, query_lower):
+            return "connectivity"
+        if self._is_action_issue(parsed_query, query_lower):
+            return "action"
+        return "unknown"
+
     def _is_access_code_issue(
-        self, parsed_query: ParsedQuery, original_query: str
+        self, parsed_query: ParsedQuery, query_lower: str
     ) -> bool:
         """Check if this is primarily an access code issue."""
         return (
             parsed_query.question_type == "access_code"
-            or "access_code" in original_query.lower()
-            or "unmanaged code" in original_query.lower()
             or len(parsed_query.access_codes) > 0
+            or ACCESS_CODE_PHRASES.search(query_lower) is not None
             or (
-                "code" in original_query.lower()
-                and any(
-                    word in original_query.lower()
-                    for word in ["created", "marked", "working", "failed"]
-                )
+                "code" in query_lower
+                and ACCESS_CODE_CONTEXT_WORDS.search(query_lower) is not None
             )
         )
 
     def _is_connectivity_issue(
-        self, parsed_query: ParsedQuery, original_query: str
+        self, parsed_query: ParsedQuery, query_lower: str
     ) -> bool:
         """Check if this is primarily a connectivity issue."""
-        return any(
-            word in original_query.lower()
-            for word in [
-                "offline",
-                "online",
-                "connection",
-                "connectivity",
-                "network",
-                "disconnected",
-            ]
-        )
+        return CONNECTIVITY_WORDS.search(query_lower) is not None
 
-    def _is_action_issue(self, parsed_query: ParsedQuery, original_query: str) -> bool:
+    def _is_action_issue(self, parsed_query: ParsedQuery, query_lower: str) -> bool:
         """Check if this is primarily an action/operation issue."""
-        return any(
-            word in original_query.lower()
-            for word in ["unlock", "lock", "failed", "error", "attempt", "operation"]
-        )
+        return ACTION_WORDS.search(query_lower) is not None
 
     def _update_investigation_phase(
         self, investigation_state: InvestigationState
@@ -286,19 +398,17 @@ class DynamicToolSelector:
         elif investigation_state.tool_rounds_used >= 3:
             self.investigation_phase = InvestigationPhase.DEEP_DIVE
 
-    def _get_pagination_tool_call(self, tool_name: str, result: ToolResult) -> str:
+    def _get_pagination_tool_call(self, tool_name: str) -> str:
         """Get the appropriate tool call for pagination."""
         # For now, return the same tool name - the orchestrator will handle pagination logic
         return tool_name
 
-    def _select_analytical_tools(self, parsed_query: ParsedQuery) -> List[str]:
-        """Select tools for deeper analysis based on current findings."""
-        analytical_tools = []
-
+    def _iter_analytical_tools(self, parsed_query: ParsedQuery) -> Iterator[str]:
+        """Yield tools for deeper analysis based on current findings."""
         # If device info failed, try third-party lookup
         device_result = self.tool_results.get("get_device_info")
         if device_result and not device_result.success:
-            analytical_tools.append("get_third_party_device_info")
+            yield "get_third_party_device_info"
 
         # If we found failed actions but no audit logs, get audit logs
         action_result = self.tool_results.get("get_action_attempts")
@@ -308,7 +418,7 @@ class DynamicToolSelector:
             and "get_audit_logs" not in self.tool_results
             and any("failed" in finding for finding in action_result.key_findings)
         ):
-            analytical_tools.append("get_audit_logs")
+            yield "get_audit_logs"
 
         # If we have access code issues but no device events, get events
         code_result = self.tool_results.get("get_access_codes")
@@ -317,35 +427,24 @@ class DynamicToolSelector:
             and code_result.data_found
             and "get_device_events" not in self.tool_results
         ):
-            analytical_tools.append("get_device_events")
-
-        return analytical_tools
+            yield "get_device_events"
 
     def _has_sufficient_data(self) -> bool:
         """Check if we have enough data for a meaningful analysis."""
         # Need at least device info and one other data source
-        has_device_info = "get_device_info" in self.tool_results
-        has_additional_data = (
-            len([r for r in self.tool_results.values() if r.data_found]) >= 2
-        )
-
-        return has_device_info and has_additional_data
+        return "get_device_info" in self.tool_results and self._data_found_count >= 2
 
     def _has_critical_failures(self) -> bool:
         """Check if there are critical failures that need more investigation."""
-        return any(
-            not result.success
-            and result.tool_name in ["get_device_info", "get_access_codes"]
-            for result in self.tool_results.values()
-        )
+        return bool(self._critical_failures)
 
     def _assess_data_quality(self) -> str:
         """Assess the overall quality of data gathered."""
         if not self.tool_results:
             return "no_data"
 
-        successful_tools = sum(1 for r in self.tool_results.values() if r.success)
-        data_tools = sum(1 for r in self.tool_results.values() if r.data_found)
+        successful_tools = self._success_count
+        data_tools = self._data_found_count
         total_tools = len(self.tool_results)
 
         if successful_tools == total_tools and data_tools >= 2:
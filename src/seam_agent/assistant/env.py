@@ -0,0 +1,46 @@
+"""
+Environment configuration for the MCP client.
+"""
+
+import os
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ClientEnv:
+    """Credentials and endpoints the MCP server process needs."""
+
+    seam_api_key: str
+    quickwit_url: str
+    quickwit_api_key: str
+    database_url: str
+
+    @classmethod
+    def from_env(cls) -> "ClientEnv":
+        """Read all required variables in one pass.
+
+        Raises:
+            ValueError: Listing every required variable that is missing or empty
+        """
+        env = os.environ
+        required = ("SEAM_API_KEY", "QUICKWIT_URL", "QUICKWIT_API_KEY", "DATABASE_URL")
+
+        missing = [name for name in required if not env.get(name)]
+        if missing:
+            raise ValueError(f"{', '.join(missing)} not set")
+
+        return cls(
+            seam_api_key=env["SEAM_API_KEY"],
+            quickwit_url=env["QUICKWIT_URL"],
+            quickwit_api_key=env["QUICKWIT_API_KEY"],
+            database_url=env["DATABASE_URL"],
+        )
+
+    def to_process_env(self) -> dict[str, str]:
+        """Return the variables to pass to the server subprocess."""
+        return {
+            "SEAM_API_KEY": self.seam_api_key,
+            "QUICKWIT_URL": self.quickwit_url,
+            "QUICKWIT_API_KEY": self.quickwit_api_key,
+            "DATABASE_URL": self.database_url,
+        }
@@ -0,0 +1,26 @@
+"""
+Event loop selection for the agent's entry points.
+"""
+
+import asyncio
+import importlib
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop for new event loops when it is installed.
+
+    uvloop is optional; without it the default asyncio loop is kept. Call
+    this before asyncio.run() or mcp.run() so the loop they create picks it up.
+
+    Returns:
+        True if uvloop was installed as the event loop policy
+    """
+    # Imported by name: uvloop is optional and not a declared dependency
+    try:
+        uvloop = importlib.import_module("uvloop")
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
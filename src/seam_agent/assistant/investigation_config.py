@@ -2,11 +2,13 @@
 Configuration for investigation limits and budgets.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+import functools
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InvestigationConfig:
     """Configuration for investigation limits and resource management."""
 
@@ -20,17 +22,25 @@ class InvestigationConfig:
     MAX_CONVERSATION_LENGTH: int = 20
 
     # Timeout limits (seconds)
-    TOOL_EXECUTION_TIMEOUT: int = 30
+    TOOL_EXECUTION_TIMEOUT: float = 30
     TOTAL_INVESTIGATION_TIMEOUT: int = 120
 
+    # Concurrency limits per external backend
+    MAX_CONCURRENT_DB_TOOLS: int = 3
+
+    # Skip follow-up rounds for confidently parsed queries whose first round
+    # already produced the evidence the question type needs
+    EARLY_EXIT_CONFIDENCE_THRESHOLD: float = 0.9
+
     # Pagination limits
     DEFAULT_PAGINATION_LIMIT: int = 10
     MAX_PAGINATION_LIMIT: int = 100
     AGGRESSIVE_PAGINATION_LIMIT: int = 50
 
     @classmethod
+    @functools.cache
     def create_production_config(cls) -> "InvestigationConfig":
-        """Create a conservative configuration for production use."""
+        """Get the shared conservative configuration for production use."""
         return cls(
             MAX_TOOL_ROUNDS=2,
             MAX_TOOLS_PER_ROUND=3,
@@ -40,8 +50,9 @@ class InvestigationConfig:
         )
 
     @classmethod
+    @functools.cache
     def create_debug_config(cls) -> "InvestigationConfig":
-        """Create a more permissive configuration for debugging."""
+        """Get the shared, more permissive configuration for debugging."""
         return cls(
             MAX_TOOL_ROUNDS=5,
             MAX_TOOLS_PER_ROUND=8,
@@ -51,7 +62,7 @@ class InvestigationConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class InvestigationState:
     """Tracks the current state of an investigation for limit enforcement."""
 
@@ -60,13 +71,23 @@ class InvestigationState:
     total_tools_used: int = 0
     start_time: Optional[float] = None
     conversation_messages: int = 0
+    early_exit: bool = False
+    # Tool executions keyed by (tool name, canonical input), so identical
+    # calls within the investigation share one result
+    tool_calls: dict[tuple[str, bytes], asyncio.Future[Any]] = field(
+        default_factory=dict
+    )
+
+    def remaining_tools(self, config: InvestigationConfig) -> int:
+        """Number of tools that can still run in this round under both limits."""
+        return min(
+            config.MAX_TOOLS_PER_ROUND - self.tools_used_this_round,
+            config.MAX_TOTAL_TOOLS - self.total_tools_used,
+        )
 
     def can_continue_round(self, config: InvestigationConfig) -> bool:
         """Check if we can continue with more tools in this round."""
-        return (
-            self.tools_used_this_round < config.MAX_TOOLS_PER_ROUND
-            and self.total_tools_used < config.MAX_TOTAL_TOOLS
-        )
+        return self.remaining_tools(config) > 0
 
     def can_start_new_round(self, config: InvestigationConfig) -> bool:
         """Check if we can start a new tool calling round."""
@@ -95,7 +116,8 @@ class InvestigationState:
             f"Tool rounds: {self.tool_rounds_used}, "
             f"Tools this round: {self.tools_used_this_round}, "
             f"Total tools: {self.total_tools_used}, "
-            f"Messages: {self.conversation_messages}"
+            f"Messages: {self.conversation_messages}, "
+            f"Early exit: {self.early_exit}"
         )
 
 
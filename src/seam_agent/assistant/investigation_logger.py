@@ -5,45 +5,89 @@ Provides structured logging with context, timing, and configurable output format
 """
 
 import json
+import sys
 import time
+from collections import Counter
 from datetime import datetime
-from enum import Enum
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Final, Optional, List
 from dataclasses import dataclass, field
 from contextlib import contextmanager
 
+import orjson
 
-class LogLevel(Enum):
-    DEBUG = "DEBUG"
-    INFO = "INFO"
-    WARNING = "WARNING"
-    ERROR = "ERROR"
-    SUCCESS = "SUCCESS"
 
+# Levels and contexts are plain strings so entries can be counted, compared
+# and serialized without going through enum members
+class LogLevel:
+    DEBUG: Final = "DEBUG"
+    INFO: Final = "INFO"
+    WARNING: Final = "WARNING"
+    ERROR: Final = "ERROR"
+    SUCCESS: Final = "SUCCESS"
 
-class LogContext(Enum):
-    INVESTIGATION = "investigation"
-    TOOL_EXECUTION = "tool_execution"
-    AI_RESPONSE = "ai_response"
-    QUERY_PARSING = "query_parsing"
-    DATABASE = "database"
-    API_CALL = "api_call"
 
+class LogContext:
+    INVESTIGATION: Final = "investigation"
+    TOOL_EXECUTION: Final = "tool_execution"
+    AI_RESPONSE: Final = "ai_response"
+    QUERY_PARSING: Final = "query_parsing"
+    DATABASE: Final = "database"
+    API_CALL: Final = "api_call"
 
-@dataclass
+
+LEVEL_EMOJI = {
+    LogLevel.DEBUG: "🔍",
+    LogLevel.INFO: "ℹ️",
+    LogLevel.WARNING: "⚠️",
+    LogLevel.ERROR: "❌",
+    LogLevel.SUCCESS: "✅",
+}
+
+CONTEXT_LABELS = {
+    context: f"[{context.upper()}]"
+    for context in (
+        LogContext.INVESTIGATION,
+        LogContext.TOOL_EXECUTION,
+        LogContext.AI_RESPONSE,
+        LogContext.QUERY_PARSING,
+        LogContext.DATABASE,
+        LogContext.API_CALL,
+    )
+}
+
+
+# Entry data, or a function that builds it when first printed or exported
+LogData = Dict[str, Any] | Callable[[], Dict[str, Any]] | None
+
+
+@dataclass(slots=True)
 class LogEntry:
-    timestamp: datetime
-    level: LogLevel
-    context: LogContext
+    timestamp: float  # Unix time; only formatted when the entry is output
+    level: str
+    context: str
     message: str
-    data: dict[str, Any] = field(default_factory=dict)
+    _data: LogData = None
     duration_ms: float | None = None
+    _iso_timestamp: str | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """Return the entry data, building it on first access if logged lazily."""
+        if callable(self._data):
+            self._data = self._data()
+        return self._data or {}
+
+    def iso_timestamp(self) -> str:
+        """Return the timestamp in ISO format, formatting it at most once."""
+        if self._iso_timestamp is None:
+            self._iso_timestamp = datetime.fromtimestamp(self.timestamp).isoformat()
+        return self._iso_timestamp
 
     def to_dict(self) -> dict[str, Any]:
         return {
-            "timestamp": self.timestamp.isoformat(),
-            "level": self.level.value,
-            "context": self.context.value,
+            "timestamp": self.iso_timestamp(),
+            "level": self.level,
+            "context": self.context,
             "message": self.message,
             "data": self.data,
             "duration_ms": self.duration_ms,
@@ -57,27 +101,33 @@ class InvestigationLogger:
         self.debug_mode = debug_mode
         self.output_format = output_format  # "human", "json", "silent"
         self.entries: List[LogEntry] = []
+        self._by_level: Counter[str] = Counter()
+        self._by_context: Counter[str] = Counter()
+        # Entry count and JSON of the last export, reused until entries change
+        self._json_cache: tuple[int, str] | None = None
         self._timers: Dict[str, float] = {}
 
     def _log(
         self,
-        level: LogLevel,
-        context: LogContext,
+        level: str,
+        context: str,
         message: str,
-        data: Dict[str, Any] | None = None,
+        data: LogData = None,
         duration_ms: Optional[float] = None,
     ):
         """Internal logging method."""
         entry = LogEntry(
-            timestamp=datetime.now(),
+            timestamp=time.time(),
             level=level,
             context=context,
             message=message,
-            data=data or {},
+            _data=data,
             duration_ms=duration_ms,
         )
 
         self.entries.append(entry)
+        self._by_level[level] += 1
+        self._by_context[context] += 1
 
         if self.output_format != "silent":
             self._output_entry(entry)
@@ -85,7 +135,8 @@ class InvestigationLogger:
     def _output_entry(self, entry: LogEntry):
         """Output log entry based on format."""
         if self.output_format == "json":
-            print(json.dumps(entry.to_dict()))
+            line = orjson.dumps(entry.to_dict(), default=str).decode("utf-8")
+            sys.stdout.write(line + "\n")
         elif self.output_format == "human":
             self._output_human_format(entry)
 
@@ -96,41 +147,34 @@ class InvestigationLogger:
             return
 
         # Format timestamp
-        time_str = entry.timestamp.strftime("%H:%M:%S.%f")[:-3]
-
-        # Choose emoji based on level
-        level_emoji = {
-            LogLevel.DEBUG: "🔍",
-            LogLevel.INFO: "ℹ️",
-            LogLevel.WARNING: "⚠️",
-            LogLevel.ERROR: "❌",
-            LogLevel.SUCCESS: "✅",
-        }
+        time_str = time.strftime("%H:%M:%S", time.localtime(entry.timestamp))
+        time_str += f".{int(entry.timestamp % 1 * 1000):03d}"
 
         # Format duration if available
         duration_str = f" ({entry.duration_ms:.0f}ms)" if entry.duration_ms else ""
 
-        # Format context
-        context_str = f"[{entry.context.value.upper()}]"
-
-        print(
-            f"{level_emoji[entry.level]} {time_str} {context_str} {entry.message}{duration_str}"
-        )
+        lines = [
+            f"{LEVEL_EMOJI[entry.level]} {time_str} {CONTEXT_LABELS[entry.context]} {entry.message}{duration_str}"
+        ]
 
         # Show data if available and in debug mode
-        if entry.data and self.debug_mode:
+        if self.debug_mode and entry.data:
             for key, value in entry.data.items():
                 if isinstance(value, dict) or isinstance(value, list):
-                    print(f"    {key}: {json.dumps(value, indent=2)}")
-                else:
-                    print(f"    {key}: {value}")
+                    value = orjson.dumps(
+                        value, default=str, option=orjson.OPT_INDENT_2
+                    ).decode("utf-8")
+                lines.append(f"    {key}: {value}")
+
+        # One write per entry, so the stdout lock is taken and flushed once
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # Convenience methods for different log levels
     def debug(
         self,
         message: str,
-        context: LogContext = LogContext.INVESTIGATION,
-        data: Dict[str, Any] | None = None,
+        context: str = LogContext.INVESTIGATION,
+        data: LogData = None,
         duration_ms: Optional[float] = None,
     ):
         self._log(LogLevel.DEBUG, context, message, data, duration_ms)
@@ -138,8 +182,8 @@ class InvestigationLogger:
     def info(
         self,
         message: str,
-        context: LogContext = LogContext.INVESTIGATION,
-        data: Dict[str, Any] | None = None,
+        context: str = LogContext.INVESTIGATION,
+        data: LogData = None,
         duration_ms: Optional[float] = None,
     ):
         self._log(LogLevel.INFO, context, message, data, duration_ms)
@@ -147,8 +191,8 @@ class InvestigationLogger:
     def warning(
         self,
         message: str,
-        context: LogContext = LogContext.INVESTIGATION,
-        data: Dict[str, Any] | None = None,
+        context: str = LogContext.INVESTIGATION,
+        data: LogData = None,
         duration_ms: Optional[float] = None,
     ):
         self._log(LogLevel.WARNING, context, message, data, duration_ms)
@@ -156,8 +200,8 @@ class InvestigationLogger:
     def error(
         self,
         message: str,
-        context: LogContext = LogContext.INVESTIGATION,
-        data: Dict[str, Any] | None = None,
+        context: str = LogContext.INVESTIGATION,
+        data: LogData = None,
         duration_ms: Optional[float] = None,
     ):
         self._log(LogLevel.ERROR, context, message, data, duration_ms)
@@ -165,8 +209,8 @@ class InvestigationLogger:
     def success(
         self,
         message: str,
-        context: LogContext = LogContext.INVESTIGATION,
-        data: Dict[str, Any] | None = None,
+        context: str = LogContext.INVESTIGATION,
+        data: LogData = None,
         duration_ms: Optional[float] = None,
     ):
         self._log(LogLevel.SUCCESS, context, message, data, duration_ms)
@@ -177,7 +221,7 @@ class InvestigationLogger:
         self.info(
             f"Executing tool: {tool_name}",
             LogContext.TOOL_EXECUTION,
-            {"tool_name": tool_name, "input_params": input_params},
+            lambda: {"tool_name": tool_name, "input_params": input_params},
         )
         self._start_timer(f"tool_{tool_name}")
 
@@ -186,9 +230,12 @@ class InvestigationLogger:
     ):
         """Log successful tool execution."""
         duration = self._end_timer(f"tool_{tool_name}")
-        data = {"tool_name": tool_name, "result_size": result_size}
-        if key_findings:
-            data["key_findings"] = key_findings
+
+        def data() -> Dict[str, Any]:
+            fields = {"tool_name": tool_name, "result_size": result_size}
+            if key_findings:
+                fields["key_findings"] = key_findings
+            return fields
 
         self.success(
             f"Tool '{tool_name}' completed successfully",
@@ -203,7 +250,7 @@ class InvestigationLogger:
         self.error(
             f"Tool '{tool_name}' failed",
             LogContext.TOOL_EXECUTION,
-            {"tool_name": tool_name, "error": error},
+            lambda: {"tool_name": tool_name, "error": error},
             duration_ms=duration,
         )
 
@@ -255,7 +302,7 @@ class InvestigationLogger:
 
     @contextmanager
     def timer_context(
-        self, operation_name: str, context: LogContext = LogContext.INVESTIGATION
+        self, operation_name: str, context: str = LogContext.INVESTIGATION
     ):
         """Context manager for timing operations."""
         start_time = time.time()
@@ -269,31 +316,25 @@ class InvestigationLogger:
     # Export methods
     def get_summary(self) -> Dict[str, Any]:
         """Get a summary of the investigation log."""
-        total_entries = len(self.entries)
-        by_level = {}
-        by_context = {}
-
-        for entry in self.entries:
-            by_level[entry.level.value] = by_level.get(entry.level.value, 0) + 1
-            by_context[entry.context.value] = by_context.get(entry.context.value, 0) + 1
-
         return {
-            "total_entries": total_entries,
-            "by_level": by_level,
-            "by_context": by_context,
-            "start_time": self.entries[0].timestamp.isoformat()
-            if self.entries
-            else None,
-            "end_time": self.entries[-1].timestamp.isoformat()
-            if self.entries
-            else None,
+            "total_entries": len(self.entries),
+            "by_level": dict(self._by_level),
+            "by_context": dict(self._by_context),
+            "start_time": self.entries[0].iso_timestamp() if self.entries else None,
+            "end_time": self.entries[-1].iso_timestamp() if self.entries else None,
         }
 
     def export_json(self) -> str:
         """Export all log entries as JSON."""
-        return json.dumps([entry.to_dict() for entry in self.entries], indent=2)
+        if self._json_cache is None or self._json_cache[0] != len(self.entries):
+            exported = json.dumps([entry.to_dict() for entry in self.entries], indent=2)
+            self._json_cache = (len(self.entries), exported)
+        return self._json_cache[1]
 
     def clear(self):
         """Clear all log entries."""
         self.entries.clear()
         self._timers.clear()
+        self._by_level.clear()
+        self._by_context.clear()
+        self._json_cache = None
@@ -3,6 +3,7 @@ Investigation strategy for managing business logic and investigation flow.
 """
 
 from typing import Tuple, Set
+from .cache import LRUCache
 from .tool_registry import ToolRegistry
 from .prompt_manager import PromptManager
 
@@ -10,14 +11,38 @@ from .prompt_manager import PromptManager
 class InvestigationStrategy:
     """Manages the business logic for investigation flow."""
 
+    # Decisions only depend on their cache keys, so they are shared across instances
+    _decision_cache: LRUCache[tuple, Tuple[bool, str]] = LRUCache(maxsize=256)
+
     def __init__(self, tool_registry: ToolRegistry, prompt_manager: PromptManager):
         self.tool_registry = tool_registry
         self.prompt_manager = prompt_manager
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached continuation decisions."""
+        cls._decision_cache.clear()
+
     def should_continue_investigation(
         self, parsed_query, original_query: str, tools_used: Set[str]
     ) -> Tuple[bool, str]:
         """Determine if investigation should continue and what prompt to use."""
+        cache_key = (
+            parsed_query.question_type,
+            len(parsed_query.access_codes) > 0,
+            original_query,
+            frozenset(tools_used),
+        )
+        decision = self._decision_cache.get(cache_key)
+        if decision is None:
+            decision = self._decide(parsed_query, original_query, tools_used)
+            self._decision_cache.set(cache_key, decision)
+        return decision
+
+    def _decide(
+        self, parsed_query, original_query: str, tools_used: Set[str]
+    ) -> Tuple[bool, str]:
+        """Compare required tools with those used and pick the next prompt."""
         required_tools = self.tool_registry.get_required_tools(
             parsed_query, original_query
         )
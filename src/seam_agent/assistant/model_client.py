@@ -1,24 +1,34 @@
 """
 Unified AI model client for different providers.
 
-Provides a consistent interface for OpenAI and Anthropic models.
+Provides a consistent interface for OpenAI and Anthropic models. Works on any
+asyncio loop; entry points switch to uvloop when it is installed (see event_loop).
 """
 
-import json
-from typing import Any, Optional, List
-from pydantic import BaseModel, Field
-from openai import AsyncOpenAI
+import asyncio
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, ClassVar, Optional, List
+
+import orjson
 from anthropic import AsyncAnthropic
+from openai import AsyncOpenAI
 
+from seam_agent.assistant.api_clients import get_anthropic_client, get_openai_client
+from seam_agent.assistant.cache import LRUCache
+from seam_agent.assistant.retry import retry_transient
 
-class Function(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class Function:
     """Function call information"""
 
     name: str
     arguments: str
 
 
-class ToolCall(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ToolCall:
     """Tool call information"""
 
     id: str
@@ -26,113 +36,127 @@ class ToolCall(BaseModel):
     type: str = "function"
 
 
-class Message(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Message:
     """Message with content and optional tool calls"""
 
     content: str
     tool_calls: Optional[List[ToolCall]] = None
 
 
-class Choice(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Choice:
     """Choice containing a message"""
 
     message: Message
 
 
-class UnifiedResponse(BaseModel):
+class UnifiedResponse(ABC):
     """Unified response object that works with both OpenAI and Anthropic"""
 
-    provider: str
-    raw_response: Any = Field(
-        exclude=True
-    )  # Store raw response but exclude from serialization
-    _choices: Optional[List[Choice]] = None
+    __slots__ = ("raw_response", "_choices")
 
-    class Config:
-        arbitrary_types_allowed = True
+    provider: ClassVar[str]
 
-    def __init__(self, provider: str, response: Any, **data):
-        super().__init__(provider=provider, raw_response=response, **data)
+    def __init__(self, response: Any):
+        self.raw_response: Any = response
+        self._choices: Optional[List[Choice]] = None
 
     @property
     def choices(self) -> List[Choice]:
         """Unified choices interface"""
         if self._choices is None:
-            if self.provider == "openai":
-                # Convert OpenAI response to our Pydantic models
-                choices = []
-                for choice in self.raw_response.choices:
-                    tool_calls = []
-                    if (
-                        hasattr(choice.message, "tool_calls")
-                        and choice.message.tool_calls
-                    ):
-                        for tc in choice.message.tool_calls:
-                            tool_calls.append(
-                                ToolCall(
-                                    id=tc.id,
-                                    function=Function(
-                                        name=tc.function.name,
-                                        arguments=tc.function.arguments,
-                                    ),
-                                )
-                            )
-
-                    message = Message(
-                        content=choice.message.content or "",
-                        tool_calls=tool_calls if tool_calls else None,
+            self._choices = self._build_choices()
+            # The SDK object is only needed to build choices; don't keep it
+            # alive for as long as this response sits in chat history
+            self.raw_response = None
+        return self._choices
+
+    @abstractmethod
+    def _build_choices(self) -> List[Choice]:
+        """Convert the provider's raw response into unified choices"""
+
+
+class OpenAIResponse(UnifiedResponse):
+    """Unified view of an OpenAI chat completion"""
+
+    __slots__ = ()
+
+    provider = "openai"
+
+    def _build_choices(self) -> List[Choice]:
+        choices = []
+        for choice in self.raw_response.choices:
+            tool_calls = [
+                ToolCall(
+                    id=tc.id,
+                    function=Function(
+                        name=tc.function.name, arguments=tc.function.arguments
+                    ),
+                )
+                for tc in choice.message.tool_calls or ()
+            ]
+            message = Message(
+                content=choice.message.content or "",
+                tool_calls=tool_calls or None,
+            )
+            choices.append(Choice(message=message))
+        return choices
+
+
+class AnthropicResponse(UnifiedResponse):
+    """Unified view of an Anthropic message"""
+
+    __slots__ = ()
+
+    provider = "anthropic"
+
+    def _build_choices(self) -> List[Choice]:
+        # Anthropic returns a single message made of text and tool_use blocks
+        content = ""
+        tool_calls = []
+        for content_block in self.raw_response.content:
+            if content_block.type == "text":
+                content += content_block.text
+            elif content_block.type == "tool_use":
+                tool_calls.append(
+                    ToolCall(
+                        id=content_block.id,
+                        function=Function(
+                            name=content_block.name,
+                            arguments=orjson.dumps(content_block.input).decode("utf-8"),
+                        ),
                     )
-                    choices.append(Choice(message=message))
-
-                self._choices = choices
-
-            elif self.provider == "anthropic":
-                # Extract content and tool calls from Anthropic response
-                content = ""
-                tool_calls = []
-
-                if hasattr(self.raw_response, "content"):
-                    for content_block in self.raw_response.content:
-                        if hasattr(content_block, "text"):
-                            content += content_block.text
-                        elif hasattr(content_block, "name"):  # Tool use
-                            # Convert Anthropic tool use to our format
-                            tool_calls.append(
-                                ToolCall(
-                                    id=getattr(
-                                        content_block, "id", f"call_{len(tool_calls)}"
-                                    ),
-                                    function=Function(
-                                        name=content_block.name,
-                                        arguments=json.dumps(
-                                            getattr(content_block, "input", {})
-                                        ),
-                                    ),
-                                )
-                            )
-
-                message = Message(
-                    content=content, tool_calls=tool_calls if tool_calls else None
                 )
-                self._choices = [Choice(message=message)]
 
-        return self._choices or []
+        message = Message(content=content, tool_calls=tool_calls or None)
+        return [Choice(message=message)]
+
+
+# OpenAI message role -> Anthropic message builder; tool responses become user
+# turns, system messages are folded into the first turn and other roles are
+# dropped
+ANTHROPIC_MESSAGE_BUILDERS: dict[str, Callable[[Any], dict[str, Any]]] = {
+    "user": lambda content: {"role": "user", "content": content},
+    "assistant": lambda content: {"role": "assistant", "content": content},
+    "tool": lambda content: {"role": "user", "content": f"Tool result: {content}"},
+}
 
 
 class ModelClient:
     """Unified interface for different AI model providers"""
 
+    # Tool schemas are static for a session; keyed by list identity, holding
+    # the list itself so the id can't be reused while the entry is cached
+    _anthropic_tools_cache: LRUCache[int, tuple[list, list]] = LRUCache(maxsize=8)
+
     def __init__(self, provider: str, api_key: Optional[str] = None):
         self.provider = provider
+        self.client: AsyncOpenAI | AsyncAnthropic
         if provider == "openai":
-            self.client = AsyncOpenAI(api_key=api_key)
+            self.client = get_openai_client(api_key)
         elif provider == "anthropic":
-            try:
-                self.client = AsyncAnthropic(api_key=api_key)
-            except ImportError:
-                raise ImportError(
-                    "anthropic package not installed. Run: pip install anthropic"
-                )
+            self.client = get_anthropic_client(api_key)
         else:
             raise ValueError(f"Unsupported provider: {provider}")
 
@@ -140,18 +164,21 @@ class ModelClient:
         self, messages, tools=None, model=None, **kwargs
     ) -> UnifiedResponse:
         """Unified chat completion interface"""
-        if self.provider == "openai":
-            # Filter out None tools for OpenAI
-            openai_kwargs = kwargs.copy()
+        # Dispatch on the client type so each branch sees its SDK's API
+        client = self.client
+        if isinstance(client, AsyncOpenAI):
+            # kwargs is already a fresh dict; only pass tools when given
             if tools is not None:
-                openai_kwargs["tools"] = tools
+                kwargs["tools"] = tools
 
-            response = await self.client.chat.completions.create(
-                model=model or "gpt-4o-mini", messages=messages, **openai_kwargs
+            response = await retry_transient(
+                lambda: client.chat.completions.create(
+                    model=model or "gpt-4o-mini", messages=messages, **kwargs
+                )
             )
-            return UnifiedResponse("openai", response)
+            return OpenAIResponse(response)
 
-        elif self.provider == "anthropic":
+        elif isinstance(client, AsyncAnthropic):
             # Convert OpenAI format to Anthropic format
             anthropic_messages = self._convert_messages_to_anthropic(messages)
             anthropic_kwargs = {
@@ -169,29 +196,49 @@ class ModelClient:
             if anthropic_tools is not None:
                 create_kwargs["tools"] = anthropic_tools
 
-            response = await self.client.messages.create(**create_kwargs)
-            return UnifiedResponse("anthropic", response)
+            response = await retry_transient(
+                lambda: client.messages.create(**create_kwargs)
+            )
+            return AnthropicResponse(response)
 
         else:
             raise ValueError(f"Unsupported provider: {self.provider}")
 
+    async def chat_completion_many(
+        self, requests: List[dict[str, Any]]
+    ) -> List[UnifiedResponse | BaseException]:
+        """
+        Run several independent chat completions concurrently.
+
+        Args:
+            requests: Keyword arguments for each chat_completion call
+
+        Returns:
+            One response per request, in order; a failed request yields its
+            exception instead of cancelling the others
+        """
+        return await asyncio.gather(
+            *(self.chat_completion(**request) for request in requests),
+            return_exceptions=True,
+        )
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached tool conversions."""
+        cls._anthropic_tools_cache.clear()
+
     def _convert_messages_to_anthropic(self, messages):
         """Convert OpenAI message format to Anthropic format"""
-        anthropic_messages = []
-        system_content = None
+        system_parts: list[str] = []
+        anthropic_messages: list[dict[str, Any]] = []
 
+        # System messages may appear anywhere; collect them in the same pass
         for msg in messages:
             if msg["role"] == "system":
-                system_content = msg["content"]
-            elif msg["role"] in ["user", "assistant"]:
-                anthropic_messages.append(
-                    {"role": msg["role"], "content": msg["content"]}
-                )
-            elif msg["role"] == "tool":
-                # Handle tool responses for Anthropic
-                anthropic_messages.append(
-                    {"role": "user", "content": f"Tool result: {msg['content']}"}
-                )
+                system_parts.append(msg["content"])
+            elif build := ANTHROPIC_MESSAGE_BUILDERS.get(msg["role"]):
+                anthropic_messages.append(build(msg["content"]))
+        system_content = "\n\n".join(system_parts)
 
         # Add system message as first user message if present
         if system_content and anthropic_messages:
@@ -206,6 +253,10 @@ class ModelClient:
         if not tools:
             return None
 
+        cached = self._anthropic_tools_cache.get(id(tools))
+        if cached is not None and cached[0] is tools:
+            return cached[1]
+
         anthropic_tools = []
         for tool in tools:
             if tool["type"] == "function":
@@ -217,4 +268,5 @@ class ModelClient:
                     }
                 )
 
+        self._anthropic_tools_cache.set(id(tools), (tools, anthropic_tools))
         return anthropic_tools
@@ -1,3 +1,4 @@
+import time
 from pydantic import BaseModel, Field
 from datetime import datetime
 
@@ -36,7 +37,13 @@ class AnalysisResult(BaseModel):
     summary: str
     timeline: list[str] = Field(default_factory=list)
     root_cause: str | None = None
-    created_at: datetime = Field(default_factory=datetime.now)
+    # Stored as an int so construction skips datetime creation and validation
+    created_at_ns: int = Field(default_factory=time.time_ns)
+
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as a naive local datetime, like datetime.now()."""
+        return datetime.fromtimestamp(self.created_at_ns / 1e9)
 
 
 # Note: For device data going to LLMs, use raw JSON dicts instead of pydantic models.
@@ -1,4 +1,5 @@
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
 from seam_agent.connectors.seam_api import SeamAPIClient
 from fastmcp import Client
 from fastmcp.client.transports import StdioTransport
@@ -45,15 +46,34 @@ async def analyze_device_issue(device_id: str) -> dict[str, Any]:
 
 
 # Helper functions for MCP client integration (for future use)
+_mcp_client: Client | None = None
+
+
 def create_mcp_client():
     """Creates an MCP client for tool integration."""
     transport = StdioTransport(command="python", args=["assistant/server.py"])
     return Client(transport)
 
 
+@asynccontextmanager
+async def get_mcp_client() -> AsyncIterator[Client]:
+    """
+    Yield the process-wide MCP client, connecting on first use.
+
+    The stdio transport keeps the server subprocess alive between sessions
+    and the client reuses an open session when entered concurrently, so
+    repeated calls don't pay the server startup cost again.
+    """
+    global _mcp_client
+    if _mcp_client is None:
+        _mcp_client = create_mcp_client()
+
+    async with _mcp_client as client:
+        yield client
+
+
 async def call_tool(name: str, device_id: str):
     """Example function for calling MCP tools (for future integration)."""
-    client = create_mcp_client()
-    async with client:
+    async with get_mcp_client() as client:
         result = await client.call_tool("get_device", {"device_id": device_id})
         return result
@@ -2,18 +2,12 @@
 Prompt manager for generating all investigation prompts.
 """
 
-from seam_agent.assistant.query_parser import ParsedQuery
-
+from typing import Final
 
-class PromptManager:
-    """Manages all prompt generation for the investigation."""
+from seam_agent.assistant.query_parser import ParsedQuery
 
-    @staticmethod
-    def get_initial_investigation_prompt(
-        customer_query: str, parsed_query: ParsedQuery
-    ) -> str:
-        """Generate the initial investigation prompt."""
-        return f"""
+# Static prompts are built once at import; the initial prompt is filled with format_map
+INITIAL_INVESTIGATION_TEMPLATE: Final[str] = """
 
 
 Here is the customer query and parsed information:
@@ -23,12 +17,12 @@ Here is the customer query and parsed information:
 </customer_query>
 
 <parsed_info>
-<device_ids>{parsed_query.device_ids}</device_ids>
-<access_codes>{parsed_query.access_codes}</access_codes>
-<time_references>{parsed_query.time_references}</time_references>
-<question_type>{parsed_query.question_type}</question_type>
-<operations>{parsed_query.operations}</operations>
-<summary>{parsed_query.summary}</summary>
+<device_ids>{device_ids}</device_ids>
+<access_codes>{access_codes}</access_codes>
+<time_references>{time_references}</time_references>
+<question_type>{question_type}</question_type>
+<operations>{operations}</operations>
+<summary>{summary}</summary>
 </parsed_info>
 
 Investigation Process:
@@ -62,6 +56,57 @@ Remember: Do not provide final analysis or recommendations until you have gather
 Begin your investigation now, starting with the get_device_info tool.
 """
 
+COMPLETE_ANALYSIS_PROMPT: Final[str] = (
+    "Based on the comprehensive tool results above, you have gathered all required data. Now provide your detailed analysis and recommendations."
+)
+
+FINAL_ANALYSIS_PROMPT: Final[str] = (
+    "Based on all the data you've gathered from the tools above, please provide your detailed analysis and recommendations for this support issue. Include specific findings from the data and actionable next steps."
+)
+
+FOLLOWUP_TOOLS_TEMPLATE: Final[str] = (
+    "Based on the tool results above, please use these specific tools to continue the investigation: {tools}. Focus on gathering additional data to complete the analysis."
+)
+
+NO_FOLLOWUP_TOOLS_PROMPT: Final[str] = (
+    "Based on the tool results above, please provide your analysis of the findings. No additional tools are needed."
+)
+
+INVESTIGATION_COMPLETE_TEMPLATE: Final[str] = (
+    "Based on the tool results above, please provide your detailed analysis and recommendations. Investigation complete: {reasoning}"
+)
+
+SYSTEM_PROMPT: Final[str] = """
+You are Seam's Customer Support Investigation Assistant. Your role is to systematically analyze customer support queries by gathering data from multiple sources and providing structured analysis.
+
+Key Behaviors:
+- Always use tools to gather actual data before analysis
+- Follow investigation steps methodically
+- Format final output to match Seam's internal note structure
+- Provide specific, actionable recommendations
+- Never make assumptions without data to support them
+- When you generate admin links using the get_admin_links tool, always include them in your analysis so they appear in the final formatted note
+
+Tool Usage:
+- Use get_admin_links tool when you have gathered investigation context (device_id, workspace_id, access_codes, etc.) to provide relevant admin page links for further investigation
+- Include the generated admin links in your analysis so support agents have direct access to relevant admin pages
+
+Output Format: Your final response should be a structured internal note suitable for support agents, following the format specified in the user prompt.
+"""
+
+
+class PromptManager:
+    """Manages all prompt generation for the investigation."""
+
+    @staticmethod
+    def get_initial_investigation_prompt(
+        customer_query: str, parsed_query: ParsedQuery
+    ) -> str:
+        """Generate the initial investigation prompt."""
+        return INITIAL_INVESTIGATION_TEMPLATE.format_map(
+            parsed_query.__dict__ | {"customer_query": customer_query}
+        )
+
     @staticmethod
     def get_missing_tools_prompt(
         required_tools: set[str], tools_used: set[str], missing_tools: set[str]
@@ -80,12 +125,27 @@ Do NOT provide analysis until ALL required tools have been used."""
     @staticmethod
     def get_complete_analysis_prompt() -> str:
         """Generate prompt for final analysis when all tools are used."""
-        return "Based on the comprehensive tool results above, you have gathered all required data. Now provide your detailed analysis and recommendations."
+        return COMPLETE_ANALYSIS_PROMPT
 
     @staticmethod
     def get_final_analysis_prompt() -> str:
         """Generate prompt for final analysis after additional tools."""
-        return "Based on all the data you've gathered from the tools above, please provide your detailed analysis and recommendations for this support issue. Include specific findings from the data and actionable next steps."
+        return FINAL_ANALYSIS_PROMPT
+
+    @staticmethod
+    def get_followup_tools_prompt(followup_tools: list[str]) -> str:
+        """Generate prompt asking for specific follow-up tools."""
+        return FOLLOWUP_TOOLS_TEMPLATE.format(tools=", ".join(followup_tools))
+
+    @staticmethod
+    def get_no_followup_tools_prompt() -> str:
+        """Generate prompt for analysis when no follow-up tools are needed."""
+        return NO_FOLLOWUP_TOOLS_PROMPT
+
+    @staticmethod
+    def get_investigation_complete_prompt(reasoning: str) -> str:
+        """Generate prompt for analysis once the investigation is complete."""
+        return INVESTIGATION_COMPLETE_TEMPLATE.format(reasoning=reasoning)
 
     @staticmethod
     def get_format_investigation_note_prompt(raw_analysis: str) -> str:
@@ -128,20 +188,4 @@ Extract the information directly from the analysis above. Keep it concise and ac
     @staticmethod
     def get_system_prompt() -> str:
         """Generate the system prompt that establishes role and behavior."""
-        return """
-You are Seam's Customer Support Investigation Assistant. Your role is to systematically analyze customer support queries by gathering data from multiple sources and providing structured analysis.
-
-Key Behaviors:
-- Always use tools to gather actual data before analysis
-- Follow investigation steps methodically
-- Format final output to match Seam's internal note structure
-- Provide specific, actionable recommendations
-- Never make assumptions without data to support them
-- When you generate admin links using the get_admin_links tool, always include them in your analysis so they appear in the final formatted note
-
-Tool Usage:
-- Use get_admin_links tool when you have gathered investigation context (device_id, workspace_id, access_codes, etc.) to provide relevant admin page links for further investigation
-- Include the generated admin links in your analysis so support agents have direct access to relevant admin pages
-
-Output Format: Your final response should be a structured internal note suitable for support agents, following the format specified in the user prompt.
-"""
+        return SYSTEM_PROMPT
@@ -5,11 +5,18 @@ Extracts structured information from natural language support queries
 using an LLM with structured output.
 """
 
-import json
+import asyncio
+import hashlib
 import os
-from typing import List, Optional
+from typing import Any, Final, List, Optional
+
+import orjson
+from openai.types.shared_params import ResponseFormatJSONSchema
 from pydantic import BaseModel, Field
-from openai import AsyncOpenAI
+
+from seam_agent.assistant.api_clients import get_openai_client
+from seam_agent.assistant.cache import LRUCache
+from seam_agent.assistant.retry import retry_transient
 
 
 class ParsedQuery(BaseModel):
@@ -56,24 +63,25 @@ class ParsedQuery(BaseModel):
     summary: str = Field(description="Brief summary of what the user is asking")
 
 
-class SupportQueryParser:
-    """Parses customer support queries using LLM structured output"""
+def _strict_json_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """Return model's JSON schema in the form OpenAI strict mode accepts."""
+    schema = model.model_json_schema()
+    schema["additionalProperties"] = False
+    schema["required"] = list(schema["properties"])
+    return schema
 
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize with OpenAI API key"""
-        self.client = AsyncOpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
 
-    async def parse(self, query: str) -> ParsedQuery:
-        """
-        Parse a customer support query into structured data.
-
-        Args:
-            query: Natural language support query
+# Built once at import and reused for every parse request
+PARSED_QUERY_RESPONSE_FORMAT: Final[ResponseFormatJSONSchema] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "ParsedQuery",
+        "schema": _strict_json_schema(ParsedQuery),
+        "strict": True,
+    },
+}
 
-        Returns:
-            ParsedQuery with extracted structured information
-        """
-        system_prompt = """
+PARSER_SYSTEM_PROMPT: Final[str] = """
 You are a customer support query parser for Seam, a smart lock API company.
 Extract structured information from customer support queries.
 
@@ -110,24 +118,86 @@ Guidelines:
 - Confidence: 0.9+ if very clear, 0.7-0.9 if somewhat ambiguous, <0.7 if unclear
 """
 
+
+# Longer queries are cached under a digest so keys don't pin whole tickets
+MAX_RAW_CACHE_KEY_LENGTH: Final = 1024
+
+
+def _parse_cache_key(query: str) -> str:
+    """Return the parse cache key for query."""
+    # Whitespace differences don't change the parse, so normalize for the key
+    normalized = " ".join(query.split())
+    if len(normalized) <= MAX_RAW_CACHE_KEY_LENGTH:
+        return normalized
+    digest = hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+    return f"blake2b:{digest}"
+
+
+class SupportQueryParser:
+    """Parses customer support queries using LLM structured output"""
+
+    # Shared across instances: templated and forwarded tickets often repeat
+    _parse_cache: LRUCache[str, ParsedQuery] = LRUCache(maxsize=1024)
+    # Parses in progress, so identical queries parsed concurrently share one request
+    _inflight: dict[str, asyncio.Task[ParsedQuery]] = {}
+
+    def __init__(self, api_key: Optional[str] = None):
+        """Initialize with OpenAI API key"""
+        self.client = get_openai_client(api_key or os.getenv("OPENAI_API_KEY"))
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached parse results."""
+        cls._parse_cache.clear()
+
+    async def parse(self, query: str) -> ParsedQuery:
+        """
+        Parse a customer support query into structured data.
+
+        Args:
+            query: Natural language support query
+
+        Returns:
+            ParsedQuery with extracted structured information
+        """
+        cache_key = _parse_cache_key(query)
+        cached = self._parse_cache.get(cache_key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._parse_uncached(query, cache_key))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+
+        # Shielded so one cancelled caller doesn't cancel the others' parse
+        parsed_query = await asyncio.shield(task)
+        return parsed_query.model_copy(deep=True)
+
+    async def _parse_uncached(self, query: str, cache_key: str) -> ParsedQuery:
+        """Parse query with the LLM, caching successful results under cache_key."""
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4o-mini",  # Using mini for cost efficiency
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {
-                        "role": "user",
-                        "content": f"Parse this support query:\n\n{query}",
-                    },
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.1,  # Low temperature for consistent parsing
+            # Transient API failures are retried before falling back
+            response = await retry_transient(
+                lambda: self.client.chat.completions.create(
+                    model="gpt-4o-mini",  # Using mini for cost efficiency
+                    messages=[
+                        {"role": "system", "content": PARSER_SYSTEM_PROMPT},
+                        {
+                            "role": "user",
+                            "content": f"Parse this support query:\n\n{query}",
+                        },
+                    ],
+                    response_format=PARSED_QUERY_RESPONSE_FORMAT,
+                    temperature=0.1,  # Low temperature for consistent parsing
+                )
             )
 
-            # Parse the JSON response
-            parsed_data = json.loads(response.choices[0].message.content)
-            return ParsedQuery(**parsed_data)
-
+            # Parse the JSON response; a refusal has no content and falls back
+            parsed_data = orjson.loads(response.choices[0].message.content or "")
+            # The schema is enforced server-side, so skip re-validation
+            parsed_query = ParsedQuery.model_construct(**parsed_data)
         except Exception as e:
             # Fallback with minimal parsing if LLM fails
             return ParsedQuery(
@@ -136,6 +206,10 @@ Guidelines:
                 summary=f"Failed to parse query: {str(e)}",
             )
 
+        # Only successful parses are cached
+        self._parse_cache.set(cache_key, parsed_query)
+        return parsed_query
+
 
 # Example usage and testing
 async def test_parser():
@@ -0,0 +1,64 @@
+"""
+Retry with backoff for transient model API failures.
+"""
+
+import asyncio
+import random
+from typing import Awaitable, Callable, TypeVar
+
+import anthropic
+import openai
+
+T = TypeVar("T")
+
+# Rate limits, dropped connections and timeouts (APITimeoutError subclasses
+# APIConnectionError) and 5xx responses usually clear up on their own; anything
+# else (bad request, auth) fails the same way on every attempt. Anthropic's 529
+# raises OverloadedError, which is not an InternalServerError subclass.
+TRANSIENT_ERRORS: tuple[type[BaseException], ...] = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    anthropic.RateLimitError,
+    anthropic.APIConnectionError,
+    anthropic.InternalServerError,
+    anthropic.OverloadedError,
+)
+
+
+async def retry_transient(
+    call: Callable[[], Awaitable[T]],
+    *,
+    attempts: int = 4,
+    initial_delay: float = 1.0,
+    max_delay: float = 30.0,
+    retry_on: tuple[type[BaseException], ...] = TRANSIENT_ERRORS,
+) -> T:
+    """
+    Await call(), retrying transient failures with jittered exponential backoff.
+
+    Args:
+        call: Zero-argument coroutine factory; invoked once per attempt
+        attempts: Maximum number of attempts, including the first
+        initial_delay: Delay before the first retry, doubled after each one
+        max_delay: Upper bound on any single delay
+        retry_on: Exception types that trigger a retry
+
+    Returns:
+        The result of the first successful attempt
+
+    Raises:
+        The last exception once attempts are exhausted, or any exception
+        not listed in retry_on immediately
+    """
+    attempt = 1
+    while True:
+        try:
+            return await call()
+        except retry_on:
+            if attempt >= attempts:
+                raise
+
+        delay = initial_delay * 2 ** (attempt - 1) + random.uniform(0, initial_delay)
+        await asyncio.sleep(min(delay, max_delay))
+        attempt += 1
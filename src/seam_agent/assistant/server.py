@@ -1,47 +1,262 @@
+import asyncio
+import copy
+import functools
+import inspect
 import os
 import logging
-from typing import Any
+import sys
+from collections import Counter
+from contextlib import asynccontextmanager
+from itertools import groupby
+from operator import itemgetter
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Hashable,
+    TypeGuard,
+    get_args,
+)
 from datetime import datetime
+import orjson
 from fastmcp import FastMCP
+from fastmcp.server.server import Transport
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
 from seam_agent.connectors.seam_api import SeamAPIClient
 from seam_agent.connectors.quickwit import QuickwitClient
-from seam_agent.connectors.db import DatabaseClient
+from seam_agent.connectors.db import DatabaseClient, close_pools
+from seam_agent.connectors.http import aclose_http_client
+from seam_agent.assistant.batch_loader import BatchLoader
+from seam_agent.assistant.cache import TTLCache
+from seam_agent.assistant.event_loop import install_uvloop
 
 # Check for required environment variables
 SEAM_API_KEY = os.getenv("SEAM_API_KEY")
 if not SEAM_API_KEY:
     raise ValueError("SEAM_API_KEY environment variable is required")
 
-# Quickwit variables are checked when tools are called
+# Quickwit and database variables are read once here but checked when tools
+# that need them are called
 QUICKWIT_URL = os.getenv("QUICKWIT_URL")
 QUICKWIT_API_KEY = os.getenv("QUICKWIT_API_KEY")
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+# "stdio" by default; "http" serves streamable HTTP with gzip-compressed
+# responses, since device and log listings can run to megabytes of JSON
+MCP_TRANSPORT = os.getenv("SEAM_MCP_TRANSPORT", "stdio")
+
+
+def is_mcp_transport(value: str) -> TypeGuard[Transport]:
+    """Check that value names a transport FastMCP can serve."""
+    return value in get_args(Transport)
+
+
+def require_env(name: str, value: str | None) -> str:
+    """Return value, or raise if the environment variable name was not set."""
+    if not value:
+        raise ValueError(f"{name} environment variable is required")
+    return value
+
+
+# Connector clients are created on first use and shared by every tool call,
+# so the database pool and HTTP connections outlive individual requests
+_seam_client: SeamAPIClient | None = None
+_quickwit_client: QuickwitClient | None = None
+_db_client: DatabaseClient | None = None
+# Created in the lifespan, so it belongs to the loop the server runs on
+_db_client_lock: asyncio.Lock | None = None
+
+
+def get_seam_client() -> SeamAPIClient:
+    """Return the shared Seam API client."""
+    global _seam_client
+    if _seam_client is None:
+        _seam_client = SeamAPIClient(SEAM_API_KEY)
+    return _seam_client
+
+
+def get_quickwit_client() -> QuickwitClient:
+    """Return the shared Quickwit client.
+
+    Raises:
+        ValueError: If QUICKWIT_URL or QUICKWIT_API_KEY is not set
+    """
+    global _quickwit_client
+    if _quickwit_client is None:
+        if not QUICKWIT_URL or not QUICKWIT_API_KEY:
+            raise ValueError(
+                "QUICKWIT_URL and QUICKWIT_API_KEY environment variables are required"
+            )
+        _quickwit_client = QuickwitClient(QUICKWIT_URL, QUICKWIT_API_KEY)
+    return _quickwit_client
+
+
+async def get_db_client() -> DatabaseClient:
+    """Return the shared database client, opening its pool on first use."""
+    global _db_client, _db_client_lock
+    if _db_client is None:
+        if _db_client_lock is None:  # e.g. called outside the server lifespan
+            _db_client_lock = asyncio.Lock()
+        async with _db_client_lock:
+            if _db_client is None:
+                db_client = DatabaseClient(require_env("DATABASE_URL", DATABASE_URL))
+                await db_client.connect()
+                _db_client = db_client
+    return _db_client
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Set up shared connector state, and close the clients on shutdown."""
+    global _db_client, _db_client_lock
+    # stdout carries the MCP stdio protocol, so status messages go to stderr
+    print("🔧 Initializing Seam Device Resources...", file=sys.stderr)
+    _db_client_lock = asyncio.Lock()
+    try:
+        yield
+    finally:
+        _db_client = None
+        await close_pools()
+        await aclose_http_client()
+
+
+def serialize_tool_result(data: Any) -> str:
+    """Serialize tool results with orjson; device and log payloads can be large."""
+    return orjson.dumps(
+        data,
+        default=str,
+        option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS,
+    ).decode("utf-8")
 
-print("🔧 Initializing Seam Device Resources...")
 
 # Create MCP server
-mcp = FastMCP("Seam Device Resources")
+mcp = FastMCP(
+    "Seam Device Resources", lifespan=lifespan, tool_serializer=serialize_tool_result
+)
+
+# Devices and find lookups are repeated within an investigation; cache them briefly
+RESOURCE_CACHE_ENABLED = os.getenv("SEAM_RESOURCE_CACHE_ENABLED", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+_resource_cache: TTLCache[str, Any] = TTLCache(
+    maxsize=int(os.getenv("SEAM_RESOURCE_CACHE_MAX_ENTRIES", "1000")),
+    ttl=float(os.getenv("SEAM_RESOURCE_CACHE_TTL", "300")),
+)
+_find_cache: TTLCache[str, Any] = TTLCache(
+    maxsize=int(os.getenv("SEAM_RESOURCE_CACHE_MAX_ENTRIES", "1000")),
+    ttl=float(os.getenv("SEAM_FIND_CACHE_TTL", "60")),
+)
+# The database schema rarely changes, so introspect it at most once per TTL
+_schema_cache: TTLCache[str, str] = TTLCache(
+    maxsize=1, ttl=float(os.getenv("SEAM_SCHEMA_CACHE_TTL", "300"))
+)
+# In-flight fetches, so concurrent identical requests share a single upstream call
+_inflight: dict[Hashable, asyncio.Task] = {}
+resource_cache_stats: Counter[str] = Counter()
+
+
+async def single_flight(
+    key: Hashable, fetch: Callable[[], Coroutine[Any, Any, Any]]
+) -> Any:
+    """
+    Await fetch(), or join an identical fetch that is already running.
+
+    Args:
+        key: Identifies the request; equal keys share one call
+        fetch: Starts the request when nothing is in flight for key
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(fetch())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+
+    # Shielded so one cancelled caller doesn't cancel the shared fetch
+    return await asyncio.shield(task)
+
+
+def cached_resource(key_template: str, cache: TTLCache[str, Any] = _resource_cache):
+    """
+    Cache a coroutine's result under a key built from its arguments.
+
+    Args:
+        key_template: Cache key (the resource URI for resources), with
+            placeholders named after the function's parameters
+        cache: Cache to store results in; its TTL decides freshness
+    """
+
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            if not RESOURCE_CACHE_ENABLED:
+                return await fn(*args, **kwargs)
+
+            key = key_template.format_map(signature.bind(*args, **kwargs).arguments)
+            cached = cache.get(key)
+            if cached is not None:
+                resource_cache_stats["hits"] += 1
+                logging.debug("Resource cache hit: %s", key)
+                return copy.deepcopy(cached)
+
+            resource_cache_stats["misses"] += 1
+            logging.debug("Resource cache miss: %s", key)
+            result = await single_flight(key, lambda: fn(*args, **kwargs))
+            cache.set(key, result)
+            # Callers get their own copy so mutating it can't alter the cache
+            return copy.deepcopy(result)
+
+        return wrapper
+
+    return decorator
 
 
 @mcp.resource("seam://devices")
+@cached_resource("seam://devices")
 async def list_all_devices() -> list[dict[str, Any]]:
     """
     List all devices from Seam API.
     Returns raw JSON device data suitable for LLM processing.
     """
-    async with SeamAPIClient(SEAM_API_KEY) as client:
-        devices = await client.list_devices()
-        return devices
+    client = get_seam_client()
+    devices = await client.list_devices()
+    return devices
 
 
 @mcp.resource("seam://devices/{device_id}")
+@cached_resource("seam://devices/{device_id}")
 async def get_device_by_id(device_id: str) -> dict[str, Any]:
     """
     Get a specific device by its ID.
     Returns raw JSON device data suitable for LLM processing.
     """
-    async with SeamAPIClient(SEAM_API_KEY) as client:
-        device = await client.get_device(device_id=device_id)
-        return device
+    client = get_seam_client()
+    device = await client.get_device(device_id=device_id)
+    return device
+
+
+@mcp.tool
+async def list_devices_page(
+    cursor: str | None = None, page_size: int = 200
+) -> dict[str, Any]:
+    """
+    List devices one page at a time, for workspaces too large to read at once.
+    Returns raw JSON device data suitable for LLM processing.
+
+    Args:
+        cursor: `next_cursor` from the previous page; omit for the first page
+        page_size: Maximum number of devices to return in this page
+
+    Returns:
+        A dictionary with `devices` and `next_cursor` (None on the last page).
+    """
+    client = get_seam_client()
+    return await client.list_devices_page(page_size=page_size, page_cursor=cursor)
 
 
 # For filtered searches, let's use a tool instead since FastMCP resources
@@ -67,16 +282,16 @@ async def search_devices(
         limit: Maximum number of devices to return (default 500)
         search: Search string for device name/ID
     """
-    async with SeamAPIClient(SEAM_API_KEY) as client:
-        devices = await client.list_devices(
-            device_type=device_type,
-            manufacturer=manufacturer,
-            connected_account_id=connected_account_id,
-            device_ids=device_ids,
-            limit=limit,
-            search=search,
-        )
-        return devices
+    client = get_seam_client()
+    devices = await client.list_devices(
+        device_type=device_type,
+        manufacturer=manufacturer,
+        connected_account_id=connected_account_id,
+        device_ids=device_ids,
+        limit=limit,
+        search=search,
+    )
+    return devices
 
 
 @mcp.tool
@@ -93,9 +308,14 @@ async def find_resources(search: str) -> dict[str, Any]:
         The response includes arrays for: devices, users, spaces, action_attempts, client_sessions,
         acs_entrances, acs_systems, acs_users, and other resource types.
     """
-    async with SeamAPIClient(SEAM_API_KEY) as client:
-        batch = await client.find_resources(search=search)
-        return batch
+    return await _find_resources(search)
+
+
+@cached_resource("find:{search}", _find_cache)
+async def _find_resources(search: str) -> dict[str, Any]:
+    """Look up resources via the find endpoint, sharing recent results."""
+    client = get_seam_client()
+    return await client.find_resources(search=search)
 
 
 @mcp.tool
@@ -110,9 +330,25 @@ async def get_action_attempt(action_attempt_id: str) -> dict[str, Any]:
         Action attempt dictionary with detailed information about the attempt,
         including status, error messages, timestamps, and related device info.
     """
-    async with SeamAPIClient(SEAM_API_KEY) as client:
-        action_attempt = await client.get_action_attempt(action_attempt_id)
-        return action_attempt
+    # Concurrent calls in one turn are coalesced into a single list request
+    try:
+        return await action_attempt_loader.load(action_attempt_id)
+    except LookupError:
+        raise ValueError(f"Action attempt '{action_attempt_id}' not found")
+
+
+async def _load_action_attempts(
+    action_attempt_ids: list[str],
+) -> dict[str, dict[str, Any]]:
+    """Fetch action attempts by ID for the batch loader."""
+    client = get_seam_client()
+    action_attempts = await client.list_action_attempts(action_attempt_ids)
+    return {attempt["action_attempt_id"]: attempt for attempt in action_attempts}
+
+
+action_attempt_loader: BatchLoader[str, dict[str, Any]] = BatchLoader(
+    _load_action_attempts
+)
 
 
 @mcp.tool
@@ -127,48 +363,73 @@ async def list_action_attempts(action_attempt_ids: list[str]) -> list[dict[str,
         List of action attempt dictionaries with detailed information.
         Useful for analyzing patterns across multiple attempts.
     """
-    async with SeamAPIClient(SEAM_API_KEY) as client:
-        action_attempts = await client.list_action_attempts(action_attempt_ids)
-        return action_attempts
+    client = get_seam_client()
+    action_attempts = await client.list_action_attempts(action_attempt_ids)
+    return action_attempts
+
+
+# Fields present on a full action attempt but not on a search summary
+ACTION_ATTEMPT_DETAIL_FIELDS = frozenset({"status", "action_type", "result", "error"})
 
 
 @mcp.tool(enabled=False)
-async def find_device_action_attempts(device_id: str) -> list[dict[str, Any]]:
+async def find_device_action_attempts(
+    device_id: str, detailed: bool = True
+) -> list[dict[str, Any]]:
     """
     Find action attempts related to a specific device using universal search.
 
     This is a helper tool that uses the find_resources endpoint to locate
-    action attempts associated with a device, then fetches their details.
+    action attempts associated with a device, then fetches details for any
+    the search only returned in summary form.
 
     Args:
         device_id: The device ID to find action attempts for
+        detailed: Fetch full details for each attempt; pass False when the
+            summaries from the search (e.g. to check whether any exist) suffice
 
     Returns:
         List of action attempt dictionaries related to the device.
         Essential for device investigation and timeline reconstruction.
     """
-    async with SeamAPIClient(SEAM_API_KEY) as client:
-        # First, use find_resources to search for action attempts related to the device
-        search_results = await client.find_resources(device_id)
+    client = get_seam_client()
+    # First, use find_resources to search for action attempts related to the device
+    search_results = await _find_resources(device_id)
 
-        # Extract action attempt IDs from the search results
-        action_attempts = search_results.get("action_attempts", [])
+    # Extract action attempt IDs from the search results
+    action_attempts: list[dict[str, Any]] = search_results.get("action_attempts", [])
 
-        if not action_attempts:
-            return []
+    if not action_attempts:
+        return []
+    if not detailed:
+        return action_attempts
 
-        # Get the IDs and fetch full details
-        action_attempt_ids = [
-            attempt.get("action_attempt_id")
-            for attempt in action_attempts
-            if attempt.get("action_attempt_id")
-        ]
+    # Search results can already be full attempts; only fetch the ones that aren't
+    missing_ids = [
+        attempt["action_attempt_id"]
+        for attempt in action_attempts
+        if attempt.get("action_attempt_id")
+        and not ACTION_ATTEMPT_DETAIL_FIELDS.issubset(attempt)
+    ]
+    if not missing_ids:
+        return action_attempts
 
-        if action_attempt_ids:
-            detailed_attempts = await client.list_action_attempts(action_attempt_ids)
-            return detailed_attempts
+    detailed_attempts = {
+        attempt["action_attempt_id"]: attempt
+        for attempt in await client.list_action_attempts(missing_ids)
+    }
+    return [
+        detailed_attempts.get(attempt.get("action_attempt_id"), attempt)
+        for attempt in action_attempts
+    ]
 
-        return action_attempts
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a trailing Z for UTC."""
+    if timestamp.endswith("Z"):
+        timestamp = timestamp[:-1] + "+00:00"
+    return datetime.fromisoformat(timestamp)
 
 
 @mcp.tool
@@ -178,8 +439,8 @@ async def search_logs(
     start_time: str | None = None,
     end_time: str | None = None,
     limit: int = 10,
-    offset: int = 0,
-) -> list[dict[str, Any]]:
+    search_after: str | None = None,
+) -> dict[str, Any]:
     """
     Search logs in a Quickwit index with a flexible query.
 
@@ -232,41 +493,32 @@ async def search_logs(
         start_time: Optional start time in ISO 8601 format (e.g., '2023-01-01T00:00:00Z').
         end_time: Optional end time in ISO 8601 format (e.g., '2023-01-01T23:59:59Z').
         limit: Maximum number of log entries to return.
-        offset: Number of log entries to skip from the beginning.
+        search_after: Cursor from `next_search_after` of a previous call to get
+                      the next page of older entries.
 
     Returns:
-        A list of log entries matching the search criteria.
+        A dictionary with `logs` (matching entries, newest first) and
+        `next_search_after` (cursor for the next page, or None if this was the last).
     """
-    # Validate Quickwit environment variables
-    quickwit_url = os.getenv("QUICKWIT_URL")
-    quickwit_api_key = os.getenv("QUICKWIT_API_KEY")
-    if not quickwit_url or not quickwit_api_key:
-        raise ValueError(
-            "QUICKWIT_URL and QUICKWIT_API_KEY environment variables are required"
-        )
-
-    async with QuickwitClient(quickwit_url, quickwit_api_key) as client:
-        # Parse datetime strings if provided
-        start_dt = (
-            datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-            if start_time
-            else None
-        )
-        end_dt = (
-            datetime.fromisoformat(end_time.replace("Z", "+00:00"))
-            if end_time
-            else None
-        )
-
-        logs = await client.search_logs(
+    # Raises if the Quickwit environment variables are missing
+    client = get_quickwit_client()
+    # Parse datetime strings if provided
+    start_dt = _parse_iso(start_time) if start_time else None
+    end_dt = _parse_iso(end_time) if end_time else None
+
+    # Identical searches issued concurrently share one Quickwit request
+    logs, next_search_after = await single_flight(
+        ("search_logs", index, query, start_time, end_time, limit, search_after),
+        lambda: client.search_logs(
             index=index,
             query=query,
             start_time=start_dt,
             end_time=end_dt,
             limit=limit,
-            start_offset=offset,
-        )
-        return logs
+            search_after=search_after,
+        ),
+    )
+    return {"logs": logs, "next_search_after": next_search_after}
 
 
 # Simplified database access using our existing DatabaseClient
@@ -300,15 +552,12 @@ async def query_database(sql: str) -> list[dict[str, Any]]:
         - "SELECT * FROM seam.action_attempt WHERE device_id = 'c00718ad-4e66-45c4-a517-28fb3394c28d' ORDER BY created_at DESC LIMIT 10"
         - "SELECT d.device_type, d.nickname, aa.action_type, aa.status, aa.error FROM seam.device d JOIN seam.action_attempt aa ON d.device_id = aa.device_id WHERE d.device_id = 'c00718ad-4e66-45c4-a517-28fb3394c28d'"
     """
-    # Validate database environment variables
-    database_url = os.getenv("DATABASE_URL")
-    if not database_url:
-        raise ValueError("DATABASE_URL environment variable is required")
+    require_env("DATABASE_URL", DATABASE_URL)
 
     try:
-        async with DatabaseClient() as db_client:
-            results = await db_client.execute_safe_query(sql, [])
-            return results
+        db_client = await get_db_client()
+        results = await db_client.execute_safe_query(sql, [])
+        return results
     except ImportError as e:
         raise ValueError(
             f"Database functionality not available: {e}. Install with: pip install asyncpg"
@@ -331,82 +580,107 @@ async def get_database_schema() -> str:
     This enables the LLM to craft intelligent queries based on the actual
     database structure, not assumptions.
     """
-    # Validate database environment variables
-    database_url = os.getenv("DATABASE_URL")
-    if not database_url:
-        raise ValueError("DATABASE_URL environment variable is required")
+    require_env("DATABASE_URL", DATABASE_URL)
 
     try:
-        async with DatabaseClient() as db_client:
-            # Get all tables in the seam and diagnostics schemas (focus on Seam application and diagnostics tables)
-            # Filter out the massive public_log_entry_* tables that cause token explosion
-            tables_query = """
-            SELECT table_schema, table_name
-            FROM information_schema.tables
-            WHERE table_schema IN ('seam', 'diagnostics')
-            AND table_type = 'BASE TABLE'
-            AND table_name NOT LIKE 'public_log_entry_%'  -- Filter out massive log tables
-            AND table_name NOT LIKE 'job_log_%'          -- Filter out job log tables too
-            ORDER BY
-                CASE WHEN table_schema = 'seam' THEN 1
-                     WHEN table_schema = 'diagnostics' THEN 2
-                     ELSE 3 END,
-                table_name;
-            """
-            tables = await db_client.execute_safe_query(tables_query, [])
-
-            schema_info = "# Live Database Schema\n\n"
-
-            for table in tables:
-                table_schema = table["table_schema"]
-                table_name = table["table_name"]
-                full_table_name = f"{table_schema}.{table_name}"
-                schema_info += f"## {full_table_name}\n"
-
-                # Use parameterized query for safety
-                columns = await db_client.execute_safe_query(
-                    f"SELECT column_name, data_type, is_nullable, column_default, character_maximum_length FROM information_schema.columns WHERE table_schema = '{table_schema}' AND table_name = '{table_name}' ORDER BY ordinal_position",
-                    [],
-                )
-
-                for col in columns:
-                    nullable = "NULL" if col["is_nullable"] == "YES" else "NOT NULL"
-                    data_type = col["data_type"]
-                    if col["character_maximum_length"]:
-                        data_type += f"({col['character_maximum_length']})"
-
-                    schema_info += f"- {col['column_name']} ({data_type}, {nullable})"
-                    if col["column_default"]:
-                        schema_info += f" DEFAULT {col['column_default']}"
-                    schema_info += "\n"
-
-                # Get primary key information
-                pk_query = f"""
-                SELECT column_name
-                FROM information_schema.key_column_usage
-                WHERE table_schema = '{table_schema}'
-                  AND table_name = '{table_name}'
-                  AND constraint_name = (SELECT constraint_name
-                                         FROM information_schema.table_constraints
-                                         WHERE table_schema = '{table_schema}'
-                                           AND table_name = '{table_name}'
-                                           AND constraint_type = 'PRIMARY KEY');
-                """
-
-                try:
-                    pk_cols = await db_client.execute_safe_query(pk_query, [])
-                    if pk_cols:
-                        pk_names = [col["column_name"] for col in pk_cols]
-                        schema_info += f"**Primary Key:** {', '.join(pk_names)}\n"
-                except Exception as e:
-                    logging.warning(
-                        f"Could not retrieve primary key for {full_table_name}: {e}"
-                    )
-
-                schema_info += "\n"
-
-            # Add some helpful query examples
-            schema_info += """
+        return await _introspect_database_schema()
+    except ImportError as e:
+        return f"Database functionality not available: {e}. Install with: pip install asyncpg"
+    except Exception as e:
+        return f"Error introspecting database schema: {e}"
+
+
+@cached_resource("database-schema", _schema_cache)
+async def _introspect_database_schema() -> str:
+    """Build the schema description for DATABASE_URL, reused until the TTL expires."""
+    db_client = await get_db_client()
+    # Get all tables in the seam and diagnostics schemas (focus on Seam application and diagnostics tables)
+    # Filter out the massive public_log_entry_* tables that cause token explosion
+    tables_filter = """
+    SELECT table_schema, table_name
+    FROM information_schema.tables
+    WHERE table_schema IN ('seam', 'diagnostics')
+    AND table_type = 'BASE TABLE'
+    AND table_name NOT LIKE 'public_log_entry_%'  -- Filter out massive log tables
+    AND table_name NOT LIKE 'job_log_%'          -- Filter out job log tables too
+    """
+    tables_query = f"""{tables_filter}
+    ORDER BY
+        CASE WHEN table_schema = 'seam' THEN 1
+             WHEN table_schema = 'diagnostics' THEN 2
+             ELSE 3 END,
+        table_name;
+    """
+    # Columns and primary keys for all tables at once, grouped per table
+    # below, so introspection costs three queries regardless of table count
+    columns_query = f"""
+    SELECT table_schema, table_name, column_name, data_type, is_nullable,
+           column_default, character_maximum_length
+    FROM information_schema.columns
+    WHERE (table_schema, table_name) IN ({tables_filter})
+    ORDER BY table_schema, table_name, ordinal_position
+    """
+    pk_query = """
+    SELECT kcu.table_schema, kcu.table_name, kcu.column_name
+    FROM information_schema.table_constraints tc
+    JOIN information_schema.key_column_usage kcu
+      ON kcu.constraint_schema = tc.constraint_schema
+     AND kcu.constraint_name = tc.constraint_name
+     AND kcu.table_schema = tc.table_schema
+     AND kcu.table_name = tc.table_name
+    WHERE tc.constraint_type = 'PRIMARY KEY'
+      AND tc.table_schema IN ('seam', 'diagnostics')
+    ORDER BY kcu.table_schema, kcu.table_name, kcu.ordinal_position
+    """
+
+    tables, columns, pk_cols = await asyncio.gather(
+        db_client.execute_safe_query(tables_query, []),
+        db_client.execute_safe_query(columns_query, []),
+        db_client.execute_safe_query(pk_query, []),
+        return_exceptions=True,
+    )
+    if isinstance(tables, BaseException):
+        raise tables
+    if isinstance(columns, BaseException):
+        raise columns
+    if isinstance(pk_cols, BaseException):
+        logging.warning(f"Could not retrieve primary keys: {pk_cols}")
+        pk_cols = []
+
+    table_key = itemgetter("table_schema", "table_name")
+    columns_by_table = {
+        key: list(rows) for key, rows in groupby(columns, key=table_key)
+    }
+    pk_names_by_table = {
+        key: [row["column_name"] for row in rows]
+        for key, rows in groupby(pk_cols, key=table_key)
+    }
+
+    schema_info = "# Live Database Schema\n\n"
+
+    for table in tables:
+        full_table_name = f"{table['table_schema']}.{table['table_name']}"
+        schema_info += f"## {full_table_name}\n"
+
+        for col in columns_by_table.get(table_key(table), []):
+            nullable = "NULL" if col["is_nullable"] == "YES" else "NOT NULL"
+            data_type = col["data_type"]
+            if col["character_maximum_length"]:
+                data_type += f"({col['character_maximum_length']})"
+
+            schema_info += f"- {col['column_name']} ({data_type}, {nullable})"
+            if col["column_default"]:
+                schema_info += f" DEFAULT {col['column_default']}"
+            schema_info += "\n"
+
+        pk_names = pk_names_by_table.get(table_key(table))
+        if pk_names:
+            schema_info += f"**Primary Key:** {', '.join(pk_names)}\n"
+
+        schema_info += "\n"
+
+    # Add some helpful query examples
+    schema_info += """
 ## Common Query Patterns
 
 ```sql
@@ -423,14 +697,18 @@ WHERE column_name = 'device_id' AND table_schema = 'public';
 ```
 """
 
-            return schema_info
-
-    except ImportError as e:
-        return f"Database functionality not available: {e}. Install with: pip install asyncpg"
-    except Exception as e:
-        return f"Error introspecting database schema: {e}"
+    return schema_info
 
 
 if __name__ == "__main__":
-    print("🚀 Starting Seam MCP server...")
-    mcp.run()
+    print("🚀 Starting Seam MCP server...", file=sys.stderr)
+    install_uvloop()
+    if not is_mcp_transport(MCP_TRANSPORT):
+        raise ValueError(f"Unsupported SEAM_MCP_TRANSPORT: {MCP_TRANSPORT}")
+    if MCP_TRANSPORT == "stdio":
+        mcp.run()
+    else:
+        mcp.run(
+            transport=MCP_TRANSPORT,
+            middleware=[Middleware(GZipMiddleware, minimum_size=1024)],
+        )
@@ -7,7 +7,9 @@ Starts with just query parsing and will incrementally add tool calling.
 import asyncio
 import os
 import time
-from typing import Any
+from typing import Any, Callable
+
+import orjson
 from anthropic import AsyncAnthropic
 from anthropic.types import (
     ToolParam,
@@ -17,9 +19,12 @@ from anthropic.types import (
     ToolResultBlockParam,
     ToolUseBlock,
 )
+from anthropic.types.message_create_params import MessageCreateParamsNonStreaming
 
+from seam_agent.assistant.api_clients import aclose_api_clients, get_anthropic_client
 from seam_agent.assistant.query_parser import SupportQueryParser, ParsedQuery
-from seam_agent.connectors.db import DatabaseClient
+from seam_agent.connectors.db import DatabaseClient, close_pools
+from seam_agent.connectors.http import aclose_http_client
 from seam_agent.connectors.seam_api import SeamAPIClient
 from seam_agent.assistant.tool_registry import ToolRegistry
 from seam_agent.assistant.dynamic_tool_selector import DynamicToolSelector
@@ -55,9 +60,8 @@ class SimpleInvestigator:
         log_format: str = "human",
         config: InvestigationConfig | None = None,
     ):
-        self.anthropic = AsyncAnthropic(
-            api_key=api_key or os.getenv("ANTHROPIC_API_KEY")
-        )
+        # Shared per API key, so concurrent investigations reuse connections
+        self.anthropic = get_anthropic_client(api_key or os.getenv("ANTHROPIC_API_KEY"))
         self.db_client = DatabaseClient()
         self.seam_client = SeamAPIClient()
         self.query_parser = SupportQueryParser()
@@ -85,22 +89,103 @@ class SimpleInvestigator:
             self.tool_registry, self.prompt_manager
         )
         self.tool_orchestrator = ToolOrchestrator(
-            self.db_client, self.seam_client, self.logger
+            self.db_client,
+            self.seam_client,
+            self.logger,
+            max_concurrent_db_tools=self.config.MAX_CONCURRENT_DB_TOOLS,
         )
 
         # Get tool definitions from orchestrator
         self.tools = self.tool_orchestrator.get_tool_definitions()
 
-    async def investigate(self, customer_query: str) -> dict[str, Any]:
+    async def investigate(
+        self, customer_query: str, on_text: Callable[[str], None] | None = None
+    ) -> dict[str, Any]:
         """
         Investigate a customer support query.
 
         Args:
             customer_query: Natural language customer support query
+            on_text: Optional callback receiving the investigation note text as
+                it streams in, so a UI can render it before the call completes
+
+        Returns:
+            Dict with parsed query info and formatted investigation note
+        """
+        return await self._run_investigation(customer_query, on_text=on_text)
+
+    async def continue_from_batch_result(
+        self,
+        customer_query: str,
+        parsed_query: ParsedQuery,
+        initial_response: Message | None,
+    ) -> dict[str, Any]:
+        """
+        Finish an investigation whose initial round was answered by the Message Batches API.
+
+        Args:
+            customer_query: Natural language customer support query
+            parsed_query: The parsed query used to build the batched request
+            initial_response: The message returned for the batched initial request,
+                or None to send the initial request directly (e.g. when the batch
+                item errored or expired)
 
         Returns:
             Dict with parsed query info and formatted investigation note
         """
+        return await self._run_investigation(
+            customer_query, parsed_query, initial_response
+        )
+
+    def build_initial_request(
+        self, original_query: str, parsed_query: ParsedQuery
+    ) -> MessageCreateParamsNonStreaming:
+        """Build the parameters for the initial Anthropic request of an investigation."""
+        return self._initial_request(
+            self._build_initial_prompt(original_query, parsed_query)
+        )
+
+    def _build_initial_prompt(
+        self, original_query: str, parsed_query: ParsedQuery
+    ) -> str:
+        """Build the initial investigation prompt, with tool guidance."""
+        # Initialize dynamic tool selection for this investigation
+        initial_tools = self.dynamic_tool_selector.select_initial_tools(
+            parsed_query, original_query
+        )
+        self.logger.info(
+            f"Dynamic tool selection recommends initial tools: {initial_tools}",
+            LogContext.TOOL_EXECUTION,
+        )
+
+        prompt = self.prompt_manager.get_initial_investigation_prompt(
+            original_query, parsed_query
+        )
+
+        # Add tool guidance to the prompt
+        if initial_tools:
+            tool_guidance = f"\n\nBased on the query analysis, consider using these tools for investigation: {', '.join(initial_tools)}"
+            prompt += tool_guidance
+
+        return prompt
+
+    def _initial_request(self, prompt: str) -> MessageCreateParamsNonStreaming:
+        """Build the initial Anthropic request parameters for prompt."""
+        return {
+            "model": "claude-sonnet-4-20250514",
+            "max_tokens": 2000,
+            "tools": self.tools,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    async def _run_investigation(
+        self,
+        customer_query: str,
+        parsed_query: ParsedQuery | None = None,
+        initial_response: Message | None = None,
+        on_text: Callable[[str], None] | None = None,
+    ) -> dict[str, Any]:
+        """Run an investigation, optionally resuming from a precomputed first round."""
         # Initialize investigation state and tracking
         investigation_state = InvestigationState()
         investigation_state.start_time = time.time()
@@ -113,23 +198,23 @@ class SimpleInvestigator:
         )
 
         # Initialize defaults in case of early errors
-        parsed_query = None
         formatted_investigation = "Investigation not completed"
         raw_analysis = "No analysis available"
 
         try:
             # Step 1: Parse the query to extract structured information
-            parsed_query = await self.query_parser.parse(customer_query)
+            if parsed_query is None:
+                parsed_query = await self.query_parser.parse(customer_query)
             self.logger.query_parsed(parsed_query.__dict__, parsed_query.confidence)
 
             # Step 2: Use Anthropic with tools to investigate
             raw_analysis = await self._investigate_with_tools(
-                customer_query, parsed_query, investigation_state
+                customer_query, parsed_query, investigation_state, initial_response
             )
 
             # Step 3: Format the investigation into a structured internal note
             formatted_investigation = await self._format_investigation_note(
-                raw_analysis
+                raw_analysis, on_text
             )
 
             # Complete investigation logging
@@ -279,34 +364,20 @@ Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
         original_query: str,
         parsed_query: ParsedQuery,
         investigation_state: InvestigationState,
+        initial_response: Message | None = None,
     ) -> str:
         """Use Anthropic with tools to investigate the customer query."""
 
-        # Initialize dynamic tool selection for this investigation
-        initial_tools = self.dynamic_tool_selector.select_initial_tools(
-            parsed_query, original_query
-        )
-        self.logger.info(
-            f"Dynamic tool selection recommends initial tools: {initial_tools}",
-            LogContext.TOOL_EXECUTION,
-        )
+        prompt = self._build_initial_prompt(original_query, parsed_query)
 
-        prompt = self.prompt_manager.get_initial_investigation_prompt(
-            original_query, parsed_query
-        )
-
-        # Add tool guidance to the prompt
-        if initial_tools:
-            tool_guidance = f"\n\nBased on the query analysis, consider using these tools for investigation: {', '.join(initial_tools)}"
-            prompt += tool_guidance
-
-        # Initial request to Anthropic with tools
-        response = await self.anthropic.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=2000,
-            tools=self.tools,
-            messages=[{"role": "user", "content": prompt}],
-        )
+        # Initial request to Anthropic with tools, unless it was already
+        # answered out-of-band (e.g. by the Message Batches API)
+        if initial_response is None:
+            response = await self.anthropic.messages.create(
+                **self._initial_request(prompt)
+            )
+        else:
+            response = initial_response
 
         # Handle tool calls if Anthropic requests them
         if any(block.type == "tool_use" for block in response.content):
@@ -321,17 +392,27 @@ Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
                     return block.text
         return "No response generated"
 
-    async def _format_investigation_note(self, raw_analysis: str) -> str:
+    async def _format_investigation_note(
+        self, raw_analysis: str, on_text: Callable[[str], None] | None = None
+    ) -> str:
         """Format the raw analysis into a structured internal support note."""
         format_prompt = self.prompt_manager.get_format_investigation_note_prompt(
             raw_analysis
         )
+        request: dict[str, Any] = {
+            "model": "claude-sonnet-4-20250514",
+            "max_tokens": 1000,
+            "messages": [{"role": "user", "content": format_prompt}],
+        }
 
-        response = await self.anthropic.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=1000,
-            messages=[{"role": "user", "content": format_prompt}],
-        )
+        if on_text is None:
+            response = await self.anthropic.messages.create(**request)
+        else:
+            # Stream the note so callers can show it while it is generated
+            async with self.anthropic.messages.stream(**request) as stream:
+                async for text in stream.text_stream:
+                    on_text(text)
+                response = await stream.get_final_message()
 
         if response.content:
             for block in response.content:
@@ -340,6 +421,211 @@ Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 
         return raw_analysis  # Fallback to raw analysis if formatting fails
 
+    async def _run_tool(
+        self, block: ToolUseBlock, investigation_state: InvestigationState
+    ) -> dict[str, Any] | Exception:
+        """
+        Execute one tool call, returning any exception instead of raising it.
+
+        Identical calls (same tool and input) made earlier in the investigation,
+        or concurrently in the same round, share a single execution. Failed and
+        cancelled calls are not reused, so a repeated call retries them.
+        """
+        key = (block.name, orjson.dumps(block.input, option=orjson.OPT_SORT_KEYS))
+        call = investigation_state.tool_calls.get(key)
+        if call is None or call.cancelled():
+            call = asyncio.ensure_future(self._execute_tool(block))
+            investigation_state.tool_calls[key] = call
+        else:
+            self.logger.debug(
+                f"Reusing result of identical tool call: {block.name}",
+                LogContext.TOOL_EXECUTION,
+            )
+
+        result = await call
+        if isinstance(result, Exception):
+            investigation_state.tool_calls.pop(key, None)
+        return result
+
+    async def _execute_tool(self, block: ToolUseBlock) -> dict[str, Any] | Exception:
+        """Execute one tool call via the orchestrator."""
+        try:
+            return await self.tool_orchestrator.execute_tool(block.name, block.input)  # type: ignore
+        except Exception as e:
+            # Keep one failing tool from cancelling the rest of its round
+            return e
+
+    async def _execute_tool_round(
+        self,
+        response: Message,
+        investigation_state: InvestigationState,
+        skipped_content: str,
+        additional: bool = False,
+        raw_results: dict[str, dict[str, Any]] | None = None,
+    ) -> list[ToolResultBlockParam]:
+        """
+        Execute all tool calls requested in a response concurrently.
+
+        Limits are applied in request order before dispatch, so the set of
+        executed tools is the same as with sequential execution. Results are
+        returned in the order the tool calls appeared in the response.
+
+        If raw_results is given, the unsummarized result of each tool that ran
+        is stored in it by tool name.
+        """
+        round_label = "additional " if additional else ""
+        tool_results: list[ToolResultBlockParam] = []
+        scheduled: list[tuple[ToolResultBlockParam, ToolUseBlock]] = []
+
+        for block in response.content:
+            if block.type != "tool_use":
+                continue
+
+            # Check if we can execute more tools in this round
+            if not investigation_state.can_continue_round(self.config):
+                self.logger.warning(
+                    f"Tool limit reached in {round_label}round {investigation_state.tool_rounds_used}",
+                    LogContext.TOOL_EXECUTION,
+                )
+                tool_results.append(
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": block.id,
+                        "content": skipped_content,
+                    }
+                )
+                continue
+
+            self.logger.debug(
+                f"Processing {round_label}tool call: {block.name}",
+                LogContext.TOOL_EXECUTION,
+                {"tool_name": block.name, "input": block.input},
+            )
+
+            # Record tool usage
+            investigation_state.record_tool_use()
+
+            tool_result: ToolResultBlockParam = {
+                "type": "tool_result",
+                "tool_use_id": block.id,
+                "content": "",
+            }
+            tool_results.append(tool_result)
+            scheduled.append((tool_result, block))
+
+        # Tools in a round run concurrently, so the whole round shares one
+        # per-tool time budget; tools still running when it expires are
+        # cancelled and reported as timed out
+        timeout = self.config.TOOL_EXECUTION_TIMEOUT
+        tasks = [
+            asyncio.ensure_future(self._run_tool(block, investigation_state))
+            for _, block in scheduled
+        ]
+        if tasks:
+            try:
+                await asyncio.wait(tasks, timeout=timeout)
+            finally:
+                # Also cancels the round's tools if this coroutine is cancelled
+                pending = [task for task in tasks if not task.done()]
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+            if pending:
+                self.logger.warning(
+                    f"{round_label.capitalize()}tool round timed out after {timeout}s",
+                    LogContext.TOOL_EXECUTION,
+                )
+
+        results = [
+            task.result()
+            if task.done() and not task.cancelled()
+            else TimeoutError(f"tool_timeout (no result within {timeout}s)")
+            for task in tasks
+        ]
+
+        # Tool orchestrator already logs success/failure
+        for (tool_result, block), result in zip(scheduled, results):
+            try:
+                if isinstance(result, BaseException):
+                    raise result
+                tool_result["content"] = self.tool_orchestrator.summarize_tool_result(
+                    block.name, result
+                )
+                if raw_results is not None:
+                    raw_results[block.name] = result
+            except Exception as e:
+                self.logger.error(
+                    f"Unexpected error in {round_label}tool execution",
+                    LogContext.TOOL_EXECUTION,
+                    {
+                        "tool_name": block.name,
+                        "error": str(e),
+                        "error_type": type(e).__name__,
+                    },
+                )
+                tool_result["content"] = f"Error executing tool: {str(e)}"
+
+        return tool_results
+
+    @staticmethod
+    def _move_cache_breakpoint(messages: list[MessageParam]) -> None:
+        """
+        Mark the latest tool result as the conversation's prompt-cache breakpoint.
+
+        Anthropic then caches the history up to it, so the next round only
+        processes what follows. Earlier breakpoints are removed, keeping one for
+        the conversation and one for the tool definitions, within the API's
+        limit of four per request.
+        """
+        latest: dict[str, Any] | None = None
+        for message in messages:
+            content = message["content"]
+            if isinstance(content, str):
+                continue
+            for block in content:
+                if isinstance(block, dict) and block.get("type") == "tool_result":
+                    block.pop("cache_control", None)
+                    latest = block  # type: ignore[assignment]
+
+        if latest is not None:
+            latest["cache_control"] = {"type": "ephemeral"}
+
+    def _has_sufficient_evidence(
+        self, parsed_query: ParsedQuery, raw_results: dict[str, dict[str, Any]]
+    ) -> bool:
+        """
+        Check whether first-round results already answer the question type.
+
+        Args:
+            parsed_query: The parsed customer query
+            raw_results: Unsummarized tool results keyed by tool name
+
+        Returns:
+            True if no follow-up tool round is needed
+        """
+        # Only access_code questions have a deterministic rule: the code the
+        # customer named either is or is not among the fetched codes. Other
+        # question types (device_behavior, troubleshooting, api_help,
+        # account_issue) need the model to weigh the evidence, so they always
+        # get their follow-up round.
+        if parsed_query.question_type == "access_code":
+            device_info = raw_results.get("get_device_info")
+            codes_result = raw_results.get("get_access_codes")
+            if not device_info or "error" in device_info:
+                return False
+            if not codes_result or "error" in codes_result:
+                return False
+
+            # The code the customer asked about must be among the fetched codes
+            known_codes = set()
+            for code in codes_result.get("access_codes", []):
+                known_codes.add(code.get("access_code_id"))
+                known_codes.add(code.get("code"))
+            return any(code in known_codes for code in parsed_query.access_codes)
+
+        return False
+
     async def _handle_tool_calls(
         self,
         response: Message,
@@ -350,6 +636,12 @@ Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
     ) -> str:
         """Execute tool calls and get final analysis from Anthropic."""
 
+        # Check if we can start this round
+        if not investigation_state.can_start_new_round(self.config):
+            raise InvestigationLimitError(
+                f"Maximum tool rounds ({self.config.MAX_TOOL_ROUNDS}) exceeded"
+            )
+
         # Start new tool round
         investigation_state.start_new_round()
         self.logger.info(
@@ -357,12 +649,6 @@ Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
             LogContext.TOOL_EXECUTION,
         )
 
-        # Check if we can start this round
-        if not investigation_state.can_start_new_round(self.config):
-            raise InvestigationLimitError(
-                f"Maximum tool rounds ({self.config.MAX_TOOL_ROUNDS}) exceeded"
-            )
-
         # Build the conversation history
         messages: list[MessageParam] = [
             {"role": "user", "content": original_prompt},
@@ -371,95 +657,57 @@ Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
         investigation_state.record_message()
         investigation_state.record_message()
 
-        # Execute each tool call
-        tool_results: list[ToolResultBlockParam] = []
-        for block in response.content:
-            if block.type == "tool_use":
-                # Check if we can execute more tools in this round
-                if not investigation_state.can_continue_round(self.config):
-                    self.logger.warning(
-                        f"Tool limit reached in round {investigation_state.tool_rounds_used}",
-                        LogContext.TOOL_EXECUTION,
-                    )
-                    tool_results.append(
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": block.id,
-                            "content": f"Tool execution skipped due to limits. Max {self.config.MAX_TOOLS_PER_ROUND} tools per round, {self.config.MAX_TOTAL_TOOLS} total.",
-                        }
-                    )
-                    continue
-                self.logger.debug(
-                    f"Processing tool call: {block.name}",
-                    LogContext.TOOL_EXECUTION,
-                    {"tool_name": block.name, "input": block.input},
-                )
-
-                try:
-                    # Record tool usage
-                    investigation_state.record_tool_use()
-
-                    result = await self.tool_orchestrator.execute_tool(
-                        block.name, block.input
-                    )  # type: ignore
-                    # Tool orchestrator already logs success/failure
-
-                    tool_results.append(
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": block.id,
-                            "content": self.tool_orchestrator.summarize_tool_result(
-                                block.name, result
-                            ),
-                        }
-                    )
-                except Exception as e:
-                    self.logger.error(
-                        "Unexpected error in tool execution",
-                        LogContext.TOOL_EXECUTION,
-                        {
-                            "tool_name": block.name,
-                            "error": str(e),
-                            "error_type": type(e).__name__,
-                        },
-                    )
-                    tool_results.append(
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": block.id,
-                            "content": f"Error executing tool: {str(e)}",
-                        }
-                    )
+        # Execute the tool calls for this round concurrently
+        raw_results: dict[str, dict[str, Any]] = {}
+        tool_results = await self._execute_tool_round(
+            response,
+            investigation_state,
+            skipped_content=f"Tool execution skipped due to limits. Max {self.config.MAX_TOOLS_PER_ROUND} tools per round, {self.config.MAX_TOTAL_TOOLS} total.",
+            raw_results=raw_results,
+        )
 
         # Add tool results to conversation
         messages.append({"role": "user", "content": tool_results})
+        self._move_cache_breakpoint(messages)
 
         # Continue investigation using dynamic tool selection
         # Extract tool results from this round for analysis
         current_tool_results = {}
         tools_used_this_round = set()
+        results_by_id = {
+            tool_result.get("tool_use_id"): tool_result for tool_result in tool_results
+        }
 
         for block in response.content:
             if block.type == "tool_use":
                 tools_used_this_round.add(block.name)
                 # Find corresponding result
-                for tool_result in tool_results:
-                    if tool_result.get("tool_use_id") == block.id:
-                        # Parse the result content to extract structured data
-                        # Note: This is simplified - in a full implementation,
-                        # we'd need to reverse-engineer the structured data from the summary
-                        content_str = str(tool_result.get("content", ""))
-                        current_tool_results[block.name] = {
-                            "success": "Error" not in content_str,
-                            "content": content_str,
-                        }
-
-        # Use dynamic selector to determine if we should continue
-        should_continue, reasoning = (
-            self.dynamic_tool_selector.should_continue_investigation(
-                investigation_state, self.config
+                tool_result = results_by_id.get(block.id)
+                if tool_result is not None:
+                    # Parse the result content to extract structured data
+                    # Note: This is simplified - in a full implementation,
+                    # we'd need to reverse-engineer the structured data from the summary
+                    content_str = str(tool_result.get("content", ""))
+                    current_tool_results[block.name] = {
+                        "success": "Error" not in content_str,
+                        "content": content_str,
+                    }
+
+        # Confidently parsed queries whose evidence is already in hand go
+        # straight to final analysis instead of another tool round
+        if (
+            parsed_query.confidence >= self.config.EARLY_EXIT_CONFIDENCE_THRESHOLD
+            and self._has_sufficient_evidence(parsed_query, raw_results)
+        ):
+            investigation_state.early_exit = True
+            should_continue, reasoning = False, "Sufficient evidence in first round"
+        else:
+            # Use dynamic selector to determine if we should continue
+            should_continue, reasoning = (
+                self.dynamic_tool_selector.should_continue_investigation(
+                    investigation_state, self.config
+                )
             )
-        )
 
         self.logger.info(
             f"Dynamic tool selection: Continue={should_continue}, Reason={reasoning}",
@@ -473,21 +721,29 @@ Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
             )
 
             if followup_tools:
-                continue_prompt = f"Based on the tool results above, please use these specific tools to continue the investigation: {', '.join(followup_tools)}. Focus on gathering additional data to complete the analysis."
+                continue_prompt = self.prompt_manager.get_followup_tools_prompt(
+                    followup_tools
+                )
             else:
-                continue_prompt = "Based on the tool results above, please provide your analysis of the findings. No additional tools are needed."
+                continue_prompt = self.prompt_manager.get_no_followup_tools_prompt()
         else:
-            continue_prompt = f"Based on the tool results above, please provide your detailed analysis and recommendations. Investigation complete: {reasoning}"
+            continue_prompt = self.prompt_manager.get_investigation_complete_prompt(
+                reasoning
+            )
 
         messages.append({"role": "user", "content": continue_prompt})
 
         # Get response - might be more tool calls or final analysis
-        continue_response = await self.anthropic.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=2000,
-            tools=self.tools,
-            messages=messages,
-        )
+        request: dict[str, Any] = {
+            "model": "claude-sonnet-4-20250514",
+            "max_tokens": 2000,
+            "tools": self.tools,
+            "messages": messages,
+        }
+        if investigation_state.early_exit:
+            # Tools must stay defined for the tool_use history, but not be called
+            request["tool_choice"] = {"type": "none"}
+        continue_response = await self.anthropic.messages.create(**request)
 
         # If Anthropic wants to use more tools, handle them
         if any(isinstance(block, ToolUseBlock) for block in continue_response.content):
@@ -509,112 +765,85 @@ Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
         messages: list[MessageParam],
         investigation_state: InvestigationState,
     ) -> str:
-        """Handle additional tool calls in an iterative investigation."""
+        """
+        Handle additional tool calls in an iterative investigation.
 
-        # Check if we can continue with more rounds
-        if not investigation_state.can_start_new_round(self.config):
-            self.logger.warning(
-                "Cannot start additional tool round - limit reached",
+        Runs one tool round per response until Anthropic stops requesting
+        tools or the round limit is reached, appending to the same messages.
+        At the round limit the pending tool calls are skipped and a final
+        analysis is requested from the evidence gathered so far.
+        """
+        while any(block.type == "tool_use" for block in response.content):
+            # Check if we can continue with more rounds
+            if not investigation_state.can_start_new_round(self.config):
+                self.logger.warning(
+                    "Cannot start additional tool round - limit reached",
+                    LogContext.TOOL_EXECUTION,
+                )
+                # Answer every pending tool call so the history stays valid
+                skipped_results: list[ToolResultBlockParam] = [
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": block.id,
+                        "content": "Tool execution skipped: tool round limit reached.",
+                    }
+                    for block in response.content
+                    if block.type == "tool_use"
+                ]
+                messages.append({"role": "assistant", "content": response.content})
+                messages.append({"role": "user", "content": skipped_results})
+                break
+
+            # Start new round for additional tools
+            investigation_state.start_new_round()
+            self.logger.info(
+                f"Starting additional tool round {investigation_state.tool_rounds_used}",
                 LogContext.TOOL_EXECUTION,
             )
-            return "Investigation stopped due to tool round limits. Analysis based on available data."
 
-        # Start new round for additional tools
-        investigation_state.start_new_round()
-        self.logger.info(
-            f"Starting additional tool round {investigation_state.tool_rounds_used}",
-            LogContext.TOOL_EXECUTION,
-        )
+            # Execute the additional tool calls concurrently
+            tool_results = await self._execute_tool_round(
+                response,
+                investigation_state,
+                skipped_content="Additional tool execution skipped due to limits.",
+                additional=True,
+            )
 
-        # Execute the additional tool calls
-        tool_results = []
-        for block in response.content:
-            if block.type == "tool_use":
-                # Check tool limits
-                if not investigation_state.can_continue_round(self.config):
-                    self.logger.warning(
-                        f"Tool limit reached in additional round {investigation_state.tool_rounds_used}",
-                        LogContext.TOOL_EXECUTION,
-                    )
-                    tool_results.append(
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": block.id,
-                            "content": "Additional tool execution skipped due to limits.",
-                        }
-                    )
-                    continue
-
-                self.logger.debug(
-                    f"Processing additional tool call: {block.name}",
-                    LogContext.TOOL_EXECUTION,
-                    {"tool_name": block.name, "input": block.input},
-                )
+            # Add the assistant's response and tool results to conversation
+            messages.append({"role": "assistant", "content": response.content})
+            messages.append({"role": "user", "content": tool_results})
+            self._move_cache_breakpoint(messages)
+
+            # Get response - might be more tool calls or final analysis
+            response = await self.anthropic.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=2000,
+                tools=self.tools,
+                messages=messages,
+            )
+            if any(block.type == "tool_use" for block in response.content):
+                self.logger.info("AI requested even more tools", LogContext.AI_RESPONSE)
 
-                try:
-                    # Record tool usage
-                    investigation_state.record_tool_use()
-
-                    result = await self.tool_orchestrator.execute_tool(
-                        block.name, block.input
-                    )
-                    # Tool orchestrator already logs success/failure
-
-                    tool_results.append(
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": block.id,
-                            "content": self.tool_orchestrator.summarize_tool_result(
-                                block.name, result
-                            ),
-                        }
-                    )
-                except Exception as e:
-                    self.logger.error(
-                        "Unexpected error in additional tool execution",
-                        LogContext.TOOL_EXECUTION,
-                        {
-                            "tool_name": block.name,
-                            "error": str(e),
-                            "error_type": type(e).__name__,
-                        },
-                    )
-                    tool_results.append(
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": block.id,
-                            "content": f"Error executing tool: {str(e)}",
-                        }
-                    )
-
-        # Add the assistant's response and tool results to conversation
-        messages.append({"role": "assistant", "content": response.content})
-        messages.append({"role": "user", "content": tool_results})
+        else:
+            # Anthropic usually answers with its analysis once it stops calling tools
+            for block in response.content:
+                if isinstance(block, TextBlock) and block.text:
+                    return block.text
 
-        # Get response - might be more tool calls or final analysis
-        continue_response = await self.anthropic.messages.create(
+        # Add explicit prompt for final analysis if none was given
+        analysis_prompt = self.prompt_manager.get_final_analysis_prompt()
+        messages.append({"role": "user", "content": analysis_prompt})
+
+        # Get final analysis; tools stay defined for the tool_use history,
+        # but may not be called
+        final_response = await self.anthropic.messages.create(
             model="claude-sonnet-4-20250514",
             max_tokens=2000,
             tools=self.tools,
+            tool_choice={"type": "none"},
             messages=messages,
         )
 
-        # If Anthropic wants to use more tools, handle them recursively (with limits)
-        if any(block.type == "tool_use" for block in continue_response.content):
-            self.logger.info("AI requested even more tools", LogContext.AI_RESPONSE)
-            return await self._handle_additional_tools(
-                continue_response, messages, investigation_state
-            )
-
-        # Add explicit prompt for final analysis if no more tools needed
-        analysis_prompt = "Based on all the data you've gathered from the tools above, please provide your detailed analysis and recommendations for this support issue. Include specific findings from the data and actionable next steps."
-        messages.append({"role": "user", "content": analysis_prompt})
-
-        # Get final analysis
-        final_response = await self.anthropic.messages.create(
-            model="claude-sonnet-4-20250514", max_tokens=2000, messages=messages
-        )
-
         if final_response.content:
             for block in final_response.content:
                 if isinstance(block, TextBlock):
@@ -660,6 +889,10 @@ Device ID: 267ed8d4-3933-4e71-921a-53ce3736879a
         print("\n🔧 Debug Summary:")
         print(result["debug"]["log_summary"])
 
+    await close_pools()
+    await aclose_http_client()
+    await aclose_api_clients()
+
 
 if __name__ == "__main__":
     asyncio.run(test_simple_investigator())
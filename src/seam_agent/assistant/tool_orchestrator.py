@@ -2,12 +2,16 @@
 Tool orchestrator for managing tool execution and result summarization.
 """
 
-from typing import Dict, Any, Optional, List
+import asyncio
+import functools
+import orjson
+from typing import Dict, Any, Optional, List, Awaitable, Callable
 from anthropic.types import ToolParam
 
 from seam_agent.connectors.db import DatabaseClient
 from seam_agent.connectors.seam_api import SeamAPIClient
 from seam_agent.connectors.admin_links import AdminLinksConnector
+from seam_agent.assistant.batch_loader import BatchLoader
 from seam_agent.assistant.investigation_logger import InvestigationLogger, LogContext
 from seam_agent.assistant.tool_result_processor import (
     ToolResultProcessor,
@@ -30,6 +34,7 @@ class ToolOrchestrator:
         seam_client,
         logger: Optional[InvestigationLogger] = None,
         admin_base_url: Optional[str] = None,
+        max_concurrent_db_tools: int = 3,
     ):
         self.db_client = db_client
         self.seam_client = seam_client
@@ -39,9 +44,39 @@ class ToolOrchestrator:
         self.logger = logger or InvestigationLogger()
         self.result_processor = ToolResultProcessor()
         self._executed_tools_cache = {}  # Cache tool results to prevent hallucinations
+        self._tool_registry: dict[str, Callable[[Any], Awaitable[dict[str, Any]]]] = {
+            "get_device_info": self._get_device_info,
+            "get_access_codes": self._get_access_codes,
+            "get_audit_logs": self._get_audit_logs,
+            "get_action_attempts": self._get_action_attempts,
+            "get_device_events": self._get_device_events,
+            "get_admin_links": self._get_admin_links,
+        }
+        # Tools that call an external backend share that backend's concurrency budget
+        self._tool_backends: dict[str, str] = {
+            "get_device_info": "db",
+            "get_access_codes": "db",
+            "get_audit_logs": "db",
+            "get_action_attempts": "db",
+            "get_device_events": "db",
+        }
+        self._backend_semaphores: dict[str, asyncio.Semaphore] = {
+            "db": asyncio.Semaphore(max_concurrent_db_tools),
+        }
+        self._tool_definitions = self._build_tool_definitions()
+        # Devices requested by parallel tool calls are fetched in one query
+        self._device_loader: BatchLoader[str, Dict[str, Any] | None | BaseException] = (
+            BatchLoader(self._load_devices)
+        )
 
     def get_tool_definitions(self) -> list[ToolParam]:
         """Get the tool definitions for Anthropic API."""
+        return self._tool_definitions
+
+    @staticmethod
+    @functools.cache
+    def _build_tool_definitions() -> list[ToolParam]:
+        """Build the static tool definitions once per process."""
         return [
             {
                 "name": "get_device_info",
@@ -124,7 +159,7 @@ class ToolOrchestrator:
             },
             {
                 "name": "get_audit_logs",
-                "description": "Get audit logs for access code operations (INSERT/DELETE) on a device. Returns pagination info - if 'has_more': true, you should call again with suggested_next_limit to get the complete audit history. For investigating access code issues, timeline analysis, or finding when specific codes were created/deleted, you often need more than 10 entries to understand the full history.",
+                "description": "Get audit logs for access code operations (INSERT/DELETE) on a device, newest first. Returns pagination info - if 'has_more': true, call again with before set to pagination.next_before to get the next page of older entries. For investigating access code issues, timeline analysis, or finding when specific codes were created/deleted, you often need more than 10 entries to understand the full history.",
                 "input_schema": {
                     "type": "object",
                     "properties": {
@@ -137,6 +172,10 @@ class ToolOrchestrator:
                             "description": "Maximum number of results (default 10, range 1-100). Increase for comprehensive audit history.",
                             "default": 10,
                         },
+                        "before": {
+                            "type": "string",
+                            "description": "Cursor from pagination.next_before of a previous call. Only entries after that position (older) are returned.",
+                        },
                     },
                     "required": ["device_id"],
                 },
@@ -184,6 +223,9 @@ class ToolOrchestrator:
                     },
                     "required": ["investigation_context"],
                 },
+                # Tools are identical on every request, so let Anthropic cache
+                # the schema prefix instead of re-processing it each round
+                "cache_control": {"type": "ephemeral"},
             },
         ]
 
@@ -195,11 +237,14 @@ class ToolOrchestrator:
                 return f"Device Info: {result['error']}"
 
             # Return the full device data as JSON for comprehensive context
-            import json
-
-            return (
-                f"Device Info (Full Data):\n{json.dumps(result, indent=2, default=str)}"
-            )
+            device_json = orjson.dumps(
+                result,
+                default=str,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_NAIVE_UTC,
+            ).decode("utf-8")
+            return f"Device Info (Full Data):\n{device_json}"
 
         elif tool_name == "get_access_codes":
             if "error" in result:
@@ -287,7 +332,7 @@ class ToolOrchestrator:
                 summary += f" | Recent: {', '.join(recent_operations)}"
 
             if pagination.get("has_more"):
-                summary += f" - MORE DATA AVAILABLE (use limit={pagination.get('suggested_next_limit', 20)})"
+                summary += f" - MORE DATA AVAILABLE (use before={pagination.get('next_before')})"
 
             return summary
 
@@ -436,241 +481,281 @@ class ToolOrchestrator:
         """Execute a specific tool and return the result."""
         self.logger.tool_start(tool_name, tool_input)
 
-        if tool_name == "get_device_info":
-            device_id = tool_input["device_id"]
-            self.logger.debug(
-                f"Querying database for device: {device_id}", LogContext.DATABASE
-            )
-            try:
-                device_info = await self.db_client.get_device_by_id(device_id)
-
-                # Handle null/None response properly
-                if device_info is None:
-                    self.logger.warning(
-                        "Device not found in main table", LogContext.DATABASE
-                    )
-                    return {"error": "Device not found"}
-
-                # Ensure device_info is a dictionary (should always be from db.py but safety check)
-                if not isinstance(device_info, dict):
-                    self.logger.warning(
-                        f"Database returned unexpected type {type(device_info)}: {device_info}",
-                        LogContext.DATABASE,
-                    )
-                    return {
-                        "error": f"Database returned unexpected format: {type(device_info)}"
-                    }
-
-                # Extract key findings for logging
-                device_type = device_info.get("device_type", "unknown")
-                is_online = (
-                    device_info.get("properties", {}).get("online")
-                    if isinstance(device_info.get("properties"), dict)
-                    else None
-                )
-                key_findings = f"Device type: {device_type}" + (
-                    f", online: {is_online}" if is_online is not None else ""
-                )
-
-                self.logger.tool_success(tool_name, len(str(device_info)), key_findings)
-                # Cache result to prevent hallucinations in admin links
-                self._executed_tools_cache[tool_name] = device_info
-                return device_info
+        handler = self._tool_registry.get(tool_name)
+        if handler is None:
+            self.logger.error(f"Unknown tool: {tool_name}", LogContext.TOOL_EXECUTION)
+            return {"error": f"Unknown tool: {tool_name}"}
 
-            except Exception as e:
-                self.logger.tool_error(tool_name, str(e))
-                return {"error": str(e)}
+        backend = self._tool_backends.get(tool_name)
+        if backend is None:
+            return await handler(tool_input)
 
-        elif tool_name == "get_access_codes":
-            device_id = tool_input["device_id"]
-            workspace_id = tool_input["workspace_id"]
-            limit = tool_input.get("limit", 10)
-            offset = tool_input.get("offset", 0)
-            self.logger.debug(
-                f"Querying access codes for device: {device_id} in workspace: {workspace_id}",
-                LogContext.DATABASE,
-            )
-            try:
-                access_codes = await self.db_client.get_access_codes(
-                    device_id, workspace_id, limit, offset
-                )
+        async with self._backend_semaphores[backend]:
+            return await handler(tool_input)
 
-                # Check if there are more results by querying with limit + 1
-                check_more = await self.db_client.get_access_codes(
-                    device_id, workspace_id, limit + 1, offset
+    async def _get_device_info(self, tool_input: Any) -> dict[str, Any]:
+        """Look up a device and its properties in the database."""
+        tool_name = "get_device_info"
+        device_id = tool_input["device_id"]
+        self.logger.debug(
+            f"Querying database for device: {device_id}", LogContext.DATABASE
+        )
+        try:
+            device_info = await self._device_loader.load(device_id)
+            if isinstance(device_info, BaseException):
+                raise device_info
+
+            # Handle null/None response properly
+            if device_info is None:
+                self.logger.warning(
+                    "Device not found in main table", LogContext.DATABASE
                 )
-                has_more = len(check_more) > limit
-
-                key_findings = f"{len(access_codes)} access codes found"
-                if has_more:
-                    key_findings += " (more available)"
+                return {"error": "Device not found"}
 
-                self.logger.tool_success(
-                    tool_name, len(str(access_codes)), key_findings
+            # Ensure device_info is a dictionary (should always be from db.py but safety check)
+            if not isinstance(device_info, dict):
+                self.logger.warning(
+                    f"Database returned unexpected type {type(device_info)}: {device_info}",
+                    LogContext.DATABASE,
                 )
-                result = {
-                    "access_codes": access_codes,
-                    "pagination": {
-                        "current_count": len(access_codes),
-                        "has_more": has_more,
-                        "next_offset": offset + len(access_codes) if has_more else None,
-                        "suggested_next_limit": limit,
-                    },
-                }
-                # Cache result to prevent hallucinations in admin links
-                self._executed_tools_cache[tool_name] = result
-                return result
-            except Exception as e:
-                self.logger.tool_error(tool_name, str(e))
-                return {"error": str(e)}
-
-        elif tool_name == "get_audit_logs":
-            device_id = tool_input["device_id"]
-            limit = tool_input.get("limit", 10)
-            self.logger.debug(
-                f"Querying audit logs for device: {device_id}", LogContext.DATABASE
-            )
-            try:
-                audit_logs = await self.db_client.get_audit_logs(device_id, limit)
-
-                # Check if there are more results by querying with limit + 1
-                check_more = await self.db_client.get_audit_logs(device_id, limit + 1)
-                has_more = len(check_more) > limit
-
-                key_findings = f"{len(audit_logs)} audit log entries found"
-                if has_more:
-                    key_findings += " (more available)"
-
-                self.logger.tool_success(tool_name, len(str(audit_logs)), key_findings)
                 return {
-                    "audit_logs": audit_logs,
-                    "device_id": device_id,
-                    "pagination": {
-                        "current_count": len(audit_logs),
-                        "has_more": has_more,
-                        "suggested_next_limit": limit * 2 if has_more else limit,
-                    },
+                    "error": f"Database returned unexpected format: {type(device_info)}"
                 }
-            except Exception as e:
-                self.logger.tool_error(tool_name, str(e))
-                return {"error": str(e)}
 
-        elif tool_name == "get_action_attempts":
-            device_id = tool_input["device_id"]
-            workspace_id = tool_input["workspace_id"]
-            limit = tool_input.get("limit", 10)
-            self.logger.debug(
-                f"Querying action attempts for device: {device_id} in workspace: {workspace_id}",
-                LogContext.DATABASE,
+            # Extract key findings for logging
+            device_type = device_info.get("device_type", "unknown")
+            is_online = (
+                device_info.get("properties", {}).get("online")
+                if isinstance(device_info.get("properties"), dict)
+                else None
+            )
+            key_findings = f"Device type: {device_type}" + (
+                f", online: {is_online}" if is_online is not None else ""
             )
-            try:
-                action_attempts = await self.db_client.get_action_attempts(
-                    device_id, workspace_id, limit
-                )
-
-                # Check if there are more results by querying with limit + 1
-                check_more = await self.db_client.get_action_attempts(
-                    device_id, workspace_id, limit + 1
-                )
-                has_more = len(check_more) > limit
-
-                successful = sum(
-                    1 for a in action_attempts if a.get("status") == "success"
-                )
-                key_findings = (
-                    f"{len(action_attempts)} attempts ({successful} successful)"
-                )
-                if has_more:
-                    key_findings += " (more available)"
 
-                self.logger.tool_success(
-                    tool_name, len(str(action_attempts)), key_findings
-                )
-                result = {
-                    "action_attempts": action_attempts,
-                    "device_id": device_id,
-                    "workspace_id": workspace_id,
-                    "pagination": {
-                        "current_count": len(action_attempts),
-                        "has_more": has_more,
-                        "suggested_next_limit": limit * 2 if has_more else limit,
-                    },
-                }
-                # Cache result to prevent hallucinations in admin links
-                self._executed_tools_cache[tool_name] = result
-                return result
-            except Exception as e:
-                self.logger.tool_error(tool_name, str(e))
-                return {"error": str(e)}
+            self.logger.tool_success(tool_name, len(str(device_info)), key_findings)
+            # Cache result to prevent hallucinations in admin links
+            self._executed_tools_cache[tool_name] = device_info
+            return device_info
 
-        elif tool_name == "get_device_events":
-            device_id = tool_input["device_id"]
-            workspace_id = tool_input["workspace_id"]
-            limit = tool_input.get("limit", 10)
-            self.logger.debug(
-                f"Querying device events for device: {device_id} in workspace: {workspace_id}",
-                LogContext.DATABASE,
-            )
+        except Exception as e:
+            self.logger.tool_error(tool_name, str(e))
+            return {"error": str(e)}
+
+    async def _load_devices(
+        self, device_ids: list[str]
+    ) -> dict[str, Dict[str, Any] | None | BaseException]:
+        """Fetch devices for the device loader, by ID; None if not found."""
+        if len(device_ids) > 1:
             try:
-                device_events = await self.db_client.get_device_events(
-                    device_id, workspace_id, limit
-                )
-
-                # Check if there are more results by querying with limit + 1
-                check_more = await self.db_client.get_device_events(
-                    device_id, workspace_id, limit + 1
+                devices = await self.db_client.get_devices_by_ids(device_ids)
+                return {device_id: devices.get(device_id) for device_id in device_ids}
+            except Exception as e:
+                # e.g. one malformed ID; look the rest up on their own
+                self.logger.debug(
+                    f"Batched device lookup failed, retrying individually: {e}",
+                    LogContext.DATABASE,
                 )
-                has_more = len(check_more) > limit
 
-                key_findings = f"{len(device_events)} device events found"
-                if has_more:
-                    key_findings += " (more available)"
+        results = await asyncio.gather(
+            *(self.db_client.get_device_by_id(device_id) for device_id in device_ids),
+            return_exceptions=True,
+        )
+        return dict(zip(device_ids, results))
+
+    async def _get_access_codes(self, tool_input: Any) -> dict[str, Any]:
+        """Fetch a page of access codes for a device."""
+        tool_name = "get_access_codes"
+        device_id = tool_input["device_id"]
+        workspace_id = tool_input["workspace_id"]
+        limit = tool_input.get("limit", 10)
+        offset = tool_input.get("offset", 0)
+        self.logger.debug(
+            f"Querying access codes for device: {device_id} in workspace: {workspace_id}",
+            LogContext.DATABASE,
+        )
+        try:
+            access_codes = await self.db_client.get_access_codes(
+                device_id, workspace_id, limit, offset
+            )
 
-                self.logger.tool_success(
-                    tool_name, len(str(device_events)), key_findings
-                )
-                return {
-                    "device_events": device_events,
-                    "device_id": device_id,
-                    "workspace_id": workspace_id,
-                    "pagination": {
-                        "current_count": len(device_events),
-                        "has_more": has_more,
-                        "suggested_next_limit": limit * 2 if has_more else limit,
-                    },
-                }
-            except Exception as e:
-                self.logger.tool_error(tool_name, str(e))
-                return {"error": str(e)}
+            # Check if there are more results by querying with limit + 1
+            check_more = await self.db_client.get_access_codes(
+                device_id, workspace_id, limit + 1, offset
+            )
+            has_more = len(check_more) > limit
+
+            key_findings = f"{len(access_codes)} access codes found"
+            if has_more:
+                key_findings += " (more available)"
+
+            self.logger.tool_success(tool_name, len(str(access_codes)), key_findings)
+            result = {
+                "access_codes": access_codes,
+                "pagination": {
+                    "current_count": len(access_codes),
+                    "has_more": has_more,
+                    "next_offset": offset + len(access_codes) if has_more else None,
+                    "suggested_next_limit": limit,
+                },
+            }
+            # Cache result to prevent hallucinations in admin links
+            self._executed_tools_cache[tool_name] = result
+            return result
+        except Exception as e:
+            self.logger.tool_error(tool_name, str(e))
+            return {"error": str(e)}
+
+    async def _get_audit_logs(self, tool_input: Any) -> dict[str, Any]:
+        """Fetch recent audit log entries for a device."""
+        tool_name = "get_audit_logs"
+        device_id = tool_input["device_id"]
+        # The limit comes from the model, so keep it in the documented 1-100 range
+        limit = min(max(int(tool_input.get("limit", 10)), 1), 100)
+        # The cursor is "<created_at>|<id>"; a bare timestamp is also accepted
+        before, _, before_id = (tool_input.get("before") or "").partition("|")
+        self.logger.debug(
+            f"Querying audit logs for device: {device_id}", LogContext.DATABASE
+        )
+        try:
+            # Fetch one extra row to learn whether another page exists
+            audit_logs = await self.db_client.get_audit_logs(
+                device_id, limit + 1, before or None, before_id or None
+            )
+            has_more = len(audit_logs) > limit
+            audit_logs = audit_logs[:limit]
+
+            key_findings = f"{len(audit_logs)} audit log entries found"
+            if has_more:
+                key_findings += " (more available)"
+
+            self.logger.tool_success(tool_name, len(str(audit_logs)), key_findings)
+            return {
+                "audit_logs": audit_logs,
+                "device_id": device_id,
+                "pagination": {
+                    "current_count": len(audit_logs),
+                    "has_more": has_more,
+                    "next_before": f"{audit_logs[-1].get('created_at')}|{audit_logs[-1].get('id')}"
+                    if has_more and audit_logs
+                    else None,
+                    "suggested_next_limit": limit,
+                },
+            }
+        except Exception as e:
+            self.logger.tool_error(tool_name, str(e))
+            return {"error": str(e)}
+
+    async def _get_action_attempts(self, tool_input: Any) -> dict[str, Any]:
+        """Fetch recent action attempts for a device."""
+        tool_name = "get_action_attempts"
+        device_id = tool_input["device_id"]
+        workspace_id = tool_input["workspace_id"]
+        limit = tool_input.get("limit", 10)
+        self.logger.debug(
+            f"Querying action attempts for device: {device_id} in workspace: {workspace_id}",
+            LogContext.DATABASE,
+        )
+        try:
+            action_attempts = await self.db_client.get_action_attempts(
+                device_id, workspace_id, limit
+            )
 
-        elif tool_name == "get_admin_links":
-            investigation_context = tool_input["investigation_context"]
-            self.logger.debug(
-                "Generating admin links for investigation context",
-                LogContext.TOOL_EXECUTION,
+            # Check if there are more results by querying with limit + 1
+            check_more = await self.db_client.get_action_attempts(
+                device_id, workspace_id, limit + 1
+            )
+            has_more = len(check_more) > limit
+
+            successful = sum(1 for a in action_attempts if a.get("status") == "success")
+            key_findings = f"{len(action_attempts)} attempts ({successful} successful)"
+            if has_more:
+                key_findings += " (more available)"
+
+            self.logger.tool_success(tool_name, len(str(action_attempts)), key_findings)
+            result = {
+                "action_attempts": action_attempts,
+                "device_id": device_id,
+                "workspace_id": workspace_id,
+                "pagination": {
+                    "current_count": len(action_attempts),
+                    "has_more": has_more,
+                    "suggested_next_limit": limit * 2 if has_more else limit,
+                },
+            }
+            # Cache result to prevent hallucinations in admin links
+            self._executed_tools_cache[tool_name] = result
+            return result
+        except Exception as e:
+            self.logger.tool_error(tool_name, str(e))
+            return {"error": str(e)}
+
+    async def _get_device_events(self, tool_input: Any) -> dict[str, Any]:
+        """Fetch recent events for a device."""
+        tool_name = "get_device_events"
+        device_id = tool_input["device_id"]
+        workspace_id = tool_input["workspace_id"]
+        limit = tool_input.get("limit", 10)
+        self.logger.debug(
+            f"Querying device events for device: {device_id} in workspace: {workspace_id}",
+            LogContext.DATABASE,
+        )
+        try:
+            device_events = await self.db_client.get_device_events(
+                device_id, workspace_id, limit
             )
-            try:
-                # AUTO-BUILD CONTEXT: Enhance context with data from previous tool executions
-                enhanced_context = self._build_enhanced_investigation_context(
-                    investigation_context
-                )
 
-                admin_links = self.admin_links_client.get_relevant_admin_links(
-                    enhanced_context
-                )
-                key_findings = f"{len(admin_links)} relevant admin pages found"
-                self.logger.tool_success(tool_name, len(str(admin_links)), key_findings)
-                return {
-                    "admin_links": admin_links,
-                    "context_processed": enhanced_context,
-                }
-            except Exception as e:
-                self.logger.tool_error(tool_name, str(e))
-                return {"error": str(e)}
+            # Check if there are more results by querying with limit + 1
+            check_more = await self.db_client.get_device_events(
+                device_id, workspace_id, limit + 1
+            )
+            has_more = len(check_more) > limit
+
+            key_findings = f"{len(device_events)} device events found"
+            if has_more:
+                key_findings += " (more available)"
+
+            self.logger.tool_success(tool_name, len(str(device_events)), key_findings)
+            return {
+                "device_events": device_events,
+                "device_id": device_id,
+                "workspace_id": workspace_id,
+                "pagination": {
+                    "current_count": len(device_events),
+                    "has_more": has_more,
+                    "suggested_next_limit": limit * 2 if has_more else limit,
+                },
+            }
+        except Exception as e:
+            self.logger.tool_error(tool_name, str(e))
+            return {"error": str(e)}
+
+    async def _get_admin_links(self, tool_input: Any) -> dict[str, Any]:
+        """Generate admin links for the investigation context."""
+        tool_name = "get_admin_links"
+        investigation_context = tool_input["investigation_context"]
+        self.logger.debug(
+            "Generating admin links for investigation context",
+            LogContext.TOOL_EXECUTION,
+        )
+        try:
+            # AUTO-BUILD CONTEXT: Enhance context with data from previous tool executions
+            enhanced_context = self._build_enhanced_investigation_context(
+                investigation_context
+            )
 
-        else:
-            self.logger.error(f"Unknown tool: {tool_name}", LogContext.TOOL_EXECUTION)
-            return {"error": f"Unknown tool: {tool_name}"}
+            admin_links = self.admin_links_client.get_relevant_admin_links(
+                enhanced_context
+            )
+            key_findings = f"{len(admin_links)} relevant admin pages found"
+            self.logger.tool_success(tool_name, len(str(admin_links)), key_findings)
+            return {
+                "admin_links": admin_links,
+                "context_processed": enhanced_context,
+            }
+        except Exception as e:
+            self.logger.tool_error(tool_name, str(e))
+            return {"error": str(e)}
 
     async def process_and_execute_tool(
         self,
@@ -421,7 +421,7 @@ class ToolResultProcessor:
         pagination = raw_result.get("pagination", {})
         if pagination.get("has_more"):
             follow_up_suggestions.append(
-                f"More audit data available (use limit={pagination.get('suggested_next_limit', 50)})"
+                f"More audit data available (use before={pagination.get('next_before')})"
             )
 
         structured_findings.update(
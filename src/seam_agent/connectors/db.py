@@ -1,9 +1,59 @@
+import asyncio
+import functools
 import os
-from typing import Any, Optional, List, Dict
+import re
+from typing import Any, Optional, List, Dict, Sequence
 from contextlib import asynccontextmanager
 
 import asyncpg
 
+# Statements that write or change permissions/schema (SELECT ... INTO creates a
+# table); checked after string literals are removed so values like 'DELETE' in
+# a WHERE clause are allowed
+UNSAFE_SQL_KEYWORDS = re.compile(
+    r"\b(INSERT|UPDATE|DELETE|DROP|ALTER|TRUNCATE|GRANT|REVOKE|CREATE|COPY|INTO)\b",
+    re.IGNORECASE,
+)
+SQL_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+
+
+# One pool per database URL, shared by every DatabaseClient on an event loop
+# so investigators created per query don't each open their own connections.
+# asyncpg pools only work on the loop that created them, so each loop (e.g.
+# each asyncio.run()) gets its own pools and lock.
+_pools: dict[asyncio.AbstractEventLoop, dict[str, asyncpg.Pool]] = {}
+_pools_locks: dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+
+
+def _loop_pools() -> tuple[asyncio.Lock, dict[str, asyncpg.Pool]]:
+    """Return the running loop's pool lock and pools, forgetting closed loops."""
+    loop = asyncio.get_running_loop()
+    if loop not in _pools:
+        for stale_loop in [other for other in _pools if other.is_closed()]:
+            del _pools[stale_loop]
+            del _pools_locks[stale_loop]
+        _pools[loop] = {}
+        _pools_locks[loop] = asyncio.Lock()
+    return _pools_locks[loop], _pools[loop]
+
+
+async def close_pools() -> None:
+    """Close the running loop's shared connection pools, e.g. on shutdown."""
+    pools_lock, pools = _loop_pools()
+    async with pools_lock:
+        closing = list(pools.values())
+        pools.clear()
+    for pool in closing:
+        await pool.close()
+
+
+@functools.lru_cache(maxsize=256)
+def _is_read_only_select(query: str) -> bool:
+    """Check that query is a plain SELECT; cached since LLMs retry identical SQL."""
+    if not query.lstrip().upper().startswith("SELECT"):
+        return False
+    return UNSAFE_SQL_KEYWORDS.search(SQL_STRING_LITERAL.sub("''", query)) is None
+
 
 class DatabaseClient:
     """Async client for PostgreSQL database queries."""
@@ -21,15 +71,27 @@ class DatabaseClient:
         self.pool: asyncpg.pool.Pool | None = None
 
     async def connect(self):
-        """Initialize connection pool."""
+        """Attach to the shared connection pool for this database, creating it if needed."""
         if not self.pool:
             if not self.database_url:
                 raise ValueError("DATABASE_URL environment variable is required")
             database_url = self._fix_ssl_config(self.database_url)
 
-            self.pool = await asyncpg.create_pool(
-                database_url, min_size=1, max_size=10, command_timeout=30
-            )
+            pools_lock, pools = _loop_pools()
+            async with pools_lock:
+                pool = pools.get(database_url)
+                if pool is None or pool.is_closing():
+                    # A larger statement cache keeps the parameterized
+                    # investigation queries prepared across calls
+                    pool = await asyncpg.create_pool(
+                        database_url,
+                        min_size=2,
+                        max_size=20,
+                        command_timeout=30,
+                        statement_cache_size=1024,
+                    )
+                    pools[database_url] = pool
+            self.pool = pool
 
     def _fix_ssl_config(self, url: str) -> str:
         """Fix SSL configuration to be compatible with asyncpg."""
@@ -50,10 +112,8 @@ class DatabaseClient:
         return url
 
     async def close(self):
-        """Close connection pool."""
-        if self.pool:
-            await self.pool.close()
-            self.pool = None
+        """Detach from the connection pool; the shared pool stays open."""
+        self.pool = None
 
     @asynccontextmanager
     async def get_connection(self):
@@ -208,18 +268,58 @@ class DatabaseClient:
         async with self.get_connection() as conn:
             result = await conn.fetchrow(query, device_id)
             if result:
-                device_info = dict(result)
-                # Convert UUID and datetime objects to strings for JSON serialization
-                for key, value in device_info.items():
-                    if hasattr(value, "hex"):  # UUID objects have a hex attribute
-                        device_info[key] = str(value)
-                    elif hasattr(
-                        value, "isoformat"
-                    ):  # datetime objects have isoformat method
-                        device_info[key] = value.isoformat()
-                return device_info
+                return self._device_row_to_dict(result)
             return None
 
+    async def get_devices_by_ids(
+        self, device_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several devices by device ID or third party device ID in one query.
+
+        Args:
+            device_ids: Device IDs or third party device IDs to look up
+
+        Returns:
+            Device information by requested ID; IDs with no device are omitted
+        """
+        query = """
+        SELECT seam.device.*, seam.phone_sdk_installation.phone_sdk_installation_id
+        FROM seam.device
+        LEFT JOIN seam.phone_sdk_installation ON seam.phone_sdk_installation.device_id = seam.device.device_id
+        WHERE (seam.device.device_id = ANY($1) OR seam.device.third_party_device_id = ANY($1));
+        """
+
+        async with self.get_connection() as conn:
+            rows = await conn.fetch(query, device_ids)
+
+        # Index each device under both of its IDs, keeping the first row like LIMIT 1
+        by_id: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            device_info = self._device_row_to_dict(row)
+            for key in ("device_id", "third_party_device_id"):
+                if device_info.get(key) is not None:
+                    by_id.setdefault(str(device_info[key]), device_info)
+
+        devices = {}
+        for device_id in device_ids:
+            # UUIDs come back lowercased, so fall back to a lowercase match
+            device_info = by_id.get(device_id) or by_id.get(device_id.lower())
+            if device_info is not None:
+                devices[device_id] = device_info
+        return devices
+
+    @staticmethod
+    def _device_row_to_dict(row: asyncpg.Record) -> Dict[str, Any]:
+        """Convert a device row, turning UUIDs and datetimes into strings for JSON."""
+        device_info = dict(row)
+        for key, value in device_info.items():
+            if hasattr(value, "hex"):  # UUID objects have a hex attribute
+                device_info[key] = str(value)
+            elif hasattr(value, "isoformat"):  # datetime objects have isoformat method
+                device_info[key] = value.isoformat()
+        return device_info
+
     async def get_third_party_device_by_id(
         self, third_party_device_id: str
     ) -> Optional[Dict[str, Any]]:
@@ -332,7 +432,11 @@ class DatabaseClient:
             return access_codes
 
     async def get_audit_logs(
-        self, device_id: str, limit: int = 10
+        self,
+        device_id: str,
+        limit: int = 10,
+        before: str | None = None,
+        before_id: str | None = None,
     ) -> List[Dict[str, Any]]:
         """
         Get audit logs for access code operations on a device.
@@ -340,20 +444,31 @@ class DatabaseClient:
         Args:
             device_id: The device ID to lookup
             limit: Maximum number of results (default 10)
+            before: Only return entries created before this ISO timestamp,
+                i.e. the created_at of the last entry on the previous page
+            before_id: id of that last entry, so entries sharing its
+                created_at are not skipped; without it only strictly older
+                entries are returned
 
         Returns:
-            List of audit log records
+            List of audit log records, newest first
         """
+        # Keyset on (created_at, id) so ties on created_at span pages correctly;
+        # Postgres parses the timestamp, so a trailing "Z" is accepted too
         query = """
         SELECT *
         FROM diagnostics.access_code_audit
         WHERE device_id = $1 AND (operation = 'INSERT' OR operation = 'DELETE')
-        ORDER BY created_at DESC
+            AND (
+                $3::text IS NULL
+                OR (created_at, id::text) < ($3::text::timestamptz, coalesce($4::text, ''))
+            )
+        ORDER BY created_at DESC, id::text DESC
         LIMIT $2;
         """
 
         async with self.get_connection() as conn:
-            results = await conn.fetch(query, device_id, limit)
+            results = await conn.fetch(query, device_id, limit, before, before_id)
             audit_logs = []
             for result in results:
                 log_info = dict(result)
@@ -407,7 +522,7 @@ class DatabaseClient:
             return events
 
     async def execute_safe_query(
-        self, query: str, params: List[Any] = []
+        self, query: str, params: Sequence[Any] = ()
     ) -> List[Dict[str, Any]]:
         """
         Execute a safe, read-only query with parameter validation.
@@ -422,13 +537,14 @@ class DatabaseClient:
         Raises:
             ValueError: If query is not a safe SELECT statement
         """
-        # Basic safety check - only allow SELECT statements
-        query_upper = query.strip().upper()
-        if not query_upper.startswith("SELECT"):
+        if not _is_read_only_select(query):
             raise ValueError("Only SELECT queries are allowed")
 
+        # The keyword check is a first filter; a read-only transaction makes
+        # Postgres itself reject anything that would write
         async with self.get_connection() as conn:
-            rows = await conn.fetch(query, *params)
+            async with conn.transaction(readonly=True):
+                rows = await conn.fetch(query, *params)
             return [dict(row) for row in rows]
 
     async def __aenter__(self):
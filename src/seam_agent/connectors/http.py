@@ -0,0 +1,69 @@
+"""
+Shared HTTP client for the Seam API and Quickwit connectors.
+"""
+
+import asyncio
+from typing import Any, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+# One pooled client per event loop so TLS sessions and keep-alive connections
+# are reused across tool calls instead of re-handshaking on every request.
+# Connections belong to the loop that opened them, so each asyncio.run() gets
+# its own client.
+_http_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+# Concurrency caps per (event loop, name); a semaphore binds to the first loop
+# that waits on it, so each asyncio.run() needs its own
+_request_slots: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Semaphore] = {}
+
+
+def running_loop() -> asyncio.AbstractEventLoop | None:
+    """Return the running event loop, or None when called outside one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def forget_closed_loops(cache: dict[Any, T]) -> None:
+    """Drop cache entries keyed by (or on) event loops that have been closed."""
+    for key in list(cache):
+        loop = key[0] if isinstance(key, tuple) else key
+        if loop is not None and loop.is_closed():
+            del cache[key]
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the running loop's shared HTTP client, creating it on first use."""
+    loop = running_loop()
+    client = _http_clients.get(loop) if loop else None
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+        # Outside a loop there is nothing to tie the client to, so don't share it
+        if loop is not None:
+            forget_closed_loops(_http_clients)
+            _http_clients[loop] = client
+    return client
+
+
+def get_request_slots(name: str, limit: int) -> asyncio.Semaphore:
+    """Return the running loop's semaphore capping concurrent `name` requests."""
+    loop = asyncio.get_running_loop()
+    slots = _request_slots.get((loop, name))
+    if slots is None:
+        forget_closed_loops(_request_slots)
+        slots = _request_slots[(loop, name)] = asyncio.Semaphore(limit)
+    return slots
+
+
+async def aclose_http_client() -> None:
+    """Close the running loop's shared HTTP client, e.g. on server shutdown."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
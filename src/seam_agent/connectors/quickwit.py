@@ -1,29 +1,38 @@
 import httpx
+import orjson
 import os
-from typing import Any, Optional, List, Dict
+from typing import Any, Optional, List, Dict, Tuple
 from datetime import datetime
 
+from seam_agent.connectors.http import get_http_client, get_request_slots
+
+# Quickwit rejects searches asking for more hits than this in one request
+MAX_HITS_PER_REQUEST = 10_000
+
+# Caps concurrent searches so a burst of log queries doesn't overload Quickwit
+QUICKWIT_MAX_CONCURRENCY = int(os.getenv("QUICKWIT_MAX_CONCURRENCY", "16"))
+
 
 class QuickwitClient:
     """Async client for searching Quickwit logs."""
 
     def __init__(self, base_url: str | None = None, api_key: str | None = None):
-        self.base_url = base_url or os.getenv("QUICKWIT_URL", "http://localhost:7280")
+        self.base_url = (
+            base_url or os.getenv("QUICKWIT_URL", "http://localhost:7280")
+        ).rstrip("/")
         self.api_key = api_key or os.getenv("QUICKWIT_API_KEY")
 
-        headers = {"Content-Type": "application/json"}
+        self.headers = {"Content-Type": "application/json"}
         if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
+            self.headers["Authorization"] = f"Bearer {self.api_key}"
 
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url.rstrip("/"),
-            headers=headers,
-            timeout=30.0,
-        )
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled HTTP client shared with other connectors."""
+        return get_http_client()
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Release the client; the shared connection pool stays open."""
 
     async def __aenter__(self):
         return self
@@ -38,8 +47,8 @@ class QuickwitClient:
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
         limit: int = 100,
-        start_offset: int = 0,
-    ) -> List[Dict[str, Any]]:
+        search_after: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         """
         Search logs in a Quickwit index with a flexible query.
 
@@ -53,10 +62,12 @@ class QuickwitClient:
             start_time: Optional start time for the search window.
             end_time: Optional end time for the search window.
             limit: Maximum number of log entries to return.
-            start_offset: Number of log entries to skip from the beginning.
+            search_after: Cursor returned by a previous call; only entries
+                          after that position (older) are returned.
 
         Returns:
-            A list of log entries matching the search criteria.
+            A tuple of the log entries matching the search criteria, newest
+            first, and the cursor for the next page (None if this was the last).
 
         Query Examples:
             - To find errors for a device:
@@ -66,33 +77,77 @@ class QuickwitClient:
             - To find logs for a specific job:
               query='job_id:job_xyz'
         """
-        search_params = {
-            "query": query,
-            "max_hits": limit,
-            "start_offset": start_offset,
-            "format": "json",
-        }
+        # Quickwit caps the hits per request, so walk larger requests page by
+        # page using the same cursor callers use between tool calls
+        logs: List[Dict[str, Any]] = []
+        cursor = search_after
+        while len(logs) < limit:
+            page_size = min(limit - len(logs), MAX_HITS_PER_REQUEST)
+            page, cursor = await self._search_page(
+                index, query, start_time, end_time, page_size, cursor
+            )
+            logs.extend(page)
+            if len(page) < page_size or cursor is None:
+                return logs, None
+        return logs, cursor
 
-        # Add time range filters if provided (using Quickwit's time range format)
+    async def _search_page(
+        self,
+        index: str,
+        query: str,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        limit: int,
+        search_after: Optional[str],
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Run a single Quickwit search request of at most MAX_HITS_PER_REQUEST."""
+        filters: List[Dict[str, Any]] = [{"query_string": {"query": query}}]
+
+        # Add time range filters if provided
+        time_range: Dict[str, str] = {}
         if start_time:
-            search_params["start_timestamp"] = int(start_time.timestamp() * 1000)
+            time_range["gte"] = start_time.isoformat()
         if end_time:
-            search_params["end_timestamp"] = int(end_time.timestamp() * 1000)
+            time_range["lte"] = end_time.isoformat()
+        if time_range:
+            filters.append({"range": {"timestamp": time_range}})
+
+        # Keyset pagination through the Elasticsearch-compatible endpoint's
+        # search_after; _shard_doc breaks ties between equal timestamps so
+        # entries sharing the last timestamp of a page are not dropped
+        search_params: Dict[str, Any] = {
+            "query": {"bool": {"filter": filters}},
+            "size": limit,
+            "sort": [
+                {"timestamp": {"order": "desc"}},
+                {"_shard_doc": {"order": "desc"}},
+            ],
+        }
+        if search_after:
+            try:
+                search_params["search_after"] = orjson.loads(search_after)
+            except orjson.JSONDecodeError:
+                raise ValueError(f"Invalid search_after cursor: {search_after}")
 
         try:
-            response = await self.client.post(
-                f"/api/v1/{index}/search", json=search_params
-            )
+            async with get_request_slots("quickwit", QUICKWIT_MAX_CONCURRENCY):
+                response = await self.client.post(
+                    f"{self.base_url}/api/v1/_elastic/{index}/_search",
+                    json=search_params,
+                    headers=self.headers,
+                )
             response.raise_for_status()
 
-            data = response.json()
-            return data.get("hits", [])
+            hits = response.json().get("hits", {}).get("hits", [])
+            cursor = orjson.dumps(hits[-1]["sort"]).decode() if hits else None
+            return [hit.get("_source", {}) for hit in hits], cursor
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 raise ValueError(f"Index '{index}' not found")
             elif e.response.status_code == 400:
-                error_detail = e.response.json().get("detail", str(e))
+                error = e.response.json().get("error", {})
+                error_detail = error.get("reason", str(e)) if error else str(e)
                 raise ValueError(
                     f"Invalid search query: {query}. Error: {error_detail}"
                 )
@@ -1,14 +1,32 @@
+import asyncio
+import copy
 import httpx
 import os
+from itertools import chain
 from typing import Any
 
+from seam_agent.assistant.cache import LRUCache
+from seam_agent.connectors.http import get_http_client, get_request_slots
+
+# Upper bound on IDs per /action_attempts/list request to keep URLs short
+ACTION_ATTEMPT_IDS_PER_REQUEST = 50
+
+# Caps concurrent Seam API requests across all clients so a wide fan-out
+# queues locally instead of tripping the API's rate limits
+SEAM_API_MAX_CONCURRENCY = int(os.getenv("SEAM_API_MAX_CONCURRENCY", "32"))
+
 
 class SeamAPIClient:
     """Async client for interacting with Seam device endpoints."""
 
     api_key: str
     base_url: str
-    client: httpx.AsyncClient
+    headers: dict[str, str]
+
+    # Last ETag and body per (api key, device ID), for conditional device GETs
+    _device_etags: LRUCache[tuple[str, str], tuple[str, dict[str, Any]]] = LRUCache(
+        maxsize=1024
+    )
 
     def __init__(
         self, api_key: str | None = None, base_url: str = "https://connect.getseam.com"
@@ -21,18 +39,18 @@ class SeamAPIClient:
         self.api_key = resolved_api_key
 
         self.base_url = base_url.rstrip("/")
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            },
-            timeout=30.0,
-        )
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled HTTP client shared with other connectors."""
+        return get_http_client()
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Release the client; the shared connection pool stays open."""
 
     async def __aenter__(self):
         return self
@@ -40,6 +58,28 @@ class SeamAPIClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
 
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request to the Seam API, raising for error responses.
+
+        A 304 Not Modified is returned as-is for conditional requests.
+        """
+        async with get_request_slots("seam_api", SEAM_API_MAX_CONCURRENCY):
+            response = await self.client.request(
+                method,
+                f"{self.base_url}{path}",
+                headers={**self.headers, **headers} if headers else self.headers,
+                **kwargs,
+            )
+        if response.status_code != httpx.codes.NOT_MODIFIED:
+            response.raise_for_status()
+        return response
+
     async def list_devices(
         self,
         device_type: str | None = None,
@@ -77,12 +117,40 @@ class SeamAPIClient:
         if search:
             params["search"] = search
 
-        response = await self.client.get("/devices/list", params=params)
-        response.raise_for_status()
+        response = await self._request("GET", "/devices/list", params=params)
 
         data = response.json()
         return data.get("devices", [])
 
+    async def list_devices_page(
+        self, page_size: int = 200, page_cursor: str | None = None
+    ) -> dict[str, Any]:
+        """
+        List one page of devices from Seam API.
+
+        Args:
+            page_size: Maximum number of devices in the page
+            page_cursor: Cursor from a previous page's next_cursor
+
+        Returns:
+            Dictionary with `devices` (raw API data) and `next_cursor`
+            (None when this is the last page)
+        """
+        params: dict[str, Any] = {"limit": page_size}
+        if page_cursor:
+            params["page_cursor"] = page_cursor
+
+        response = await self._request("GET", "/devices/list", params=params)
+
+        data = response.json()
+        pagination = data.get("pagination") or {}
+        return {
+            "devices": data.get("devices", []),
+            "next_cursor": pagination.get("next_page_cursor")
+            if pagination.get("has_next_page")
+            else None,
+        }
+
     async def get_device(
         self, device_id: str | None = None, name: str | None = None
     ) -> dict[str, Any]:
@@ -107,11 +175,24 @@ class SeamAPIClient:
         if name:
             params["name"] = name
 
-        response = await self.client.get("/devices/get", params=params)
-        response.raise_for_status()
+        # Revalidate a previously seen device instead of downloading it again
+        cache_key = (self.api_key, device_id) if device_id else None
+        cached = self._device_etags.get(cache_key) if cache_key else None
+        response = await self._request(
+            "GET",
+            "/devices/get",
+            params=params,
+            headers={"If-None-Match": cached[0]} if cached else None,
+        )
+        if cached and response.status_code == httpx.codes.NOT_MODIFIED:
+            return copy.deepcopy(cached[1])
 
-        data = response.json()
-        return data["device"]
+        device = response.json()["device"]
+        etag = response.headers.get("ETag")
+        if cache_key and etag:
+            # Cache a separate copy so callers mutating the result can't alter it
+            self._device_etags.set(cache_key, (etag, copy.deepcopy(device)))
+        return device
 
     async def find_resources(self, search: str) -> dict[str, Any]:
         """
@@ -125,8 +206,9 @@ class SeamAPIClient:
         """
         params = {"search": search}
 
-        response = await self.client.post("/workspaces/find_resources", params=params)
-        response.raise_for_status()
+        response = await self._request(
+            "POST", "/workspaces/find_resources", params=params
+        )
 
         data = response.json()
         return data.get("batch", {})
@@ -143,8 +225,7 @@ class SeamAPIClient:
         """
         params = {"action_attempt_id": action_attempt_id}
 
-        response = await self.client.get("/action_attempts/get", params=params)
-        response.raise_for_status()
+        response = await self._request("GET", "/action_attempts/get", params=params)
 
         data = response.json()
         return data["action_attempt"]
@@ -159,12 +240,31 @@ class SeamAPIClient:
             action_attempt_ids: List of action attempt IDs to retrieve
 
         Returns:
-            List of action attempt dictionaries with raw API data
+            List of action attempt dictionaries with raw API data; batched
+            results are concatenated in request order
         """
+        # IDs go in the query string, so large lists are split into batches
+        # that are fetched concurrently
+        unique_ids = list(dict.fromkeys(action_attempt_ids))
+        batches = [
+            unique_ids[start : start + ACTION_ATTEMPT_IDS_PER_REQUEST]
+            for start in range(0, len(unique_ids), ACTION_ATTEMPT_IDS_PER_REQUEST)
+        ]
+        if len(batches) <= 1:
+            return await self._list_action_attempts_batch(unique_ids)
+
+        results = await asyncio.gather(
+            *(self._list_action_attempts_batch(batch) for batch in batches)
+        )
+        return list(chain.from_iterable(results))
+
+    async def _list_action_attempts_batch(
+        self, action_attempt_ids: list[str]
+    ) -> list[dict[str, Any]]:
+        """Fetch one batch of action attempts in a single request."""
         params = {"action_attempt_ids": action_attempt_ids}
 
-        response = await self.client.get("/action_attempts/list", params=params)
-        response.raise_for_status()
+        response = await self._request("GET", "/action_attempts/list", params=params)
 
         data = response.json()
         return data.get("action_attempts", [])
@@ -181,8 +281,7 @@ class SeamAPIClient:
         """
         params = {"connected_account_id": connected_account_id}
 
-        response = await self.client.get("/connected_accounts/get", params=params)
-        response.raise_for_status()
+        response = await self._request("GET", "/connected_accounts/get", params=params)
 
         data = response.json()
         return data["connected_account"]
@@ -0,0 +1,13 @@
+"""
+Shared stand-ins for API objects used across the investigator tests.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True)
+class FakeResponse:
+    """Stand-in for an Anthropic Message; the investigator only reads content."""
+
+    content: list[Any]
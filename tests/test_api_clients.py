@@ -0,0 +1,31 @@
+"""
+Tests for the shared OpenAI and Anthropic SDK clients.
+"""
+
+import asyncio
+
+from seam_agent.assistant.api_clients import (
+    aclose_api_clients,
+    get_anthropic_client,
+    get_openai_client,
+)
+
+
+def test_sdk_clients_are_shared_per_event_loop():
+    """Clients are reused per key on their loop but not across asyncio.run()."""
+
+    async def get_clients():
+        anthropic = get_anthropic_client("test-key")
+        openai = get_openai_client("test-key")
+        assert get_anthropic_client("test-key") is anthropic
+        assert get_openai_client("test-key") is openai
+        assert get_anthropic_client("other-key") is not anthropic
+        await aclose_api_clients()
+        return anthropic, openai
+
+    first = asyncio.run(get_clients())
+    second = asyncio.run(get_clients())
+
+    assert first[0] is not second[0]
+    assert first[1] is not second[1]
+    assert all(client.is_closed() for client in (*first, *second))
@@ -0,0 +1,108 @@
+"""
+Tests for BatchInvestigator using mocked Anthropic batch endpoints.
+"""
+
+import os
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from seam_agent.assistant.batch_investigator import BatchInvestigator
+from seam_agent.assistant.investigation_config import InvestigationConfig
+from seam_agent.assistant.query_parser import ParsedQuery
+
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-anthropic-key")
+
+
+class AsyncEntries:
+    """Async iterator standing in for the batch results JSONL decoder."""
+
+    def __init__(self, entries):
+        self._entries = iter(entries)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._entries)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def _text_message(text: str):
+    from anthropic.types import TextBlock
+
+    message = Mock()
+    message.content = [TextBlock(type="text", text=text)]
+    return message
+
+
+@pytest.mark.asyncio
+async def test_investigate_many_uses_batch_results_and_falls_back_on_errors():
+    """Succeeded items continue from the batch; errored items are sent directly."""
+
+    with (
+        patch("seam_agent.assistant.simple_investigator.DatabaseClient"),
+        patch("seam_agent.assistant.simple_investigator.SeamAPIClient"),
+        patch(
+            "seam_agent.assistant.simple_investigator.get_anthropic_client"
+        ) as investigator_anthropic_class,
+        patch(
+            "seam_agent.assistant.batch_investigator.get_anthropic_client"
+        ) as batch_anthropic_class,
+    ):
+        investigator_anthropic = AsyncMock()
+        investigator_anthropic.messages.create.return_value = _text_message(
+            "Direct analysis"
+        )
+        investigator_anthropic_class.return_value = investigator_anthropic
+
+        batch_anthropic = AsyncMock()
+        batch_anthropic.messages.batches.create.return_value = Mock(id="batch_1")
+        batch_anthropic.messages.batches.retrieve.side_effect = [
+            Mock(processing_status="in_progress"),
+            Mock(processing_status="ended"),
+        ]
+        batch_anthropic.messages.batches.results.return_value = AsyncEntries(
+            [
+                Mock(
+                    custom_id="query-1",
+                    result=Mock(type="errored"),
+                ),
+                Mock(
+                    custom_id="query-0",
+                    result=Mock(
+                        type="succeeded", message=_text_message("Batched analysis")
+                    ),
+                ),
+            ]
+        )
+        batch_anthropic_class.return_value = batch_anthropic
+
+        batch_investigator = BatchInvestigator(
+            api_key="test",
+            config=InvestigationConfig(MAX_TOOL_ROUNDS=2, MAX_TOTAL_TOOLS=3),
+            poll_interval=0,
+        )
+        parsed_query = ParsedQuery(
+            question_type="troubleshooting", confidence=0.9, summary="Lock offline"
+        )
+
+        with patch(
+            "seam_agent.assistant.query_parser.SupportQueryParser.parse",
+            AsyncMock(return_value=parsed_query),
+        ):
+            results = await batch_investigator.investigate_many(
+                ["First query", "Second query"]
+            )
+
+        batch_requests = batch_anthropic.messages.batches.create.call_args[1][
+            "requests"
+        ]
+        assert [r["custom_id"] for r in batch_requests] == ["query-0", "query-1"]
+        assert "First query" in batch_requests[0]["params"]["messages"][0]["content"]
+
+        assert [r["original_query"] for r in results] == ["First query", "Second query"]
+        assert results[0]["raw_analysis"] == "Batched analysis"
+        assert results[1]["raw_analysis"] == "Direct analysis"
@@ -0,0 +1,44 @@
+"""
+Tests for BatchLoader request coalescing.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from seam_agent.assistant.batch_loader import BatchLoader
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_share_one_batch():
+    batch_fn = AsyncMock(side_effect=lambda keys: {key: key.upper() for key in keys})
+    loader = BatchLoader(batch_fn)
+
+    results = await asyncio.gather(loader.load("a"), loader.load("b"), loader.load("a"))
+
+    assert results == ["A", "B", "A"]
+    batch_fn.assert_awaited_once_with(["a", "b"])
+
+
+@pytest.mark.asyncio
+async def test_full_batch_dispatches_without_waiting():
+    batch_fn = AsyncMock(side_effect=lambda keys: {key: key for key in keys})
+    loader = BatchLoader(batch_fn, max_batch_size=2, delay=60)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(loader.load("a"), loader.load("b")), timeout=1
+    )
+
+    assert results == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_missing_key_raises_lookup_error():
+    loader = BatchLoader(AsyncMock(return_value={"a": 1}))
+
+    found, missing = await asyncio.gather(
+        loader.load("a"), loader.load("b"), return_exceptions=True
+    )
+
+    assert found == 1
+    assert isinstance(missing, LookupError)
@@ -0,0 +1,34 @@
+"""
+Tests for the in-memory caches.
+"""
+
+from unittest.mock import patch
+
+from seam_agent.assistant.cache import TTLCache
+
+
+def test_ttl_cache_expires_entries():
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=5.0)
+
+    with patch("seam_agent.assistant.cache.time.monotonic", return_value=100.0):
+        cache.set("device", 1)
+
+    with patch("seam_agent.assistant.cache.time.monotonic", return_value=104.0):
+        assert cache.get("device") == 1
+
+    with patch("seam_agent.assistant.cache.time.monotonic", return_value=105.0):
+        assert cache.get("device") is None
+        assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60.0)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
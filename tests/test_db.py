@@ -0,0 +1,71 @@
+"""
+Tests for the database client's read-only query validation and shared pools.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from seam_agent.connectors.db import DatabaseClient, _is_read_only_select, close_pools
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT * FROM seam.device WHERE created_at > now()",
+        "select operation from audit where operation = 'DELETE'",
+    ],
+)
+def test_allows_read_only_selects(query):
+    assert _is_read_only_select(query)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "DELETE FROM seam.device",
+        "SELECT 1; DROP TABLE seam.device",
+        "SELECT * FROM seam.device; update seam.device set name = 'x'",
+        "SELECT * INTO evil FROM seam.device",
+    ],
+)
+def test_rejects_writes(query):
+    assert not _is_read_only_select(query)
+
+
+def test_pools_are_shared_per_event_loop():
+    """A pool is reused on its loop but never handed to a later asyncio.run()."""
+    created: list[MagicMock] = []
+
+    async def create_pool(*args, **kwargs):
+        pool = MagicMock(is_closing=MagicMock(return_value=False), close=AsyncMock())
+        created.append(pool)
+        return pool
+
+    async def connect_twice():
+        first = DatabaseClient("postgresql://localhost/seam")
+        second = DatabaseClient("postgresql://localhost/seam")
+        await first.connect()
+        await second.connect()
+        assert first.pool is second.pool
+        await close_pools()
+
+    with patch("seam_agent.connectors.db.asyncpg.create_pool", create_pool):
+        asyncio.run(connect_twice())
+        asyncio.run(connect_twice())
+
+    assert len(created) == 2
+    for pool in created:
+        pool.close.assert_awaited_once()
+
+
+def test_safe_queries_run_in_a_read_only_transaction():
+    conn = MagicMock(fetch=AsyncMock(return_value=[{"device_id": "d1"}]))
+    client = DatabaseClient("postgresql://localhost/seam")
+    client.pool = MagicMock()
+    client.pool.acquire.return_value.__aenter__.return_value = conn
+
+    rows = asyncio.run(client.execute_safe_query("SELECT device_id FROM seam.device"))
+
+    assert rows == [{"device_id": "d1"}]
+    conn.transaction.assert_called_once_with(readonly=True)
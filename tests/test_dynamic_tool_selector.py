@@ -13,17 +13,18 @@ from seam_agent.assistant.investigation_config import (
     InvestigationConfig,
     InvestigationState,
 )
+from seam_agent.assistant.query_parser import ParsedQuery
 
 
-class MockParsedQuery:
-    """Mock ParsedQuery for testing."""
-
-    def __init__(
-        self, question_type="device_issue", access_codes=None, device_ids=None
-    ):
-        self.question_type = question_type
-        self.access_codes = access_codes or []
-        self.device_ids = device_ids or []
+def make_parsed_query(
+    question_type="device_issue", access_codes=None, device_ids=None
+) -> ParsedQuery:
+    """Build a ParsedQuery for testing, without the fields a parse would fill in."""
+    return ParsedQuery.model_construct(
+        question_type=question_type,
+        access_codes=access_codes or [],
+        device_ids=device_ids or [],
+    )
 
 
 class TestToolResult:
@@ -121,7 +122,7 @@ class TestDynamicToolSelector:
 
     def test_select_initial_tools_for_access_code_issue(self):
         """Test initial tool selection for access code issues."""
-        parsed_query = MockParsedQuery(
+        parsed_query = make_parsed_query(
             question_type="access_code", access_codes=["test-code"]
         )
         query = "Hi team, can you help me check if this unmanaged code is something we created?"
@@ -135,7 +136,7 @@ class TestDynamicToolSelector:
 
     def test_select_initial_tools_for_connectivity_issue(self):
         """Test initial tool selection for connectivity issues."""
-        parsed_query = MockParsedQuery()
+        parsed_query = make_parsed_query()
         query = "The device appears to be offline and not responding to commands"
 
         tools = self.selector.select_initial_tools(parsed_query, query)
@@ -145,7 +146,7 @@ class TestDynamicToolSelector:
 
     def test_select_initial_tools_for_action_issue(self):
         """Test initial tool selection for action/operation issues."""
-        parsed_query = MockParsedQuery()
+        parsed_query = make_parsed_query()
         query = "The unlock operation failed with an error"
 
         tools = self.selector.select_initial_tools(parsed_query, query)
@@ -155,7 +156,7 @@ class TestDynamicToolSelector:
 
     def test_select_initial_tools_for_general_issue(self):
         """Test initial tool selection for unclear/general issues."""
-        parsed_query = MockParsedQuery()
+        parsed_query = make_parsed_query()
         query = "Something is wrong with my device"
 
         tools = self.selector.select_initial_tools(parsed_query, query)
@@ -164,6 +165,22 @@ class TestDynamicToolSelector:
         assert "get_action_attempts" in tools
         assert "get_device_events" in tools
 
+    def test_select_initial_tools_caches_selection(self):
+        """Test repeated queries reuse the cached selection without sharing it."""
+        DynamicToolSelector.clear_cache()
+        parsed_query = make_parsed_query()
+        query = "The device appears to be offline after the firmware update"
+
+        first = self.selector.select_initial_tools(parsed_query, query)
+        first.append("mutated_by_caller")
+        second = DynamicToolSelector().select_initial_tools(parsed_query, query)
+
+        assert "mutated_by_caller" not in second
+        assert len(DynamicToolSelector._initial_tools_cache) == 1
+
+        DynamicToolSelector.clear_cache()
+        assert len(DynamicToolSelector._initial_tools_cache) == 0
+
     def test_should_continue_investigation_with_sufficient_data(self):
         """Test investigation continuation decision with sufficient data."""
         # Set up selector with sufficient data
@@ -174,7 +191,6 @@ class TestDynamicToolSelector:
                 data_found=True,
                 needs_followup=False,
                 key_findings=["Device type: schlage_lock"],
-                raw_result={},
             ),
             "get_access_codes": ToolResult(
                 tool_name="get_access_codes",
@@ -182,7 +198,6 @@ class TestDynamicToolSelector:
                 data_found=True,
                 needs_followup=False,
                 key_findings=["2 access codes found"],
-                raw_result={},
             ),
         }
 
@@ -218,7 +233,6 @@ class TestDynamicToolSelector:
                 data_found=False,
                 needs_followup=True,
                 key_findings=[],
-                raw_result={"error": "Device not found"},
             )
         }
 
@@ -242,7 +256,7 @@ class TestDynamicToolSelector:
 
         state = InvestigationState()
         state.start_new_round()
-        parsed_query = MockParsedQuery()
+        parsed_query = make_parsed_query()
 
         followup_tools = self.selector.select_followup_tools(
             previous_results, state, self.config, parsed_query
@@ -262,7 +276,7 @@ class TestDynamicToolSelector:
 
         state = InvestigationState()
         state.start_new_round()
-        parsed_query = MockParsedQuery()
+        parsed_query = make_parsed_query()
 
         followup_tools = self.selector.select_followup_tools(
             previous_results, state, self.config, parsed_query
@@ -272,6 +286,33 @@ class TestDynamicToolSelector:
         assert "get_third_party_device_info" in followup_tools
         assert "get_audit_logs" in followup_tools
 
+    def test_select_followup_tools_reuses_decision_for_same_findings(self):
+        """Test equal findings share one cached decision, trimmed to the budget."""
+        DynamicToolSelector.clear_cache()
+        previous_results = {
+            "get_device_info": {"error": "Device not found"},
+            "get_action_attempts": {
+                "action_attempts": [{"status": "failed"}, {"status": "failed"}]
+            },
+        }
+        parsed_query = make_parsed_query()
+
+        state = InvestigationState()
+        state.start_new_round()
+        first = self.selector.select_followup_tools(
+            previous_results, state, self.config, parsed_query
+        )
+
+        busy_state = InvestigationState()
+        busy_state.start_new_round()
+        busy_state.tools_used_this_round = self.config.MAX_TOOLS_PER_ROUND - 1
+        second = DynamicToolSelector().select_followup_tools(
+            previous_results, busy_state, self.config, parsed_query
+        )
+
+        assert len(DynamicToolSelector._followup_tools_cache) == 1
+        assert second == first[:1]
+
     def test_investigation_phase_progression(self):
         """Test that investigation phases progress correctly."""
         assert self.selector.investigation_phase == InvestigationPhase.INITIAL
@@ -299,7 +340,6 @@ class TestDynamicToolSelector:
                 data_found=True,
                 needs_followup=False,
                 key_findings=["Device type: schlage_lock"],
-                raw_result={},
             ),
             "get_access_codes": ToolResult(
                 tool_name="get_access_codes",
@@ -307,7 +347,6 @@ class TestDynamicToolSelector:
                 data_found=True,
                 needs_followup=True,
                 key_findings=["5 access codes found"],
-                raw_result={},
             ),
         }
 
@@ -325,23 +364,47 @@ class TestDynamicToolSelector:
         """Test data quality assessment logic."""
         # Test excellent quality
         self.selector.tool_results = {
-            "tool1": ToolResult("tool1", True, True, False, [], {}),
-            "tool2": ToolResult("tool2", True, True, False, [], {}),
-            "tool3": ToolResult("tool3", True, False, False, [], {}),
+            "tool1": ToolResult("tool1", True, True, False, []),
+            "tool2": ToolResult("tool2", True, True, False, []),
+            "tool3": ToolResult("tool3", True, False, False, []),
         }
         assert self.selector._assess_data_quality() == "excellent"
 
         # Test poor quality
         self.selector.tool_results = {
-            "tool1": ToolResult("tool1", False, False, False, [], {}),
-            "tool2": ToolResult("tool2", False, False, False, [], {}),
+            "tool1": ToolResult("tool1", False, False, False, []),
+            "tool2": ToolResult("tool2", False, False, False, []),
         }
         assert self.selector._assess_data_quality() == "poor"
 
+    def test_rerun_tool_replaces_its_aggregated_result(self):
+        """Test that a re-run tool's new result replaces the old one in the aggregates."""
+        self.selector._ingest_result(
+            "get_device_info",
+            ToolResult.from_raw_result("get_device_info", {"error": "Timeout"}),
+        )
+        assert self.selector._has_critical_failures() is True
+
+        self.selector._ingest_result(
+            "get_device_info",
+            ToolResult.from_raw_result(
+                "get_device_info",
+                {"device_type": "august_lock", "properties": {"online": False}},
+            ),
+        )
+
+        assert self.selector._has_critical_failures() is False
+        assert self.selector._success_count == 1
+        assert self.selector._data_found_count == 1
+        assert self.selector.get_investigation_summary()["key_findings"] == [
+            "Device type: august_lock",
+            "Device is offline",
+        ]
+
     def test_issue_type_detection(self):
         """Test the issue type detection methods."""
         # Test access code issue detection
-        parsed_query = MockParsedQuery(
+        parsed_query = make_parsed_query(
             question_type="access_code", access_codes=["test"]
         )
         query = "unmanaged code issue"
@@ -355,6 +418,21 @@ class TestDynamicToolSelector:
         query = "unlock failed with error"
         assert self.selector._is_action_issue(parsed_query, query) is True
 
+    def test_classify_query_checks_categories_in_priority_order(self):
+        """Test that classification prefers access codes, then connectivity, then actions."""
+        parsed_query = make_parsed_query()
+
+        assert (
+            self.selector._classify_query(parsed_query, "the code was marked failed")
+            == "access_code"
+        )
+        assert (
+            self.selector._classify_query(parsed_query, "lock went offline")
+            == "connectivity"
+        )
+        assert self.selector._classify_query(parsed_query, "unlock error") == "action"
+        assert self.selector._classify_query(parsed_query, "hello") == "unknown"
+
 
 class TestIntegrationWithInvestigationConfig:
     """Test integration between DynamicToolSelector and InvestigationConfig."""
@@ -375,12 +453,35 @@ class TestIntegrationWithInvestigationConfig:
         }
 
         followup_tools = selector.select_followup_tools(
-            previous_results, state, config, MockParsedQuery()
+            previous_results, state, config, make_parsed_query()
         )
 
         # Should respect the MAX_TOOLS_PER_ROUND limit (2 total - 1 used = 1 remaining)
         assert len(followup_tools) <= 1
 
+    def test_followup_selection_respects_total_tool_budget(self):
+        """Test that follow-up selection is capped by the remaining total budget."""
+        selector = DynamicToolSelector()
+        config = InvestigationConfig(MAX_TOOLS_PER_ROUND=5, MAX_TOTAL_TOOLS=4)
+
+        state = InvestigationState()
+        state.start_new_round()
+        for _ in range(3):
+            state.record_tool_use()
+        state.start_new_round()
+
+        previous_results = {
+            "get_device_info": {"error": "Device not found"},
+            "get_access_codes": {"access_codes": [], "pagination": {"has_more": True}},
+        }
+
+        followup_tools = selector.select_followup_tools(
+            previous_results, state, config, make_parsed_query()
+        )
+
+        assert state.remaining_tools(config) == 1
+        assert len(followup_tools) == 1
+
     def test_stops_when_tool_budget_exhausted(self):
         """Test that selector stops when tool budget is exhausted."""
         selector = DynamicToolSelector()
@@ -391,7 +492,7 @@ class TestIntegrationWithInvestigationConfig:
         state.record_tool_use()  # Budget exhausted
 
         followup_tools = selector.select_followup_tools(
-            {}, state, config, MockParsedQuery()
+            {}, state, config, make_parsed_query()
         )
 
         assert len(followup_tools) == 0
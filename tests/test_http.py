@@ -0,0 +1,53 @@
+"""
+Tests for the shared HTTP client.
+"""
+
+import asyncio
+
+from seam_agent.connectors.http import (
+    aclose_http_client,
+    get_http_client,
+    get_request_slots,
+)
+
+
+def test_http_client_is_shared_per_event_loop():
+    """A client is reused on its loop but never handed to a later asyncio.run()."""
+
+    async def get_twice():
+        client = get_http_client()
+        assert get_http_client() is client
+        return client
+
+    first = asyncio.run(get_twice())
+    second = asyncio.run(get_twice())
+
+    assert first is not second
+    asyncio.run(first.aclose())
+    asyncio.run(second.aclose())
+
+
+def test_aclose_http_client_closes_the_loops_client():
+    async def open_and_close():
+        client = get_http_client()
+        await aclose_http_client()
+        return client
+
+    assert asyncio.run(open_and_close()).is_closed
+
+
+def test_request_slots_work_across_event_loops():
+    """A saturated semaphore from one asyncio.run() isn't reused by the next."""
+
+    async def burst():
+        async def hold():
+            async with get_request_slots("test", 1):
+                await asyncio.sleep(0)
+
+        await asyncio.gather(hold(), hold(), hold())
+        return get_request_slots("test", 1)
+
+    first = asyncio.run(burst())
+    second = asyncio.run(burst())
+
+    assert first is not second
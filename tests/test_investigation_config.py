@@ -51,6 +51,14 @@ class TestInvestigationConfig:
         assert config.MAX_TOOL_ROUNDS >= prod_config.MAX_TOOL_ROUNDS
         assert config.MAX_TOTAL_TOOLS >= prod_config.MAX_TOTAL_TOOLS
 
+    def test_presets_are_shared_and_immutable(self):
+        """Test preset configs are built once and cannot be modified."""
+        config = InvestigationConfig.create_production_config()
+
+        assert InvestigationConfig.create_production_config() is config
+        with pytest.raises(AttributeError):
+            config.MAX_TOOL_ROUNDS = 10  # type: ignore[misc]
+
     def test_pagination_limits(self):
         """Test pagination-related configuration."""
         config = InvestigationConfig()
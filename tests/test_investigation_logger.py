@@ -0,0 +1,36 @@
+"""
+Tests for the structured investigation logger.
+"""
+
+import json
+
+from seam_agent.assistant.investigation_logger import InvestigationLogger
+
+
+def test_silent_logger_still_records_entries():
+    """Silent only suppresses output; summaries and exports still see entries."""
+    logger = InvestigationLogger(output_format="silent")
+    logger.info("Investigation started")
+    logger.error("Tool failed")
+
+    assert logger.get_summary()["total_entries"] == 2
+    assert [entry["message"] for entry in json.loads(logger.export_json())] == [
+        "Investigation started",
+        "Tool failed",
+    ]
+
+
+def test_lazy_data_is_built_only_when_exported():
+    calls = []
+
+    def build_data():
+        calls.append(1)
+        return {"tool_name": "get_device_info"}
+
+    logger = InvestigationLogger(output_format="human")
+    logger.info("Executing tool", data=build_data)
+    assert calls == []
+
+    exported = json.loads(logger.export_json())
+    assert exported[0]["data"] == {"tool_name": "get_device_info"}
+    assert calls == [1]
@@ -9,9 +9,14 @@ import pytest
 import os
 from unittest.mock import patch, Mock, AsyncMock
 
+from anthropic.types import TextBlock
+
 from seam_agent.assistant.simple_investigator import SimpleInvestigator
 from seam_agent.assistant.investigation_config import InvestigationConfig
 from seam_agent.assistant.dynamic_tool_selector import DynamicToolSelector
+from seam_agent.assistant.query_parser import ParsedQuery
+
+from fakes import FakeResponse
 
 
 def test_dynamic_tool_selector_standalone():
@@ -128,7 +133,7 @@ async def test_investigator_with_mocked_dependencies():
         #     "seam_agent.assistant.simple_investigator.SeamAPIClient"
         # ) as mock_seam_class,
         patch(
-            "seam_agent.assistant.simple_investigator.AsyncAnthropic"
+            "seam_agent.assistant.simple_investigator.get_anthropic_client"
         ) as mock_anthropic_class,
         patch(
             "seam_agent.assistant.simple_investigator.SupportQueryParser"
@@ -149,28 +154,25 @@ async def test_investigator_with_mocked_dependencies():
         )
 
         # Mock parsed query
-        mock_parsed_query = Mock()
-        mock_parsed_query.question_type = "access_code"
-        mock_parsed_query.device_ids = ["device-123"]
-        mock_parsed_query.access_codes = ["code-456"]
-        mock_parsed_query.confidence = 0.9
-        mock_parsed_query.__dict__ = {
-            "question_type": "access_code",
-            "device_ids": ["device-123"],
-            "access_codes": ["code-456"],
-            "confidence": 0.9,
-        }
-
-        mock_parser.parse.return_value = mock_parsed_query
+        mock_parsed_query = ParsedQuery(
+            question_type="access_code",
+            device_ids=["device-123"],
+            access_codes=["code-456"],
+            confidence=0.9,
+            summary="Access code issue with device",
+        )
+
+        mock_parser.parse = AsyncMock(return_value=mock_parsed_query)
 
         # Mock Anthropic response (no tools called)
-        mock_response = Mock()
-        mock_response.content = [
-            Mock(
-                type="text",
-                text="Based on the access code issue, I recommend checking the device status and access code history.",
-            )
-        ]
+        mock_response = FakeResponse(
+            content=[
+                TextBlock(
+                    type="text",
+                    text="Based on the access code issue, I recommend checking the device status and access code history.",
+                )
+            ]
+        )
         mock_anthropic.messages.create.return_value = mock_response
 
         # Run investigation
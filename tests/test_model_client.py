@@ -0,0 +1,26 @@
+"""
+Tests for the unified model client's message conversion.
+"""
+
+from seam_agent.assistant.model_client import ModelClient
+
+
+def test_system_messages_are_kept_from_any_position():
+    client = ModelClient("anthropic", api_key="test-key")
+
+    converted = client._convert_messages_to_anthropic(
+        [
+            {"role": "system", "content": "Be brief."},
+            {"role": "user", "content": "Hi"},
+            {"role": "system", "content": "Answer in JSON."},
+            {"role": "tool", "content": "ok"},
+        ]
+    )
+
+    assert converted == [
+        {
+            "role": "user",
+            "content": "System: Be brief.\n\nAnswer in JSON.\n\nUser: Hi",
+        },
+        {"role": "user", "content": "Tool result: ok"},
+    ]
@@ -0,0 +1,29 @@
+"""
+Tests for the support query parser.
+"""
+
+import httpx
+import openai
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from seam_agent.assistant.query_parser import SupportQueryParser
+
+
+@pytest.mark.asyncio
+async def test_parse_falls_back_once_retries_are_exhausted():
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    parser = SupportQueryParser(api_key="test-key")
+    parser.clear_cache()
+    create = AsyncMock(side_effect=openai.APIConnectionError(request=request))
+
+    with (
+        patch.object(parser.client.chat.completions, "create", create),
+        patch("seam_agent.assistant.retry.asyncio.sleep"),
+    ):
+        parsed = await parser.parse("Lock is offline")
+
+    assert create.await_count == 4
+    assert parsed.question_type == "troubleshooting"
+    assert parsed.confidence == 0.1
+    assert parsed.summary.startswith("Failed to parse query")
@@ -0,0 +1,73 @@
+"""
+Tests for the transient-failure retry helper.
+"""
+
+import anthropic
+import httpx
+import openai
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from seam_agent.assistant.retry import retry_transient
+
+
+def _connection_error() -> openai.APIConnectionError:
+    return openai.APIConnectionError(
+        request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    )
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors_until_success():
+    call = AsyncMock(side_effect=[_connection_error(), _connection_error(), "ok"])
+
+    with patch("seam_agent.assistant.retry.asyncio.sleep") as sleep:
+        result = await retry_transient(call, attempts=4)
+
+    assert result == "ok"
+    assert call.await_count == 3
+    assert sleep.await_count == 2
+
+
+def _anthropic_status_error(status_code: int) -> anthropic.APIStatusError:
+    """Build the error the Anthropic SDK raises for a response status."""
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    client = anthropic.AsyncAnthropic(api_key="test-key")
+    return client._make_status_error(
+        "error", body=None, response=httpx.Response(status_code, request=request)
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code", [500, 529])
+async def test_retries_server_errors(status_code):
+    call = AsyncMock(side_effect=[_anthropic_status_error(status_code), "ok"])
+
+    with patch("seam_agent.assistant.retry.asyncio.sleep") as sleep:
+        result = await retry_transient(call)
+
+    assert result == "ok"
+    assert sleep.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_raises_last_error_when_attempts_exhausted():
+    call = AsyncMock(side_effect=_connection_error())
+
+    with patch("seam_agent.assistant.retry.asyncio.sleep"):
+        with pytest.raises(openai.APIConnectionError):
+            await retry_transient(call, attempts=3)
+
+    assert call.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_non_transient_errors_are_not_retried():
+    call = AsyncMock(side_effect=ValueError("bad request"))
+
+    with patch("seam_agent.assistant.retry.asyncio.sleep") as sleep:
+        with pytest.raises(ValueError):
+            await retry_transient(call)
+
+    assert call.await_count == 1
+    sleep.assert_not_awaited()
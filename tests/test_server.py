@@ -0,0 +1,144 @@
+"""
+Tests for the MCP server's registered tools and resources.
+"""
+
+import httpx
+import inspect
+import orjson
+import os
+import pytest
+from typing import Any, Callable
+from unittest.mock import AsyncMock, patch
+
+from fastmcp.resources import FunctionResource
+from fastmcp.resources.template import FunctionResourceTemplate
+from fastmcp.tools.tool import FunctionTool
+
+os.environ.setdefault("SEAM_API_KEY", "test-seam-key")
+
+from seam_agent.assistant import server  # noqa: E402
+from seam_agent.connectors import quickwit, seam_api  # noqa: E402
+from seam_agent.assistant.server import mcp  # noqa: E402
+
+
+async def _tool_fn(name: str) -> Callable[..., Any]:
+    """Return the function behind an MCP tool, to call it directly."""
+    tool = await mcp.get_tool(name)
+    assert isinstance(tool, FunctionTool)
+    return tool.fn
+
+
+@pytest.mark.asyncio
+async def test_all_handlers_are_async():
+    """Sync handlers would run inline on the event loop and block other calls."""
+    tools = await mcp.get_tools()
+    templates = await mcp.get_resource_templates()
+    resources = await mcp.get_resources()
+
+    handlers = []
+    for component in (*tools.values(), *templates.values(), *resources.values()):
+        assert isinstance(
+            component, (FunctionTool, FunctionResourceTemplate, FunctionResource)
+        )
+        handlers.append(component.fn)
+
+    assert handlers
+    for handler in handlers:
+        assert inspect.iscoroutinefunction(handler), handler.__name__
+
+
+@pytest.mark.asyncio
+async def test_database_schema_is_cached():
+    db_client = AsyncMock()
+    db_client.execute_safe_query.return_value = []
+    tool_fn = await _tool_fn("get_database_schema")
+
+    with (
+        patch.object(server, "DATABASE_URL", "postgresql://localhost/seam"),
+        patch.object(server, "_db_client", db_client),
+    ):
+        server._schema_cache.clear()
+        first = await tool_fn()
+        second = await tool_fn()
+
+    assert first == second
+    assert first.startswith("# Live Database Schema")
+    assert db_client.execute_safe_query.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_find_device_action_attempts_only_fetches_summaries():
+    full = {
+        "action_attempt_id": "aa_1",
+        "action_type": "UNLOCK_DOOR",
+        "status": "success",
+        "result": {},
+        "error": None,
+    }
+    summary = {"action_attempt_id": "aa_2"}
+    detailed = {**full, "action_attempt_id": "aa_2", "status": "error"}
+
+    seam_client = AsyncMock()
+    seam_client.list_action_attempts.return_value = [detailed]
+    find_resources = AsyncMock(return_value={"action_attempts": [full, summary]})
+    tool_fn = await _tool_fn("find_device_action_attempts")
+
+    with (
+        patch.object(server, "_seam_client", seam_client),
+        patch.object(server, "_find_resources", find_resources),
+    ):
+        attempts = await tool_fn("device_1")
+
+    assert attempts == [full, detailed]
+    seam_client.list_action_attempts.assert_awaited_once_with(["aa_2"])
+
+
+@pytest.mark.asyncio
+async def test_search_logs_pages_with_quickwit_sort_values():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(orjson.loads(request.content))
+        hits = [
+            {"_source": {"message": "a"}, "sort": [1721855877659, 7]},
+            {"_source": {"message": "b"}, "sort": [1721855877659, 3]},
+        ]
+        return httpx.Response(200, json={"hits": {"hits": hits}})
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    tool_fn = await _tool_fn("search_logs")
+
+    with (
+        patch.object(quickwit, "get_http_client", return_value=http_client),
+        patch.object(server, "_quickwit_client", quickwit.QuickwitClient("http://qw")),
+    ):
+        result = await tool_fn(
+            "level:ERROR", limit=2, search_after="[1721855877700, 1]"
+        )
+        empty = await tool_fn("level:ERROR", limit=0)
+
+    assert [log["message"] for log in result["logs"]] == ["a", "b"]
+    assert result["next_search_after"] == "[1721855877659,3]"
+    assert requests[0]["search_after"] == [1721855877700, 1]
+    assert empty == {"logs": [], "next_search_after": None}
+
+
+@pytest.mark.asyncio
+async def test_cached_device_is_not_shared_with_callers():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        device = {"device_id": "d1", "properties": {"online": True}}
+        return httpx.Response(200, json={"device": device}, headers={"ETag": '"v1"'})
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = seam_api.SeamAPIClient(api_key="test-etag-key")
+
+    with patch.object(seam_api, "get_http_client", return_value=http_client):
+        first = await client.get_device(device_id="d1")
+        first["properties"]["online"] = False
+        second = await client.get_device(device_id="d1")
+        second["properties"]["online"] = False
+        third = await client.get_device(device_id="d1")
+
+    assert third["properties"]["online"] is True